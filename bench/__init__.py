@@ -0,0 +1,11 @@
+# Benchmarks del lexer y del parser. Se ejecutan desde la raíz del repositorio:
+#   python -m bench.suite         suite completa con líneas base JSON
+#   python -m bench.corpus        generador de corpus sintéticos
+#   python -m bench.tokenizer     tokenizador compilado vs. original
+#   python -m bench.engines       todos los motores de análisis (ENGINES)
+#   python -m bench.errors        camino de error (modo pánico)
+#   python -m bench.compiled      motor compiled vs. rd (diferencial y velocidad)
+#   python -m bench.precheck      lotes con prefiltro vectorizado vs. oración a oración
+#   python -m bench.ambiguity     motor ambig vs. rd con palabras ambiguas
+#   python -m bench.incremental   edición con IncrementalDocument vs. análisis completo
+#   python -m bench.loadtest      cliente de carga para src.en_server
@@ -0,0 +1,122 @@
+# bench/ambiguity.py
+# Coste del análisis con palabras ambiguas (engine "ambig") frente al parser
+# de una sola lectura (engine "rd") sobre dos corpus:
+#   sin ambigüedad  corpus 'mixed' de bench.corpus con el léxico normal.
+#   ambiguo         el mismo generador con un léxico en el que cada verbo
+#                   también es sustantivo ("run" N/SGC, "runs" N/PL), y
+#                   oraciones que usan esas palabras como sustantivo.
+# y la escala con el número de tokens ambiguos en una cadena de PP
+# ("the boy in work in work ... runs"): tanto la búsqueda memoizada como la
+# enumeración de todas las combinaciones válidas (analyses) crecen de forma
+# lineal, aunque haya 2 ** k combinaciones posibles.
+#   python -m bench.ambiguity [-n LÍNEAS] [-r RONDAS]
+import argparse
+import os
+import tempfile
+import time
+from bench.corpus import CorpusGenerator
+from src import en_lexicon
+from src.en_lexfile import index_path
+from src.en_lexicon import LexicalError, tokenize_columns
+from src.en_ambig import AmbiguousEnParser, analyses
+from src.en_parser import get_parser_class
+
+def ambiguous_lexicon(path: str) -> list:
+    """
+    Escribe en 'path' el léxico activo más una lectura N para cada verbo y
+    devuelve las lecturas añadidas como (palabra, cat, num).
+    """
+    with open(en_lexicon.LEXICON.path, encoding="utf-8") as f:
+        text = f.read()
+    extra = []
+    for word in en_lexicon.LEXICON:
+        for cat, num in en_lexicon.LEXICON.readings(word):
+            if cat == "V" and "N" not in (c for c, _ in en_lexicon.LEXICON.readings(word)):
+                extra.append((word, "N", "SGC" if num == "PL" else "PL"))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+        f.write("\n# Lecturas N añadidas por bench.ambiguity\n")
+        f.writelines(f"{w} {c} {n}\n" for w, c, n in extra)
+    return extra
+
+def make_corpus(n: int, seed: int, extra=()) -> list:
+    gen = CorpusGenerator(seed)
+    for word, cat, num in extra:
+        gen.words.setdefault((cat, num), []).append(word)
+    return [gen.mixed() for _ in range(n)]
+
+def tokenize_all(lines):
+    docs = []
+    for line in lines:
+        try:
+            docs.append(tokenize_columns(line))
+        except LexicalError:
+            pass
+    return docs
+
+def time_engine(engine, docs, rounds: int):
+    """Mejor tiempo de 'rounds' pasadas y número de documentos válidos."""
+    parser_class = get_parser_class(engine)
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        ok = sum(parser_class(cols).parse_panic_mode().ok for cols in docs)
+        best = min(best, time.perf_counter() - start)
+    return best, ok
+
+def report(name, docs, rounds):
+    n_tokens = sum(len(d) for d in docs)
+    n_amb = sum(len(d.alts) for d in docs)
+    print(f"{name}: {len(docs)} líneas, {n_tokens} tokens, {n_amb} tokens ambiguos")
+    base = None
+    for engine in ("rd", "ambig"):
+        elapsed, ok = time_engine(engine, docs, rounds)
+        base = base or elapsed
+        print(f"  {engine:<6} {n_tokens / elapsed:>12,.0f} tokens/s  x{base / elapsed:.2f}  "
+              f"válidas: {ok}")
+
+def pp_chain(k: int) -> str:
+    return "the boy " + "in work " * k + "runs"
+
+def report_scaling():
+    print("escala con k palabras ambiguas en una cadena de PP:")
+    for k in (10, 100, 1000, 10000):
+        cols = tokenize_columns(pp_chain(k))
+        start = time.perf_counter()
+        assert AmbiguousEnParser(cols).parse_panic_mode().ok
+        elapsed = time.perf_counter() - start
+        print(f"  k={k:<6} memoizado {elapsed * 1e3:>9.2f} ms  "
+              f"{elapsed / len(cols) * 1e6:>6.2f} us/token")
+    for k in (10, 100, 1000):
+        parser = AmbiguousEnParser(tokenize_columns(pp_chain(k)))
+        start = time.perf_counter()
+        found = sum(1 for _ in analyses(parser.segment_readings(0, len(parser.tokens))))
+        elapsed = time.perf_counter() - start
+        print(f"  k={k:<6} todas     {elapsed * 1e3:>9.2f} ms  (2**{k} combinaciones, "
+              f"{found} válida{'s' if found != 1 else ''})")
+
+def main():
+    ap = argparse.ArgumentParser(prog="python -m bench.ambiguity")
+    ap.add_argument("-n", type=int, default=5000, help="Líneas por corpus")
+    ap.add_argument("-r", "--rounds", type=int, default=3, help="Rondas; se informa la mejor")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    report("sin ambigüedad", tokenize_all(make_corpus(args.n, args.seed)), args.rounds)
+    report_scaling()
+
+    fd, path = tempfile.mkstemp(suffix=".lex")
+    os.close(fd)
+    try:
+        extra = ambiguous_lexicon(path)
+        en_lexicon.use_lexicon(path)
+        docs = tokenize_all(make_corpus(args.n, args.seed, extra))
+        report("ambiguo", docs, args.rounds)
+    finally:
+        en_lexicon.use_lexicon(en_lexicon.DEFAULT_LEXICON_PATH)
+        for p in (path, index_path(path)):
+            if os.path.exists(p):
+                os.unlink(p)
+
+if __name__ == "__main__":
+    main()
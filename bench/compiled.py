@@ -0,0 +1,80 @@
+# bench/compiled.py
+# Motor "compiled" (src.en_codegen) frente a RDEnParser:
+#   - comprobación diferencial: resultados idénticos, con y sin ok_only, sobre
+#     los corpus de bench.corpus, sopas aleatorias de palabras del léxico (con
+#     comas y palabras desconocidas) y todas las secuencias cortas de una
+#     palabra por categoría y número;
+#   - velocidad del análisis (sin tokenizar) sobre cada tipo de corpus.
+#   python -m bench.compiled [-n LÍNEAS] [--soup N]
+import argparse
+import itertools
+import random
+import time
+from bench.corpus import KINDS, generate
+from src import en_lexicon
+from src.en_lexicon import tokenize_columns
+from src.en_parser import RDEnParser, get_parser_class
+
+def soups(n: int, seed: int) -> list[str]:
+    """Líneas de 1 a 12 palabras al azar del léxico, comas y alguna palabra desconocida."""
+    rng = random.Random(seed)
+    words = sorted(en_lexicon.LEXICON) + [",", ",", "xyzzy", "booy"]
+    return [" ".join(rng.choice(words) for _ in range(rng.randint(1, 12))) for _ in range(n)]
+
+def shapes(length: int) -> list[str]:
+    """Todas las secuencias de hasta 'length' palabras con una palabra por (cat, num)."""
+    reps = {}
+    for word in sorted(en_lexicon.LEXICON):
+        reps.setdefault(en_lexicon.LEXICON[word], word)
+    words = sorted(reps.values()) + [","]
+    return [" ".join(seq) for k in range(1, length + 1)
+            for seq in itertools.product(words, repeat=k)]
+
+def differential(lines: list[str], compiled) -> int:
+    """Número de líneas en las que el motor compilado difiere de RDEnParser."""
+    bad = 0
+    for line in lines:
+        cols = tokenize_columns(line, strict=False)
+        for ok_only in (False, True):
+            expected = RDEnParser(cols).parse_panic_mode(ok_only)
+            result = compiled(cols).parse_panic_mode(ok_only)
+            if result != expected:
+                bad += 1
+                if bad <= 5:
+                    print(f"  DIFERENCIA {line!r} ok_only={ok_only}\n"
+                          f"    rd:       {expected}\n    compiled: {result}")
+    return bad
+
+def main():
+    ap = argparse.ArgumentParser(prog="python -m bench.compiled")
+    ap.add_argument("-n", type=int, default=20000, help="Líneas por tipo de corpus")
+    ap.add_argument("--soup", type=int, default=50000, help="Líneas aleatorias de la prueba diferencial")
+    ap.add_argument("--shapes", type=int, default=3, help="Longitud máxima de las secuencias exhaustivas")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+    compiled = get_parser_class("compiled")
+
+    checks = {
+        "corpus": list(generate(args.n // 10, list(KINDS), args.seed)),
+        "aleatorias": soups(args.soup, args.seed),
+        "exhaustivas": shapes(args.shapes),
+    }
+    for name, lines in checks.items():
+        bad = differential(lines, compiled)
+        print(f"{name:<12} {len(lines):>8} líneas  {bad} diferencias")
+        assert bad == 0
+
+    print(f"{'corpus':<12} {'rd':>14} {'compiled':>14}")
+    for kind in KINDS:
+        docs = [tokenize_columns(s) for s in generate(args.n, [kind], args.seed)]
+        times = []
+        for parser_class in (RDEnParser, compiled):
+            start = time.perf_counter()
+            for cols in docs:
+                parser_class(cols).parse_panic_mode()
+            times.append(time.perf_counter() - start)
+        print(f"{kind:<12} " + " ".join(f"{len(docs) / t:>10,.0f} l/s" for t in times)
+              + f"  x{times[0] / times[1]:.2f}")
+
+if __name__ == "__main__":
+    main()
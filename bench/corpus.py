@@ -0,0 +1,150 @@
+# bench/corpus.py
+# Generador de corpus sintéticos a partir de LEXICON y de la gramática de
+# src/en_parser.py. Cada línea es una entrada para run_en.
+#   python -m bench.corpus -n 100000 --kinds valid,agreement -o corpus.txt
+import argparse
+import random
+import sys
+from typing import Dict, Iterator, List, Sequence, Tuple
+from src.en_lexicon import LEXICON
+
+class CorpusGenerator:
+    """
+    Produce oraciones según la gramática:
+      valid        S -> NP VP correctas (con AdjList, PPList, AuxList y objeto).
+      agreement    errores de concordancia DET-N, Sujeto-Verbo o 'Bare Noun'.
+      deep_pp      NP con cadenas largas de PP ("the boy in the city near ...").
+      comma_chain  muchas oraciones válidas separadas por comas en una línea.
+      mixed        una mezcla de todo lo anterior.
+    La generación es determinista para una misma semilla.
+    """
+
+    def __init__(self, seed: int = 0, lexicon: Dict[str, Tuple[str, str]] = LEXICON,
+                 max_pp: int = 2, deep_pp: int = 200, chain: int = 50):
+        self.rng = random.Random(seed)
+        self.max_pp = max_pp
+        self.deep_pp_len = deep_pp
+        self.chain_len = chain
+        self.words: Dict[Tuple[str, str], List[str]] = {}
+        for word, (cat, num) in lexicon.items():
+            self.words.setdefault((cat, num), []).append(word)
+        for bucket in self.words.values():
+            bucket.sort()  # Orden estable, independiente del orden del diccionario
+
+    def pick(self, cat: str, *nums: str) -> str:
+        choices = [w for n in nums for w in self.words.get((cat, n), ())]
+        return self.rng.choice(choices)
+
+    # PIEZAS DE LA GRAMÁTICA
+
+    def noun_phrase(self, pp: int = None) -> Tuple[List[str], str]:
+        """NP válido y su número efectivo (SG/PL)."""
+        rng = self.rng
+        r = rng.random()
+        if r < 0.25:
+            num = rng.choice(("SG", "PL"))
+            return [self.pick("PRON", num)], num
+        if r < 0.75:
+            noun_num = rng.choice(("SGC", "PL", "UNC", "COLL", "SGC"))
+            num = "PL" if noun_num == "PL" else "SG"
+            words = [self.pick("DET", "ANY", num)]
+            words += [self.pick("ADJ", "ANY") for _ in range(rng.randint(0, 2))]
+            words.append(self.pick("N", noun_num))
+        else:
+            noun_num = rng.choice(("PL", "UNC", "COLL"))
+            num = "PL" if noun_num == "PL" else "SG"
+            words = [self.pick("N", noun_num)]
+        words += self.pp_list(rng.randint(0, self.max_pp) if pp is None else pp)
+        return words, num
+
+    def pp_list(self, n: int) -> List[str]:
+        words = []
+        for _ in range(n):
+            words.append(self.pick("PREP", "ANY"))
+            words += self.noun_phrase(pp=0)[0]
+        return words
+
+    def verb_phrase(self, subj_num: str) -> List[str]:
+        rng = self.rng
+        words = [self.pick("AUX", "ANY") for _ in range(rng.randint(0, 1))]
+        words.append(self.pick("V", subj_num))
+        if rng.random() < 0.5:
+            words += self.noun_phrase()[0]
+        return words
+
+    # TIPOS DE ORACIÓN
+
+    def valid(self) -> str:
+        subj, num = self.noun_phrase()
+        return " ".join(subj + self.verb_phrase(num))
+
+    def agreement(self) -> str:
+        """Una oración con exactamente un error semántico."""
+        rng = self.rng
+        kind = rng.randrange(3)
+        if kind == 0:
+            # DET-N: determinante singular con sustantivo plural o al revés
+            if rng.random() < 0.5:
+                subj, num = [self.pick("DET", "SG"), self.pick("N", "PL")], "PL"
+            else:
+                subj, num = [self.pick("DET", "PL"), self.pick("N", "SGC")], "SG"
+            return " ".join(subj + self.verb_phrase(num))
+        if kind == 1:
+            # Sujeto-Verbo
+            subj, num = self.noun_phrase()
+            return " ".join(subj + [self.pick("V", "PL" if num == "SG" else "SG")])
+        # 'Bare Noun' con un sustantivo singular contable
+        return " ".join([self.pick("N", "SGC"), self.pick("V", "SG")])
+
+    def deep_pp(self) -> str:
+        subj = [self.pick("DET", "ANY"), self.pick("N", "SGC")] + self.pp_list(self.deep_pp_len)
+        return " ".join(subj + [self.pick("V", "SG")])
+
+    def comma_chain(self) -> str:
+        return " , ".join(self.valid() for _ in range(self.chain_len))
+
+    def mixed(self) -> str:
+        r = self.rng.random()
+        if r < 0.6:
+            return self.valid()
+        if r < 0.9:
+            return self.agreement()
+        if r < 0.95:
+            return self.comma_chain()
+        return self.deep_pp()
+
+KINDS = ("valid", "agreement", "deep_pp", "comma_chain", "mixed")
+
+def generate(n: int, kinds: Sequence[str] = ("mixed",), seed: int = 0, **options) -> Iterator[str]:
+    """Genera n líneas alternando los tipos indicados."""
+    gen = CorpusGenerator(seed, **options)
+    makers = [getattr(gen, k) for k in kinds]
+    for k in range(n):
+        yield makers[k % len(makers)]()
+
+def main():
+    ap = argparse.ArgumentParser(prog="python -m bench.corpus")
+    ap.add_argument("-n", type=int, default=10000, help="Número de líneas")
+    ap.add_argument("--kinds", default="mixed",
+                    help=f"Tipos separados por comas: {', '.join(KINDS)}")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--deep-pp", type=int, default=200, help="PP por oración en deep_pp")
+    ap.add_argument("--chain", type=int, default=50, help="Oraciones por línea en comma_chain")
+    ap.add_argument("-o", "--output", help="Archivo de salida (por defecto stdout)")
+    args = ap.parse_args()
+
+    kinds = args.kinds.split(",")
+    unknown = set(kinds) - set(KINDS)
+    if unknown:
+        ap.error(f"tipos desconocidos: {', '.join(sorted(unknown))}")
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for line in generate(args.n, kinds, args.seed, deep_pp=args.deep_pp, chain=args.chain):
+            out.write(line + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+if __name__ == "__main__":
+    main()
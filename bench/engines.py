@@ -0,0 +1,42 @@
+# bench/engines.py
+# Compara los motores de análisis (ENGINES) sobre test/*.txt repetido N veces.
+#   python -m bench.engines [-n REPETICIONES]
+import argparse
+import time
+from bench.tokenizer import load_sentences
+from src.en_lexicon import tokenize_columns
+from src.en_parser import ENGINES, get_parser_class
+
+def time_engine(engine, docs) -> float:
+    """Tiempo de análisis (sin tokenizar) de una lista de TokenColumns."""
+    parser_class = get_parser_class(engine)
+    start = time.perf_counter()
+    for cols in docs:
+        parser_class(cols).parse_panic_mode()
+    return time.perf_counter() - start
+
+def main():
+    ap = argparse.ArgumentParser(prog="python -m bench.engines")
+    ap.add_argument("-n", "--repeat", type=int, default=1000,
+                    help="Veces que se repite el corpus de test/*.txt")
+    args = ap.parse_args()
+
+    sentences = load_sentences()
+    docs = [tokenize_columns(s) for s in sentences] * args.repeat
+    n_tokens = sum(len(d) for d in docs)
+
+    # Todos los motores deben producir exactamente el mismo resultado
+    for cols in docs[:len(sentences)]:
+        results = [get_parser_class(e)(cols).parse_panic_mode() for e in ENGINES]
+        assert all(r == results[0] for r in results), results
+
+    print(f"{len(docs)} oraciones, {n_tokens} tokens")
+    base = None
+    for engine in ENGINES:
+        elapsed = time_engine(engine, docs)
+        base = base or elapsed
+        print(f"{engine:<8} {len(docs) / elapsed:>10,.0f} oraciones/s "
+              f"{n_tokens / elapsed:>12,.0f} tokens/s  x{base / elapsed:.2f}")
+
+if __name__ == "__main__":
+    main()
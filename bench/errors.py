@@ -0,0 +1,36 @@
+# bench/errors.py
+# Rendimiento del camino de error: oraciones de test/invalid.txt, sueltas y
+# encadenadas por comas en un único documento (modo pánico + sincronización).
+#   python -m bench.errors [-n REPETICIONES]
+import argparse
+import time
+from bench.tokenizer import load_sentences
+from src.en_lexicon import tokenize_columns
+from src.en_parser import RDEnParser
+
+def time_parse(docs) -> float:
+    start = time.perf_counter()
+    for cols in docs:
+        RDEnParser(cols).parse_panic_mode()
+    return time.perf_counter() - start
+
+def main():
+    ap = argparse.ArgumentParser(prog="python -m bench.errors")
+    ap.add_argument("-n", "--repeat", type=int, default=2000,
+                    help="Veces que se repite el corpus de test/invalid.txt")
+    ap.add_argument("-r", "--rounds", type=int, default=5,
+                    help="Rondas por caso; se informa la mejor")
+    args = ap.parse_args()
+
+    invalid = load_sentences(("test/invalid.txt",))
+    cases = (
+        ("oraciones", [tokenize_columns(s) for s in invalid] * args.repeat),
+        ("documento", [tokenize_columns(" , ".join(invalid * args.repeat))]),
+    )
+    n_sents = len(invalid) * args.repeat
+    for name, docs in cases:
+        elapsed = min(time_parse(docs) for _ in range(args.rounds))
+        print(f"{name:<10} {n_sents / elapsed:>10,.0f} oraciones inválidas/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+# bench/incremental.py
+# Latencia de una edición con IncrementalDocument frente a volver a analizar
+# el documento completo, para documentos de una línea con cada vez más
+# oraciones. La edición (añadir y quitar una letra en medio del texto) solo
+# re-analiza un segmento, así que su coste no debe crecer con el documento,
+# tampoco con errores (los diagnósticos se desplazan al leerlos).
+#   python -m bench.incremental [--kinds valid] [-e EDICIONES]
+import argparse
+import time
+from bench.corpus import KINDS, generate
+from src.en_incremental import IncrementalDocument
+from src.en_parser import analyze_en_sentence
+
+def main():
+    ap = argparse.ArgumentParser(prog="python -m bench.incremental")
+    ap.add_argument("--kinds", default="valid", help=f"Tipos de corpus: {', '.join(KINDS)}")
+    ap.add_argument("-e", "--edits", type=int, default=100, help="Ediciones por tamaño")
+    ap.add_argument("--engine", default="rd")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    for n in (100, 1000, 10000, 100000):
+        text = " , ".join(generate(n, args.kinds.split(","), args.seed))
+        start = time.perf_counter()
+        expected = analyze_en_sentence(text, args.engine)
+        full = time.perf_counter() - start
+
+        doc = IncrementalDocument(text, args.engine)
+        mid = len(text) // 2
+        start = time.perf_counter()
+        for _ in range(args.edits // 2):
+            doc.insert(mid, "s")
+            doc.delete(mid, mid + 1)
+        edit = (time.perf_counter() - start) / (args.edits // 2 * 2)
+        assert doc.result() == expected
+        print(f"{n:>7} oraciones  completo {full * 1e3:>9.2f} ms  "
+              f"edición {edit * 1e3:>7.3f} ms  x{full / edit:,.0f}")
+
+if __name__ == "__main__":
+    main()
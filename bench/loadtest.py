@@ -0,0 +1,71 @@
+# bench/loadtest.py
+# Cliente de carga para src/en_server.py: abre varias conexiones, envía
+# peticiones en pipeline (hasta --window sin respuesta por conexión) y mide
+# peticiones/s y latencias.
+#   python -m src.en_server --port 8765 &
+#   python -m bench.loadtest --port 8765 -n 20000 -c 8 --window 32
+import argparse
+import asyncio
+import json
+import time
+from typing import List, Sequence
+from bench.corpus import KINDS, generate
+from bench.suite import percentile
+
+async def run_connection(lines: Sequence[str], connect, window: int, latencies: List[int]):
+    reader, writer = await connect()
+    clock = time.perf_counter_ns
+    sent_at = {}
+    slots = asyncio.Semaphore(window)
+
+    async def receive():
+        for _ in range(len(lines)):
+            resp = json.loads(await reader.readline())
+            latencies.append(clock() - sent_at.pop(resp["id"]))
+            slots.release()
+
+    receiver = asyncio.create_task(receive())
+    for rid, line in enumerate(lines):
+        await slots.acquire()
+        sent_at[rid] = clock()
+        writer.write(json.dumps({"id": rid, "sentence": line}).encode("utf-8") + b"\n")
+        await writer.drain()
+    await receiver
+    writer.close()
+    await writer.wait_closed()
+
+async def run_load(lines: List[str], connect, connections: int, window: int):
+    latencies: List[int] = []
+    parts = [lines[k::connections] for k in range(connections)]
+    start = time.perf_counter()
+    await asyncio.gather(*(run_connection(p, connect, window, latencies) for p in parts if p))
+    return time.perf_counter() - start, sorted(latencies)
+
+def main():
+    ap = argparse.ArgumentParser(prog="python -m bench.loadtest")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--unix", metavar="RUTA", help="Conectar a un socket Unix")
+    ap.add_argument("-n", type=int, default=20000, help="Peticiones en total")
+    ap.add_argument("-c", "--connections", type=int, default=8)
+    ap.add_argument("--window", type=int, default=32,
+                    help="Peticiones sin respuesta por conexión (1 = sin pipelining)")
+    ap.add_argument("--kinds", default="valid,agreement", help=f"Tipos de corpus: {', '.join(KINDS)}")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    if args.unix:
+        connect = lambda: asyncio.open_unix_connection(args.unix, limit=1 << 20)
+    else:
+        connect = lambda: asyncio.open_connection(args.host, args.port, limit=1 << 20)
+    lines = list(generate(args.n, args.kinds.split(","), args.seed))
+    elapsed, latencies = asyncio.run(run_load(lines, connect, args.connections, args.window))
+
+    print(f"{len(latencies)} peticiones en {elapsed:.2f}s "
+          f"({args.connections} conexiones, ventana {args.window})")
+    print(f"  {len(latencies) / elapsed:,.0f} peticiones/s")
+    for q in (50, 90, 99):
+        print(f"  p{q}: {percentile(latencies, q) / 1e6:.2f} ms")
+
+if __name__ == "__main__":
+    main()
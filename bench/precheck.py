@@ -0,0 +1,40 @@
+# bench/precheck.py
+# Análisis oración a oración (analyze_en_sentence) frente a lotes con el
+# prefiltro vectorizado (src.en_precheck.analyze_batch), con varios tamaños
+# de lote. Comprueba además que los resultados sean idénticos.
+#   python -m bench.precheck [-n LÍNEAS] [--kinds mixed]
+import argparse
+import time
+from bench.corpus import KINDS, generate
+from src.en_parser import analyze_en_sentence
+from src.en_precheck import HAVE_NUMPY, analyze_batch
+
+def main():
+    ap = argparse.ArgumentParser(prog="python -m bench.precheck")
+    ap.add_argument("-n", type=int, default=50000, help="Líneas del corpus")
+    ap.add_argument("--kinds", default="mixed", help=f"Tipos de corpus: {', '.join(KINDS)}")
+    ap.add_argument("--engine", default="rd")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+    if not HAVE_NUMPY:
+        print("NumPy no está instalado: analyze_batch analiza oración a oración.")
+
+    lines = list(generate(args.n, args.kinds.split(","), args.seed))
+    start = time.perf_counter()
+    expected = [analyze_en_sentence(s, args.engine) for s in lines]
+    base = time.perf_counter() - start
+    print(f"{len(lines)} líneas, {sum(not r.ok for r in expected)} con errores")
+    print(f"  {'oración a oración':<18} {len(lines) / base:>10,.0f} líneas/s")
+
+    for batch in (64, 256, 1024, 4096):
+        start = time.perf_counter()
+        results = []
+        for k in range(0, len(lines), batch):
+            results += analyze_batch(lines[k:k + batch], args.engine)
+        elapsed = time.perf_counter() - start
+        assert results == expected
+        print(f"  {f'lotes de {batch}':<18} {len(lines) / elapsed:>10,.0f} líneas/s  "
+              f"x{base / elapsed:.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+# bench/suite.py
+# Suite de rendimiento: mide por separado el tokenizador, el parser y el camino
+# completo de run_en sobre un corpus sintético (bench.corpus), y guarda o
+# compara resultados en JSON para detectar regresiones.
+#   python -m bench.suite -n 20000 --kinds mixed --save baseline.json
+#   python -m bench.suite -n 20000 --kinds mixed --compare baseline.json
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Sequence
+from bench.corpus import KINDS, generate
+from src.en_lexicon import LexicalError, tokenize_columns, tokenize_sentence
+from src.en_parser import ENGINES, get_parser_class
+from src import run_en
+
+# Métricas en las que un valor menor es una mejora
+LOWER_IS_BETTER = ("p50_us", "p90_us", "p99_us", "peak_kib")
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, int(round(q / 100 * (len(sorted_values) - 1))))
+    return sorted_values[k]
+
+def peak_memory_kib(fn: Callable[[], None]) -> float:
+    """Pico de memoria asignada (tracemalloc) durante fn, en KiB."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+def measure(items: List, call: Callable, n_sentences: int, n_tokens: int,
+            rounds: int = 5) -> Dict[str, float]:
+    """
+    Tiempo total, latencias por elemento y pico de memoria de call(item).
+    Tras una pasada de calentamiento se hacen 'rounds' pasadas y se informa
+    la de menor tiempo total, con sus propias latencias: los percentiles
+    salen de una pasada real, con el recolector de basura activo, así que
+    conservan la cola. Antes de cada pasada se recoge la basura para que
+    todas partan del mismo estado, sea cual sea lo que dejaron las etapas
+    anteriores. Una sola pasada varía demasiado para compararla con una
+    línea base.
+    """
+    clock = time.perf_counter_ns
+
+    def run_all():
+        for item in items:
+            call(item)
+
+    run_all()
+    elapsed = float("inf")
+    latencies = []
+    for _ in range(max(rounds, 1)):
+        gc.collect()
+        round_latencies = []
+        start = time.perf_counter()
+        for item in items:
+            t0 = clock()
+            call(item)
+            round_latencies.append(clock() - t0)
+        round_elapsed = time.perf_counter() - start
+        if round_elapsed < elapsed:
+            elapsed, latencies = round_elapsed, round_latencies
+    latencies.sort()
+
+    return {
+        "sentences_per_s": n_sentences / elapsed,
+        "tokens_per_s": n_tokens / elapsed,
+        "p50_us": percentile(latencies, 50) / 1000,
+        "p90_us": percentile(latencies, 90) / 1000,
+        "p99_us": percentile(latencies, 99) / 1000,
+        "peak_kib": peak_memory_kib(run_all),
+    }
+
+def _tokenize(line: str):
+    try:
+        tokenize_sentence(line)
+    except LexicalError:
+        pass
+
+def run_suite(lines: List[str], engine: str = "rd", rounds: int = 5) -> Dict[str, Dict[str, float]]:
+    parser_class = get_parser_class(engine)
+    docs = []
+    for line in lines:
+        try:
+            docs.append(tokenize_columns(line))
+        except LexicalError:
+            pass
+    n_tokens = sum(len(d) for d in docs)
+    n_sentences = sum(len(d.commas) + 1 for d in docs)  # Oraciones separadas por comas
+
+    results = {
+        "tokenize_sentence": measure(lines, _tokenize, n_sentences, n_tokens, rounds),
+        "parse_panic_mode": measure(docs, lambda d: parser_class(d).parse_panic_mode(),
+                                    n_sentences, n_tokens, rounds),
+    }
+
+    # Camino completo de run_en: lectura del archivo, análisis y formato de salida
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+        path = f.name
+    try:
+        with open(os.devnull, "w", encoding="utf-8") as null:
+            results["run_en"] = measure(
+                [path], lambda p: run_en.run_file(p, engine=engine, out=null), n_sentences, n_tokens,
+                rounds,
+            )
+    finally:
+        os.unlink(path)
+    # Con un solo elemento las latencias no aportan nada
+    for key in ("p50_us", "p90_us", "p99_us"):
+        del results["run_en"][key]
+    return results
+
+# Campos de 'meta' que deben coincidir para que dos informes sean comparables
+COMPARABLE_META = ("lines", "kinds", "seed", "engine", "rounds")
+
+def meta_mismatches(current: Dict, baseline: Dict) -> List[str]:
+    """Campos de COMPARABLE_META en los que difieren los dos informes."""
+    meta, base = current["meta"], baseline.get("meta", {})
+    return [f"{key}: {base.get(key)!r} (base) != {meta[key]!r}"
+            for key in COMPARABLE_META if base.get(key) != meta[key]]
+
+def compare(current: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Lista de regresiones mayores que 'tolerance' (fracción) respecto a la base."""
+    regressions = []
+    for stage, metrics in current["stages"].items():
+        base = baseline["stages"].get(stage, {})
+        for name, value in metrics.items():
+            old = base.get(name)
+            if not old:
+                continue
+            change = (value - old) / old
+            if name in LOWER_IS_BETTER:
+                change = -change
+            if change < -tolerance:
+                regressions.append(f"{stage}.{name}: {old:,.1f} -> {value:,.1f} ({change:+.1%})")
+    return regressions
+
+def print_report(report: Dict):
+    meta = report["meta"]
+    print(f"corpus: {meta['lines']} líneas, kinds={','.join(meta['kinds'])}, "
+          f"seed={meta['seed']}, engine={meta['engine']}")
+    for stage, metrics in report["stages"].items():
+        cols = "  ".join(f"{k}={v:,.1f}" for k, v in metrics.items())
+        print(f"  {stage:<18} {cols}")
+
+def main():
+    ap = argparse.ArgumentParser(prog="python -m bench.suite")
+    ap.add_argument("-n", type=int, default=20000, help="Líneas del corpus")
+    ap.add_argument("--kinds", default="mixed", help=f"Tipos de corpus: {', '.join(KINDS)}")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--engine", choices=ENGINES, default="rd")
+    ap.add_argument("-r", "--rounds", type=int, default=5,
+                    help="Pasadas por etapa tras el calentamiento; se informa la mejor")
+    ap.add_argument("--save", metavar="JSON", help="Guardar el resultado como línea base")
+    ap.add_argument("--compare", metavar="JSON", help="Comparar con una línea base guardada")
+    ap.add_argument("--tolerance", type=float, default=0.10,
+                    help="Empeoramiento relativo tolerado al comparar (por defecto 0.10)")
+    args = ap.parse_args()
+
+    kinds = args.kinds.split(",")
+    lines = list(generate(args.n, kinds, args.seed))
+    report = {
+        "meta": {
+            "lines": len(lines),
+            "kinds": kinds,
+            "seed": args.seed,
+            "engine": args.engine,
+            "rounds": args.rounds,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+        },
+    }
+    # La línea base se valida antes de medir: sólo se compara lo comparable
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        mismatches = meta_mismatches(report, baseline)
+        if mismatches:
+            for line in mismatches:
+                print(f"META {line}", file=sys.stderr)
+            sys.exit(f"{args.compare}: baseline was measured with different settings; not comparing.")
+        for key in ("python", "machine"):
+            if baseline["meta"].get(key) != report["meta"][key]:
+                print(f"WARNING {key}: {baseline['meta'].get(key)!r} (base) != "
+                      f"{report['meta'][key]!r}", file=sys.stderr)
+
+    report["stages"] = run_suite(lines, args.engine, args.rounds)
+    print_report(report)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        regressions = compare(report, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print("Sin regresiones respecto a la línea base.")
+
+if __name__ == "__main__":
+    main()
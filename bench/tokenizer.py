@@ -0,0 +1,81 @@
+# bench/tokenizer.py
+# Compara el tokenizador compilado con la implementación original (por palabra).
+#   python -m bench.tokenizer [-n REPETICIONES]
+import argparse
+import time
+from dataclasses import dataclass
+from src.en_lexicon import LEXICON, LexicalError, tokenize_columns, tokenize_sentence
+
+@dataclass
+class LegacyToken:
+    """Token original: dataclass con __dict__ y categorías como cadenas."""
+    word: str
+    cat: str
+    num: str
+    pos: int
+
+# El léxico original era un dict en memoria: se copia una vez para no medir
+# las búsquedas en el léxico proyectado en memoria (LEXICON.get)
+LEGACY_LEXICON = dict(LEXICON.items())
+
+def legacy_tokenize_sentence(sentence: str):
+    """Tokenizador original: replace + lower + split + strip + dict por palabra."""
+    processed_sentence = sentence.replace(",", " , ")
+    words = processed_sentence.strip().lower().split()
+    tokens = []
+
+    for i, w in enumerate(words, start=1):
+        clean = w.strip(".!?")
+        if not clean:
+            continue
+
+        entry = LEGACY_LEXICON.get(clean)
+        if entry is None:
+            raise LexicalError(clean, i)
+
+        cat, num = entry
+        tokens.append(LegacyToken(word=clean, cat=cat, num=num, pos=i))
+
+    return tokens
+
+def load_sentences(paths=("test/valid.txt", "test/invalid.txt")):
+    """Oraciones de los archivos de prueba, sin comentarios ni líneas vacías."""
+    sents = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            sents.extend(l.strip() for l in f if l.strip() and not l.startswith("#"))
+    return sents
+
+def time_tokenizer(fn, sentences) -> float:
+    start = time.perf_counter()
+    for s in sentences:
+        fn(s)
+    return time.perf_counter() - start
+
+def main():
+    ap = argparse.ArgumentParser(prog="python -m bench.tokenizer")
+    ap.add_argument("-n", "--repeat", type=int, default=2000,
+                    help="Veces que se repite el corpus de test/*.txt")
+    args = ap.parse_args()
+
+    corpus = load_sentences() * args.repeat
+    n_tokens = sum(len(tokenize_sentence(s)) for s in load_sentences()) * args.repeat
+
+    print(f"{len(corpus)} oraciones, {n_tokens} tokens")
+    base = None
+    for name, fn in (("legacy", legacy_tokenize_sentence),
+                     ("tokenize_sentence", tokenize_sentence),
+                     ("tokenize_columns", tokenize_columns)):
+        elapsed = time_tokenizer(fn, corpus)
+        base = base or elapsed
+        print(f"{name:<22} {n_tokens / elapsed:>12,.0f} tokens/s  x{base / elapsed:.2f}")
+
+    # Documento completo: todas las oraciones unidas por comas en un solo texto
+    document = [" , ".join(corpus)]
+    for name, fn in (("legacy (doc)", legacy_tokenize_sentence),
+                     ("tokenize_columns (doc)", tokenize_columns)):
+        elapsed = time_tokenizer(fn, document)
+        print(f"{name:<22} {n_tokens / elapsed:>12,.0f} tokens/s")
+
+if __name__ == "__main__":
+    main()
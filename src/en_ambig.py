@@ -0,0 +1,377 @@
+# src/en_ambig.py
+# Análisis con palabras ambiguas (varias lecturas en el léxico, p. ej. "work"
+# como V/PL y como N/UNC).
+#
+# AmbiguousEnParser analiza cada oración primero como RDEnParser, con la
+# lectura principal de cada token. Solo si eso falla y la oración contiene
+# algún token ambiguo, busca una combinación de lecturas que la haga válida.
+# La búsqueda es un análisis memoizado por (regla, posición), estilo packrat,
+# calculado de derecha a izquierda sobre el segmento entre comas: cada tabla
+# guarda, por posición, si una regla puede llegar desde ahí hasta el final de
+# la oración (y con qué número de sujeto), así que el coste es lineal en la
+# longitud de la oración en lugar de exponencial en el número de ambigüedades.
+#
+# Tablas (k = índice dentro del segmento, n = longitud del segmento):
+#   heads[k]  núcleos de NP que empiezan en k: (fin, número, lecturas usadas)
+#               PRON | DET AdjList N (concordancia DET-N) | N ('Bare Noun')
+#   pp[k]     PPList cubre [k, n)
+#   body[k]   VPBody cubre [k, n):  NP PPList | PPList | ε
+#   vp[k]     números de sujeto (máscara de bits) para los que
+#             AuxList V VPBody cubre [k, n)
+#   ppvp[k]   ídem para PPList seguido de VP
+#   S         NP VP: PRON seguido de vp, o núcleo de NP seguido de ppvp
+# heads y body se calculan solo en las posiciones que se consultan. Las
+# tablas solo dicen si hay análisis; la primera combinación válida se
+# reconstruye después recorriendo las mismas decisiones sobre ellas, y todas
+# las combinaciones, recorriendo solo las ramas que las tablas dan por buenas.
+from bisect import bisect_left
+from itertools import product
+from src.en_lexicon import END_OF_INPUT, Cat, Num, Token, TokenColumns
+from src.en_parser import RDEnParser
+
+_COMMA, _DET, _PRON, _N, _V, _AUX, _ADJ, _PREP = Cat
+_ANY, _SG, _PL, _SGC, _UNC, _COLL = Num
+_BARE_NUMS = (_PL, _UNC, _COLL)
+_CATS = tuple(Cat)
+_NUMS = tuple(Num)
+_PREP_BIT = 1 << _PREP
+_V_BIT = 1 << _V
+_AUX_BIT = 1 << _AUX
+_VP_BITS = _V_BIT | _AUX_BIT
+
+def _agreement(noun_num: int) -> int:
+    return _PL if noun_num == _PL else _SG
+
+def _heads(readings: list, k: int) -> list:
+    """Núcleos de NP que empiezan en k: lista de (fin, número, lecturas)."""
+    out = []
+    n = len(readings)
+    if k >= n:
+        return out
+    for r in readings[k]:
+        cat, num = r
+        if cat == _PRON:
+            out.append((k + 1, num, ((k, r),)))
+        elif cat == _N:
+            if num in _BARE_NUMS:
+                out.append((k + 1, _agreement(num), ((k, r),)))
+        elif cat == _DET:
+            # AdjList: cualquier prefijo de tokens que admitan lectura ADJ
+            adjs = ()
+            j = k + 1
+            while j < n:
+                for noun in readings[j]:
+                    if noun[0] == _N:
+                        agr = _agreement(noun[1])
+                        if num == _ANY or num == agr:
+                            out.append((j + 1, agr, ((k, r),) + adjs + ((j, noun),)))
+                adj = next((a for a in readings[j] if a[0] == _ADJ), None)
+                if adj is None:
+                    break
+                adjs += ((j, adj),)
+                j += 1
+    return out
+
+class _Chart:
+    """Tablas del análisis de una oración (ver la cabecera del módulo)."""
+
+    def __init__(self, readings: list):
+        self.readings = readings
+        n = self.n = len(readings)
+        self.masks = masks = [0] * (n + 1)
+        for k, rs in enumerate(readings):
+            for cat, _ in rs:
+                masks[k] |= 1 << cat
+        self.heads_memo = [None] * (n + 1)
+        self.body_memo = [None] * (n + 1)
+        self.pp = pp = bytearray(n + 1)
+        self.vp = vp = [0] * (n + 1)
+        self.ppvp = ppvp = [0] * (n + 1)
+        pp[n] = 1
+        heads, body = self.heads, self.body
+
+        for k in range(n - 1, -1, -1):
+            m = masks[k]
+            acc = 0
+            # PPList -> PREP NP PPList | ε   (y PPList seguido de VP)
+            if m & _PREP_BIT:
+                for end, _, _ in heads(k + 1):
+                    pp[k] |= pp[end]
+                    acc |= ppvp[end]
+            # VP -> AuxList V VPBody
+            if m & _VP_BITS:
+                v = 0
+                j = k
+                while j < n:
+                    mj = masks[j]
+                    if mj & _V_BIT and body(j + 1):
+                        for cat, num in readings[j]:
+                            if cat == _V:
+                                v |= 1 << num
+                    if not mj & _AUX_BIT:
+                        break
+                    j += 1
+                vp[k] = v
+                acc |= v
+            ppvp[k] = acc
+
+    def heads(self, k: int) -> list:
+        hs = self.heads_memo[k]
+        if hs is None:
+            hs = self.heads_memo[k] = _heads(self.readings, k)
+        return hs
+
+    def body(self, k: int) -> bool:
+        """VPBody -> NP PPList | PPList | ε, desde k hasta el final."""
+        b = self.body_memo[k]
+        if b is None:
+            pp = self.pp
+            b = self.body_memo[k] = bool(pp[k]) or any(pp[end] for end, _, _ in self.heads(k))
+        return b
+
+    def subject(self):
+        """S -> NP VP: primer núcleo de sujeto con el que la oración es válida, o None."""
+        for head in self.heads(0):
+            end, num, used = head
+            pron = used[0][1][0] == _PRON
+            if (self.vp if pron else self.ppvp)[end] >> num & 1:
+                return head
+        return None
+
+    # RECONSTRUCCIÓN
+
+    def first(self):
+        """Primera combinación de lecturas válida, o None."""
+        head = self.subject()
+        if head is None:
+            return None
+        end, num, used = head
+        chosen = [None] * self.n
+        self.record(chosen, used)
+        if used[0][1][0] == _PRON:
+            self.take_vp(chosen, end, num)
+        else:
+            self.take_ppvp(chosen, end, num)
+        return tuple(chosen)
+
+    @staticmethod
+    def record(chosen, used):
+        for k, r in used:
+            chosen[k] = r
+
+    def prep_at(self, k):
+        return next(r for r in self.readings[k] if r[0] == _PREP)
+
+    def take_ppvp(self, chosen, k, num):
+        ppvp, vp = self.ppvp, self.vp
+        while not vp[k] >> num & 1:
+            chosen[k] = self.prep_at(k)
+            end, _, used = next(h for h in self.heads(k + 1) if ppvp[h[0]] >> num & 1)
+            self.record(chosen, used)
+            k = end
+        self.take_vp(chosen, k, num)
+
+    def take_vp(self, chosen, k, num):
+        readings = self.readings
+        while True:
+            verb = next((r for r in readings[k] if r[0] == _V and r[1] == num), None)
+            if verb is not None and self.body(k + 1):
+                chosen[k] = verb
+                self.take_body(chosen, k + 1)
+                return
+            chosen[k] = next(r for r in readings[k] if r[0] == _AUX)
+            k += 1
+
+    def take_body(self, chosen, k):
+        pp = self.pp
+        if not pp[k]:
+            end, _, used = next(h for h in self.heads(k) if pp[h[0]])
+            self.record(chosen, used)
+            k = end
+        self.take_pp(chosen, k)
+
+    def take_pp(self, chosen, k):
+        pp = self.pp
+        while k < self.n:
+            chosen[k] = self.prep_at(k)
+            end, _, used = next(h for h in self.heads(k + 1) if pp[h[0]])
+            self.record(chosen, used)
+            k = end
+
+    # ENUMERACIÓN
+    # Estados (regla, posición, número de sujeto); edges() devuelve las
+    # alternativas de un estado que llegan a un análisis completo, como
+    # (lecturas usadas, estado siguiente o None al terminar).
+
+    def variants(self, used) -> list:
+        """
+        Lecturas de un núcleo de NP con cada lectura ADJ alternativa de sus
+        adjetivos (_heads solo guarda la primera: el número del ADJ no cuenta).
+        """
+        readings = self.readings
+        options = [[r] if r[0] != _ADJ else [a for a in readings[k] if a[0] == _ADJ]
+                   for k, r in used]
+        if all(len(o) == 1 for o in options):
+            return [used]
+        ks = [k for k, _ in used]
+        return [tuple(zip(ks, combo)) for combo in product(*options)]
+
+    def head_edges(self, out, k, prefix, rule, num, table):
+        """Añade a out los núcleos de NP desde k que siguen en 'rule' según 'table'."""
+        for end, _, used in self.heads(k):
+            if table[end] >> num & 1:
+                out.extend((prefix + v, (rule, end, num)) for v in self.variants(used))
+
+    def edges(self, state) -> list:
+        rule, k, num = state
+        readings, pp, vp, ppvp = self.readings, self.pp, self.vp, self.ppvp
+        out = []
+        if rule == "S":
+            for end, num, used in self.heads(0):
+                if used[0][1][0] == _PRON:
+                    if vp[end] >> num & 1:
+                        out.append((used, ("VP", end, num)))
+                elif ppvp[end] >> num & 1:
+                    out.extend((v, ("PPVP", end, num)) for v in self.variants(used))
+        elif rule == "PPVP":
+            if vp[k] >> num & 1:
+                out.append(((), ("VP", k, num)))
+            for prep in readings[k]:
+                if prep[0] == _PREP:
+                    self.head_edges(out, k + 1, ((k, prep),), "PPVP", num, ppvp)
+        elif rule == "VP":
+            for r in readings[k]:
+                if r[0] == _V and r[1] == num and self.body(k + 1):
+                    out.append((((k, r),), ("BODY", k + 1, 0)))
+                elif r[0] == _AUX and vp[k + 1] >> num & 1:
+                    out.append((((k, r),), ("VP", k + 1, num)))
+        elif rule == "BODY":
+            if pp[k]:
+                out.append(((), ("PP", k, 0)))
+            self.head_edges(out, k, (), "PP", 0, pp)
+        elif k == self.n:  # PP al final del segmento
+            out.append(((), None))
+        else:
+            for prep in readings[k]:
+                if prep[0] == _PREP:
+                    self.head_edges(out, k + 1, ((k, prep),), "PP", 0, pp)
+        return out
+
+    def all(self):
+        """
+        Genera todas las combinaciones de lecturas válidas. Cada rama que se
+        recorre termina en al menos un análisis, así que el coste es
+        proporcional al número de resultados por la longitud de la oración.
+        Como cada estado cubre un prefijo del segmento, las lecturas de una
+        rama se escriben sobre las de la anterior sin deshacer nada.
+        """
+        chosen = [None] * self.n
+        stack = [iter(self.edges(("S", 0, 0)))]
+        while stack:
+            edge = next(stack[-1], None)
+            if edge is None:
+                stack.pop()
+                continue
+            used, state = edge
+            self.record(chosen, used)
+            if state is None:
+                yield tuple(chosen)
+            else:
+                stack.append(iter(self.edges(state)))
+
+def first_analysis(readings: list):
+    """
+    Primera combinación de lecturas (una por token, como (Cat, Num)) con la
+    que la oración es válida, o None. 'readings' lista, por token, sus
+    lecturas en orden de preferencia; las preferidas se prueban primero.
+    """
+    if not readings:
+        return None
+    return _Chart(readings).first()
+
+def analyses(readings: list):
+    """
+    Genera todas las combinaciones de lecturas válidas, en orden de
+    preferencia (el de itertools.product sobre 'readings'). Se enumeran
+    desde las tablas del análisis, así que el coste depende del número de
+    resultados y no del de combinaciones posibles.
+    """
+    if not readings:
+        return
+    rank = [{r: j for j, r in enumerate(rs)} for rs in readings]
+    found = list(_Chart(readings).all())
+    found.sort(key=lambda combo: [rank[k][r] for k, r in enumerate(combo)])
+    yield from found
+
+class AmbiguousEnParser(RDEnParser):
+    """
+    RDEnParser que resuelve tokens con varias lecturas (TokenColumns.alts).
+    Sin tokens ambiguos se comporta exactamente igual que RDEnParser; si una
+    oración con tokens ambiguos no es válida con ninguna combinación, se
+    informa el error del análisis con las lecturas principales.
+    'resolved' lista el inicio de las oraciones que solo fueron válidas con
+    lecturas alternativas; analysis() y all_analyses() devuelven las lecturas.
+    """
+
+    def __init__(self, tokens: TokenColumns | list[Token]):
+        super().__init__(tokens)
+        self.ambiguous = sorted(self.tokens.alts)
+        self.resolved = []
+
+    def segment_end(self, start: int) -> int:
+        """Índice de la coma que cierra la oración que empieza en start (o el final)."""
+        commas = self.tokens.commas
+        k = bisect_left(commas, start)
+        return commas[k] if k < len(commas) else len(self.tokens)
+
+    def segment_readings(self, start: int, end: int) -> list:
+        alts = self.tokens.alts
+        cats, nums = self.cats, self.nums
+        return [alts.get(k) or ((_CATS[cats[k]], _NUMS[nums[k]]),) for k in range(start, end)]
+
+    def has_ambiguity(self, start: int, end: int) -> bool:
+        k = bisect_left(self.ambiguous, start)
+        return k < len(self.ambiguous) and self.ambiguous[k] < end
+
+    def has_unknown(self, start: int, end: int) -> bool:
+        """Si la oración [start, end) contiene palabras desconocidas (tokens de error)."""
+        k = bisect_left(self.unknown, start)
+        return k < len(self.unknown) and self.unknown[k] < end
+
+    def S(self) -> int | None:
+        if not self.ambiguous:
+            return RDEnParser.S(self)
+        start = self.i
+        num = super().S()
+        cat = self.cats[self.i]
+        if num is not None and (cat == _COMMA or cat == END_OF_INPUT):
+            return num
+
+        end = self.segment_end(start)
+        if self.has_ambiguity(start, end):
+            head = _Chart(self.segment_readings(start, end)).subject()
+            if head is not None:
+                self.resolved.append(start)
+                self.i = end
+                return head[1]
+        return num
+
+    def analysis(self, start: int = 0):
+        """
+        Primera combinación de lecturas válida de la oración que empieza en
+        start, o None (también si contiene palabras desconocidas).
+        """
+        end = self.segment_end(start)
+        if self.has_unknown(start, end):
+            return None
+        return first_analysis(self.segment_readings(start, end))
+
+    def all_analyses(self, start: int = 0):
+        """
+        Todas las combinaciones de lecturas válidas de la oración que empieza
+        en start (ninguna si contiene palabras desconocidas).
+        """
+        end = self.segment_end(start)
+        if self.has_unknown(start, end):
+            return iter(())
+        return analyses(self.segment_readings(start, end))
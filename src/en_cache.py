@@ -0,0 +1,202 @@
+# src/en_cache.py
+# Memoización de resultados del análisis por oración (en memoria y en disco).
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict
+from src import en_lexicon
+from src.en_lexicon import normalize_sentence
+from src.en_parser import Diagnostic, ParseResult
+
+class ResultCache:
+    """
+    Caché LRU acotada de ParseResult indexada por el motor de análisis y la
+    forma normalizada de la oración (ver normalize_sentence): los motores
+    no siempre coinciden (ambig acepta lecturas que rd rechaza). Es segura
+    para compartir entre hilos y lleva contadores de aciertos, fallos y
+    desalojos. Los ParseResult son inmutables, así que se devuelven sin
+    copiar.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer.")
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, sentence: str, engine: str = "rd"):
+        """Devuelve el resultado memorizado o None (y cuenta el acierto o fallo)."""
+        return self._lookup((engine, normalize_sentence(sentence)))
+
+    def put(self, sentence: str, result, engine: str = "rd") -> None:
+        self._store((engine, normalize_sentence(sentence)), result)
+
+    def get_or_compute(self, sentence: str, compute: Callable[[str], object], engine: str = "rd"):
+        """Devuelve el resultado memorizado o lo calcula con compute(sentence)."""
+        key = (engine, normalize_sentence(sentence))
+        result = self._lookup(key)
+        if result is None:
+            result = compute(sentence)
+            self._store(key, result)
+        return result
+
+    def _lookup(self, key: tuple):
+        with self._lock:
+            result = self._data.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def _store(self, key: tuple, result) -> None:
+        with self._lock:
+            self._data[key] = result
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hit_rate,
+            }
+
+# CACHÉ PERSISTENTE
+
+# Módulos de src/ cuyo contenido determina los resultados del análisis
+_VERSIONED_SOURCES = ("en_lexicon.py", "en_lexfile.py", "en_parser.py", "en_ll1.py",
+                      "en_ambig.py", "en_precheck.py", "en_suggest.py", "en_codegen.py")
+
+def grammar_version() -> str:
+    """
+    Huella del léxico y del código del analizador. Cambia cuando se edita
+    el léxico activo o cualquiera de los módulos que intervienen en el
+    resultado, lo que invalida automáticamente las cachés persistentes.
+    """
+    h = hashlib.sha256()
+    h.update(en_lexicon.LEXICON.content_bytes())
+    src_dir = os.path.dirname(os.path.abspath(__file__))
+    for name in _VERSIONED_SOURCES:
+        with open(os.path.join(src_dir, name), "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+class DiskResultCache:
+    """
+    Caché persistente en un archivo sqlite que asocia el hash del motor y
+    de la oración normalizada con su ParseResult. Permite revalidar un
+    corpus de forma incremental: en una segunda ejecución solo se analizan
+    las líneas nuevas o modificadas. Si grammar_version() cambia, el
+    contenido se descarta.
+    Tiene la misma interfaz que ResultCache (get, put, get_or_compute, stats).
+    """
+
+    # Escrituras acumuladas antes de confirmar la transacción
+    COMMIT_EVERY = 1000
+
+    def __init__(self, path: str):
+        self.path = path
+        self.version = grammar_version()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.hits = 0
+        self.misses = 0
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results "
+            "(hash BLOB PRIMARY KEY, ok INTEGER NOT NULL, diagnostics TEXT NOT NULL)"
+        )
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is None or row[0] != self.version:
+            # Léxico o gramática distintos: los resultados guardados ya no valen
+            self._db.execute("DELETE FROM results")
+            self._db.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (self.version,))
+        self._db.commit()
+
+    @staticmethod
+    def _key(sentence: str, engine: str) -> bytes:
+        return hashlib.sha256(f"{engine}\0{normalize_sentence(sentence)}".encode("utf-8")).digest()
+
+    def get(self, sentence: str, engine: str = "rd"):
+        """Devuelve el resultado guardado o None (y cuenta el acierto o fallo)."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT ok, diagnostics FROM results WHERE hash = ?", (self._key(sentence, engine),)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return ParseResult(bool(row[0]), tuple(Diagnostic(*d) for d in json.loads(row[1])))
+
+    def put(self, sentence: str, result, engine: str = "rd") -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                (self._key(sentence, engine), int(result.ok), json.dumps(result.diagnostics)),
+            )
+            self._pending += 1
+            if self._pending >= self.COMMIT_EVERY:
+                self._db.commit()
+                self._pending = 0
+
+    def get_or_compute(self, sentence: str, compute: Callable[[str], object], engine: str = "rd"):
+        result = self.get(sentence, engine)
+        if result is None:
+            result = compute(sentence)
+            self.put(sentence, result, engine)
+        return result
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def stats(self) -> Dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            "path": self.path,
+            "size": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.commit()
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
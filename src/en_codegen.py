@@ -0,0 +1,305 @@
+# src/en_codegen.py
+# Compilación de la gramática a un módulo de Python especializado.
+#
+# RDEnParser interpreta en cada llamada la estructura general de las reglas:
+# una llamada por regla (NP, NPHead, PPList, VP...), los helpers de
+# concordancia (noun_agreement, noun_allows_bare, check_*), accept() y fail()
+# con su registro de error. generate_source() escribe en cambio un único
+# parse_segments() con todo inlinado:
+#   - cada regla se expande en su punto de uso (NPHead aparece tres veces:
+#     sujeto, PP y objeto) y los fallos salen del bucle de la oración con
+#     break, sin excepciones ni llamadas;
+#   - los códigos de Cat/Num del léxico son literales;
+#   - la concordancia y la restricción 'Bare Noun' son tablas precalculadas
+#     por rasgo de número (AGREEMENT[num], BARE[num]);
+#   - los Diagnostic se construyen directamente con los mismos campos que
+#     RDEnParser.
+# Como no quedan llamadas a reglas que instrumentar, este motor no admite
+# --profile (CompiledEnParser.profilable = False).
+# El resultado es idéntico al de RDEnParser (ver bench/compiled.py).
+#
+# El módulo generado se guarda en src/_generated/ con la huella de las
+# fuentes en su cabecera y se regenera cuando cambian (este archivo,
+# en_parser.py o en_lexicon.py); si no se puede escribir, se compila en
+# memoria.
+#   python -m src.en_codegen [-o salida.py]
+import hashlib
+import importlib.util
+import os
+import sys
+from src.en_lexicon import CATEGORIES, END_OF_INPUT, NUMBERS, Cat, Num
+from src import en_parser
+
+_SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+GENERATED_DIR = os.path.join(_SRC_DIR, "_generated")
+GENERATED_PATH = os.path.join(GENERATED_DIR, "en_compiled.py")
+# Fuentes de las que depende el código generado
+_SOURCES = ("en_codegen.py", "en_parser.py", "en_lexicon.py")
+_HASH_PREFIX = "# source-hash: "
+
+def source_hash() -> str:
+    h = hashlib.sha256()
+    for name in _SOURCES:
+        with open(os.path.join(_SRC_DIR, name), "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+# GENERACIÓN
+
+class _Emitter:
+    """Acumula líneas de código con su sangría."""
+
+    def __init__(self):
+        self.lines = []
+
+    def __call__(self, indent: int, *lines: str):
+        for line in lines:
+            self.lines.append("    " * indent + line if line else "")
+
+    def source(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+def _np_head(emit: _Emitter, ind: int, target: str, c: dict, pron: bool = True):
+    """
+    NPHead inlinado: PRON | DET AdjList N | N (Bare Noun). Deja el número
+    del NP en 'target' o asigna 'err' y sale del bucle con break. Con
+    pron=False se omite la rama PRON (el llamador ya la descartó).
+    """
+    emit(ind, "c = cats[i]")
+    if pron:
+        emit(ind,
+             f"if c == {c['PRON']}:",
+             f"    {target} = nums[i]",
+             "    i += 1")
+    emit(ind,
+         f"{'elif' if pron else 'if'} c == {c['DET']}:",
+         "    d = i",
+         "    i += 1",
+         f"    while cats[i] == {c['ADJ']}:",
+         "        i += 1",
+         "    c = cats[i]",
+         f"    if c != {c['N']}:")
+    _accept_error(emit, ind + 2, Cat.N, c)
+    emit(ind,
+         "    raw = nums[i]",
+         f"    {target} = AGREEMENT[raw]",
+         "    dn = nums[d]",
+         "    i += 1",
+         f"    if dn != {c['ANY']} and dn != {target}:",
+         f"        err = Diagnostic({en_parser.E_DET_NOUN!r}, positions[i - 1], NUMBERS[dn],",
+         "                         NUMBERS[raw], word(i - 1), word(d))",
+         "        break",
+         f"elif c == {c['N']}:",
+         "    raw = nums[i]",
+         "    i += 1",
+         "    if not BARE[raw]:",
+         f"        err = Diagnostic({en_parser.E_BARE_NOUN!r}, positions[i - 1], found=NUMBERS[raw],",
+         "                         word=word(i - 1))",
+         "        break",
+         f"    {target} = AGREEMENT[raw]",
+         f"elif c == {c['END']}:",
+         f"    err = Diagnostic({en_parser.E_NP_END!r}, expected='NP')",
+         "    break",
+         "else:",
+         f"    err = Diagnostic({en_parser.E_NP_START!r}, positions[i], 'NP', CATEGORIES[c], word(i))",
+         "    break")
+
+def _accept_error(emit: _Emitter, ind: int, expected_cat: Cat, c: dict):
+    """Error de accept(expected_cat) con el token actual en 'c'; sale con break."""
+    expected = CATEGORIES[expected_cat]
+    emit(ind,
+         f"if c == {c['END']}:",
+         f"    err = Diagnostic({en_parser.E_UNEXPECTED_END!r}, expected={expected!r})",
+         "else:",
+         f"    err = Diagnostic({en_parser.E_EXPECTED_CAT!r}, positions[i], {expected!r},",
+         "                     CATEGORIES[c], word(i))",
+         "break")
+
+def _pp_list(emit: _Emitter, ind: int, c: dict):
+    """PPList inlinado: (PREP NPHead)*; propaga el error del NPHead."""
+    emit(ind, f"while cats[i] == {c['PREP']}:", "    i += 1")
+    _np_head(emit, ind + 1, "_", c)
+    emit(ind, "if err is not None:", "    break")
+
+def _sync(emit: _Emitter, ind: int):
+    """synchronize_panic inlinado."""
+    emit(ind,
+         "k = bisect_left(commas, i)",
+         "i = commas[k] + 1 if k < n_commas else n")
+
+def generate_source(digest: str = "") -> str:
+    """Código fuente del módulo especializado."""
+    c = {cat.name: int(cat) for cat in Cat}
+    c["END"] = END_OF_INPUT
+    c["ANY"] = int(Num.ANY)
+    # Los helpers de RDEnParser no usan self: se evalúan una vez por rasgo
+    features = range(max(Num) + 1)
+    agreement = tuple(int(en_parser.RDEnParser.noun_agreement(None, num)) for num in features)
+    bare = tuple(en_parser.RDEnParser.noun_allows_bare(None, num) for num in features)
+
+    emit = _Emitter()
+    emit(0,
+         "# Generado por src/en_codegen.py: no editar.",
+         f"{_HASH_PREFIX}{digest}",
+         "from bisect import bisect_left",
+         "from src.en_parser import Diagnostic, RDEnParser",
+         "",
+         f"CATEGORIES = {tuple(CATEGORIES)!r}",
+         f"NUMBERS = {tuple(NUMBERS)!r}",
+         "# Número de concordancia y si admite 'Bare Noun', por rasgo de número",
+         f"AGREEMENT = {agreement!r}",
+         f"BARE = {bare!r}",
+         "",
+         "class CompiledEnParser(RDEnParser):",
+         '    """RDEnParser con las reglas inlinadas (generado por src/en_codegen.py)."""',
+         "    # Las reglas y synchronize_panic no se llaman: ver src.en_profile",
+         "    profilable = False",
+         "",
+         "    def parse_segments(self, ok_only=False):",
+         "        tokens = self.tokens",
+         "        cats = self.cats",
+         "        nums = self.nums",
+         "        positions = tokens.positions",
+         "        word = tokens.word",
+         "        commas = tokens.commas",
+         "        n_commas = len(commas)",
+         "        n = len(tokens)",
+         "        unknown = self.unknown",
+         "        errors = []",
+         "        parsed_any = False",
+         "        i = self.i",
+         "",
+         f"        while cats[i] != {c['END']}:",
+         f"            if cats[i] == {c['COMMA']}:",
+         f"                errors.append(Diagnostic({en_parser.E_UNEXPECTED_COMMA!r}, positions[i],",
+         f"                                         found={CATEGORIES[Cat.COMMA]!r}, word=','))",
+         "                if ok_only:",
+         "                    break")
+    _sync(emit, 4)
+    emit(4, "continue", "")
+    emit(3,
+         "if unknown:",
+         "    self.i = i",
+         "    lexical = self.lexical_errors()",
+         "    if lexical:",
+         "        errors += lexical[:1] if ok_only else lexical",
+         "        if ok_only:",
+         "            break")
+    _sync(emit, 5)
+    emit(5, "continue")
+    emit(3,
+         "",
+         "# S -> NP VP: una pasada; los errores salen con break",
+         "err = None",
+         "while True:",
+         f"    if cats[i] == {c['PRON']}:",
+         "        s = nums[i]",
+         "        i += 1",
+         "    else:")
+    _np_head(emit, 5, "s", c, pron=False)
+    _pp_list(emit, 5, c)
+    emit(4,
+         f"while cats[i] == {c['AUX']}:",
+         "    i += 1",
+         "c = cats[i]",
+         f"if c != {c['V']}:")
+    _accept_error(emit, 5, Cat.V, c)
+    emit(4,
+         "vn = nums[i]",
+         "i += 1",
+         "if vn != s:",
+         f"    err = Diagnostic({en_parser.E_SUBJ_VERB!r}, positions[i - 1], NUMBERS[s], NUMBERS[vn],",
+         "                     word(i - 1))",
+         "    break",
+         "c = cats[i]",
+         f"if c == {c['PRON']} or c == {c['DET']} or c == {c['N']}:")
+    _np_head(emit, 5, "_", c)
+    _pp_list(emit, 4, c)
+    emit(4, "break")
+    emit(3,
+         "",
+         "if err is not None:",
+         "    errors.append(err)",
+         "    if ok_only:",
+         "        break")
+    _sync(emit, 4)
+    emit(4, "continue")
+    emit(3,
+         "parsed_any = True",
+         "",
+         "c = cats[i]",
+         f"if c == {c['COMMA']}:",
+         "    i += 1",
+         f"elif c != {c['END']}:",
+         f"    errors.append(Diagnostic({en_parser.E_EXPECTED_DELIMITER!r}, positions[i],",
+         f"                             {CATEGORIES[Cat.COMMA]!r}, CATEGORIES[c], word(i)))",
+         "    if ok_only:",
+         "        break")
+    _sync(emit, 4)
+    emit(2,
+         "",
+         "self.i = i",
+         "return errors, parsed_any")
+    return emit.source()
+
+# CARGA
+
+def _stored_hash(path: str) -> str | None:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            f.readline()
+            line = f.readline()
+    except OSError:
+        return None
+    return line[len(_HASH_PREFIX):].strip() if line.startswith(_HASH_PREFIX) else None
+
+def write_module(path: str = GENERATED_PATH, digest: str = None) -> str:
+    """Genera el módulo y lo escribe de forma atómica en 'path'."""
+    source = generate_source(digest or source_hash())
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(source)
+    os.replace(tmp, path)
+    return source
+
+def _load_from_source(source: str):
+    """Compila el módulo en memoria (directorio de destino sin permisos)."""
+    module = type(sys)("src._generated.en_compiled")
+    exec(compile(source, GENERATED_PATH, "exec"), module.__dict__)
+    return module
+
+_class = None
+
+def compiled_parser_class():
+    """
+    Clase CompiledEnParser del módulo generado; lo regenera si falta o si las
+    fuentes cambiaron desde la última generación.
+    """
+    global _class
+    if _class is not None:
+        return _class
+    digest = source_hash()
+    if _stored_hash(GENERATED_PATH) != digest:
+        try:
+            write_module(GENERATED_PATH, digest)
+        except OSError:
+            _class = _load_from_source(generate_source(digest)).CompiledEnParser
+            return _class
+    spec = importlib.util.spec_from_file_location("src._generated.en_compiled", GENERATED_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    _class = module.CompiledEnParser
+    return _class
+
+def main():
+    import argparse
+    ap = argparse.ArgumentParser(prog="python -m src.en_codegen")
+    ap.add_argument("-o", "--output", default=GENERATED_PATH,
+                    help="Archivo de salida (por defecto src/_generated/en_compiled.py)")
+    args = ap.parse_args()
+    source = write_module(args.output)
+    print(f"{args.output}: {source.count(chr(10))} líneas")
+
+if __name__ == "__main__":
+    main()
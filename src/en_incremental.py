@@ -0,0 +1,241 @@
+# src/en_incremental.py
+# Revalidación incremental de un texto que se edita (p. ej. en un editor que
+# valida en cada pulsación).
+#
+# El texto se guarda partido en sus comas: el segmento j es el texto entre la
+# coma j-1 y la coma j. Como el modo pánico no arrastra estado más allá de una
+# coma (ver parse_parallel), cada segmento se tokeniza y analiza por separado
+# junto con su coma final, que hace de lookahead, y el resultado del documento
+# es la concatenación de los de sus segmentos con las posiciones desplazadas.
+# Una edición solo vuelve a tokenizar y analizar los segmentos que toca; el
+# resto de segmentos conserva su resultado. Los segmentos se agrupan en
+# bloques con sus totales; un árbol de Fenwick sobre los caracteres de cada
+# bloque localiza la edición en tiempo logarítmico, y los diagnósticos del
+# resultado se desplazan y reúnen solo cuando se consultan, así que el coste
+# de una edición depende del tamaño de la edición y no del documento.
+from src.en_lexicon import tokenize_columns
+from src.en_parser import Diagnostic, ParseResult, get_parser_class, result_from_segments
+
+class _Segment:
+    """
+    Resultado de un segmento, con posiciones relativas a su primera palabra.
+      text        Texto del segmento, sin la coma final
+      n_words     Palabras que ocupa, incluida la coma final si la tiene
+      errors      Diagnostic del modo pánico (incluidos los léxicos)
+      parsed_any  Si se analizó al menos una oración
+    """
+    __slots__ = ("text", "n_words", "errors", "parsed_any")
+
+    def __init__(self, text: str, last: bool, parser_class):
+        self.text = text
+        source = text if last else text + ","
+        self.n_words = len(source.replace(",", " , ").split())
+        tokens = tokenize_columns(source, strict=False)
+        errors, self.parsed_any = parser_class(tokens).parse_segments()
+        self.errors = tuple(errors)
+
+def _shift(diagnostic: Diagnostic, offset: int) -> Diagnostic:
+    if not offset or diagnostic.pos is None:
+        return diagnostic
+    return diagnostic._replace(pos=diagnostic.pos + offset)
+
+# Segmentos por bloque. Los bloques guardan el resumen de sus segmentos, así
+# que localizar una posición y montar el resultado recorren bloques, no
+# segmentos. Un bloque editado crece hasta 2 * BLOCK_SIZE segmentos antes de
+# partirse, para que el número de bloques cambie pocas veces.
+BLOCK_SIZE = 64
+
+class _Block:
+    """
+    Segmentos consecutivos con sus totales y sus diagnósticos ya combinados
+    (posiciones relativas a la primera palabra del bloque).
+      chars  Caracteres que ocupan, con la coma final de cada segmento
+      words  Palabras que ocupan
+    """
+    __slots__ = ("segs", "chars", "words", "errors", "parsed_any")
+
+    def __init__(self, segs: list[_Segment]):
+        self.segs = segs
+        self.chars = sum(len(seg.text) for seg in segs) + len(segs)
+        self.words = 0
+        errors = []
+        self.parsed_any = False
+        for seg in segs:
+            errors.extend(_shift(d, self.words) for d in seg.errors)
+            self.parsed_any = self.parsed_any or seg.parsed_any
+            self.words += seg.n_words
+        self.errors = tuple(errors)
+
+def _make_blocks(segs: list[_Segment], max_size: int | None = None) -> list[_Block]:
+    """Agrupa segmentos en bloques de BLOCK_SIZE si son más de max_size (por defecto BLOCK_SIZE)."""
+    if len(segs) <= (BLOCK_SIZE if max_size is None else max_size):
+        return [_Block(segs)]
+    return [_Block(segs[k:k + BLOCK_SIZE]) for k in range(0, len(segs), BLOCK_SIZE)]
+
+class _Fenwick:
+    """Árbol de Fenwick (sumas de prefijos con actualización puntual) sobre enteros positivos."""
+    __slots__ = ("tree",)
+
+    def __init__(self, values: list[int]):
+        tree = [0] + values
+        for i in range(1, len(tree)):
+            j = i + (i & -i)
+            if j < len(tree):
+                tree[j] += tree[i]
+        self.tree = tree
+
+    def add(self, index: int, delta: int):
+        tree = self.tree
+        i = index + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def search(self, value: int) -> tuple[int, int]:
+        """Mayor k tal que la suma de los k primeros valores es <= value, y esa suma."""
+        tree = self.tree
+        k = total = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            j = k + step
+            if j < len(tree) and total + tree[j] <= value:
+                k = j
+                total += tree[j]
+            step >>= 1
+        return k, total
+
+class _ShiftedDiagnostics:
+    """
+    Diagnósticos de un documento sobre sus bloques: cada diagnóstico se
+    desplaza al recorrerlos. ParseResult los materializa en una tupla la
+    primera vez que se consulta result().diagnostics.
+    """
+    __slots__ = ("_blocks",)
+
+    def __init__(self, blocks: list[_Block]):
+        self._blocks = blocks
+
+    def __iter__(self):
+        offset = 0
+        for block in self._blocks:
+            for d in block.errors:
+                yield _shift(d, offset)
+            offset += block.words
+
+class IncrementalDocument:
+    """
+    Texto editable cuyo ParseResult se mantiene al día re-analizando solo los
+    segmentos (entre comas) afectados por cada edición. result() es siempre
+    igual a analyze_en_sentence(doc.text, engine); sus diagnósticos se
+    reúnen al consultarlos por primera vez (ver _ShiftedDiagnostics).
+    'reparsed' cuenta los segmentos analizados en la última edición.
+    """
+
+    def __init__(self, text: str = "", engine: str = "rd"):
+        self.engine = engine
+        self.parser_class = get_parser_class(engine)
+        self.reparsed = 0
+        self.set_text(text)
+
+    def set_text(self, text: str) -> ParseResult:
+        """Sustituye el texto completo (y lo analiza entero)."""
+        blocks = self._blocks = _make_blocks(self._parse_pieces(text.split(","), True))
+        self._chars = _Fenwick([block.chars for block in blocks])
+        self._size = sum(block.chars for block in blocks)
+        self._n_errors = sum(len(block.errors) for block in blocks)
+        self._n_parsed = sum(block.parsed_any for block in blocks)
+        self._result = None
+        return self.result()
+
+    @property
+    def text(self) -> str:
+        return ",".join(seg.text for block in self._blocks for seg in block.segs)
+
+    def __len__(self):
+        """Longitud del texto en caracteres."""
+        return self._size - 1
+
+    def edit(self, start: int, end: int, new_text: str) -> ParseResult:
+        """
+        Reemplaza text[start:end] por new_text y devuelve el nuevo resultado.
+        Solo se analizan los segmentos que contienen el rango editado (más los
+        que crea el texto nuevo si trae comas).
+        """
+        size = len(self)
+        if not 0 <= start <= end <= size:
+            raise ValueError(f"Invalid edit range [{start}, {end}) for a text of length {size}.")
+        blocks = self._blocks
+        first_block, first, base = self._locate(start)
+        last_block, last, _ = self._locate(end)
+        segs = [seg for block in blocks[first_block:last_block + 1] for seg in block.segs]
+        last += sum(len(block.segs) for block in blocks[first_block:last_block])
+        at_end = last_block == len(blocks) - 1 and last == len(segs) - 1
+
+        region = ",".join(seg.text for seg in segs[first:last + 1])
+        region = region[:start - base] + new_text + region[end - base:]
+        segs[first:last + 1] = self._parse_pieces(region.split(","), at_end)
+
+        # Un bloque que se queda pequeño se une al siguiente
+        if len(segs) < BLOCK_SIZE // 2 and last_block + 1 < len(blocks):
+            last_block += 1
+            segs += blocks[last_block].segs
+        old = blocks[first_block:last_block + 1]
+        new = _make_blocks(segs, 2 * BLOCK_SIZE)
+        blocks[first_block:last_block + 1] = new
+        for sign, group in ((-1, old), (1, new)):
+            for block in group:
+                self._size += sign * block.chars
+                self._n_errors += sign * len(block.errors)
+                self._n_parsed += sign * block.parsed_any
+        if len(new) == len(old):
+            for k, (before, after) in enumerate(zip(old, new)):
+                self._chars.add(first_block + k, after.chars - before.chars)
+        else:
+            # Cambia el número de bloques (poco frecuente): se rehace el árbol
+            self._chars = _Fenwick([block.chars for block in blocks])
+        self._result = None
+        return self.result()
+
+    def insert(self, pos: int, new_text: str) -> ParseResult:
+        return self.edit(pos, pos, new_text)
+
+    def delete(self, start: int, end: int) -> ParseResult:
+        return self.edit(start, end, "")
+
+    def result(self) -> ParseResult:
+        """ParseResult del texto actual (igual al del análisis completo)."""
+        if self._result is not None:
+            return self._result
+        if self._n_errors:
+            # Copia de la lista de bloques (no de sus diagnósticos): los bloques
+            # no cambian, las ediciones los sustituyen en la lista
+            diagnostics = _ShiftedDiagnostics(list(self._blocks))
+            self._result = ParseResult(False, diagnostics)
+        else:
+            self._result = result_from_segments([], self._n_parsed > 0)
+        return self._result
+
+    # Internos
+
+    def _parse_pieces(self, pieces: list[str], at_end: bool) -> list[_Segment]:
+        """Analiza segmentos consecutivos; at_end indica si el último cierra el texto."""
+        self.reparsed = len(pieces)
+        last = len(pieces) - 1
+        return [_Segment(piece, at_end and k == last, self.parser_class)
+                for k, piece in enumerate(pieces)]
+
+    def _locate(self, pos: int) -> tuple[int, int, int]:
+        """
+        Segmento que contiene la posición pos (la coma final cuenta como
+        parte del segmento): índice del bloque, índice dentro del bloque y
+        desplazamiento en caracteres del inicio del segmento.
+        """
+        blocks = self._blocks
+        # pos < len(self) + 1, la suma de todos los bloques: b es un bloque válido
+        b, offset = self._chars.search(pos)
+        segs = blocks[b].segs
+        k = 0
+        while k < len(segs) - 1 and pos >= offset + len(segs[k].text) + 1:
+            offset += len(segs[k].text) + 1
+            k += 1
+        return b, k, offset
@@ -0,0 +1,268 @@
+# src/en_lexfile.py
+# Léxicos externos: formato de texto, índice binario y carga por mmap.
+#
+# Formato de texto (.lex): una lectura por línea, "PALABRA CATEGORÍA NÚMERO",
+# con comentarios '#'. Una palabra con varias lecturas aparece en varias
+# líneas, en orden de preferencia; las lecturas repetidas se descartan.
+#
+# El texto se compila una vez a un índice binario (.lex.idx, junto al
+# original, como un .pyc) que se abre con mmap: arrancar no exige leer ni
+# analizar el léxico completo, solo la cabecera. Disposición del índice
+# (enteros sin signo de 32 bits en el orden de bytes de la máquina):
+#   cabecera       HEADER (ver abajo)
+#   key_offsets    n_words + 1   inicio de cada palabra en 'blob'
+#   read_offsets   n_words + 1   inicio de las lecturas de cada palabra
+#   slots          n_slots       tabla hash abierta: id de palabra + 1 (0 = libre)
+#   readings       2 * n_readings bytes (Cat, Num), rellenado a 4 bytes
+#   blob           palabras en UTF-8, ordenadas y concatenadas
+# El id de una palabra es su índice en el orden alfabético.
+#
+#   python -m src.en_lexfile build src/data/en.lex [-o salida.idx]
+#   python -m src.en_lexfile lookup src/data/en.lex work
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterator, Mapping
+from zlib import crc32
+
+# Versión del formato binario; cambiarla invalida los índices existentes
+FORMAT_VERSION = 1
+_MAGIC = b"ENLEX\x00" + (b"LE" if sys.byteorder == "little" else b"BE")
+# magic, versión, n_words, n_readings, n_slots, tamaño de blob, mtime_ns y
+# tamaño del texto de origen (para detectar índices obsoletos)
+HEADER = struct.Struct("=8sIIIIIqq")
+
+INDEX_SUFFIX = ".idx"
+
+def parse_lexicon_text(lines, categories, numbers, source="<lexicon>") -> dict:
+    """
+    Lee el formato de texto y devuelve {palabra: [(cat, num), ...]} con los
+    códigos enteros de 'categories' y 'numbers' (secuencias de nombres).
+    """
+    cat_codes = {name: code for code, name in enumerate(categories)}
+    num_codes = {name: code for code, name in enumerate(numbers)}
+    entries = {}
+    for lineno, line in enumerate(lines, start=1):
+        fields = line.split("#", 1)[0].split()
+        if not fields:
+            continue
+        if len(fields) != 3:
+            raise ValueError(f"{source}:{lineno}: expected 'WORD CATEGORY NUMBER', found {line.strip()!r}")
+        word, cat, num = fields
+        if cat not in cat_codes or num not in num_codes:
+            raise ValueError(f"{source}:{lineno}: unknown category or number in {line.strip()!r}")
+        reading = (cat_codes[cat], num_codes[num])
+        readings = entries.setdefault(word.lower(), [])
+        if reading not in readings:
+            readings.append(reading)
+    return entries
+
+def build_index(entries: dict, source_stat: tuple = (0, 0)) -> bytes:
+    """Serializa {palabra: [(cat, num), ...]} al formato binario del índice."""
+    words = sorted(entries)
+    key_offsets = array("I", [0])
+    read_offsets = array("I", [0])
+    readings = bytearray()
+    blob = bytearray()
+    encoded = []
+    for word in words:
+        key = word.encode("utf-8")
+        encoded.append(key)
+        blob += key
+        key_offsets.append(len(blob))
+        for cat, num in entries[word]:
+            readings += bytes((cat, num))
+        read_offsets.append(len(readings) // 2)
+    readings += b"\x00" * (-len(readings) % 4)
+
+    # Tabla hash con sondeo lineal y factor de carga <= 0.5
+    n_slots = 1
+    while n_slots < 2 * len(words):
+        n_slots *= 2
+    mask = n_slots - 1
+    slots = array("I", bytes(4 * n_slots))
+    for wid, key in enumerate(encoded):
+        h = crc32(key) & mask
+        while slots[h]:
+            h = (h + 1) & mask
+        slots[h] = wid + 1
+
+    header = HEADER.pack(_MAGIC, FORMAT_VERSION, len(words), read_offsets[-1], n_slots,
+                         len(blob), *source_stat)
+    return b"".join((header, key_offsets.tobytes(), read_offsets.tobytes(),
+                     slots.tobytes(), bytes(readings), bytes(blob)))
+
+class MappedLexicon(Mapping):
+    """
+    Léxico sobre un índice binario (normalmente un mmap de solo lectura).
+    Como Mapping asocia cada palabra con su lectura principal en nombres,
+    (categoría, número), igual que el antiguo diccionario LEXICON; readings()
+    y find() dan acceso a todas las lecturas y a los códigos enteros.
+    """
+
+    def __init__(self, buffer, categories, numbers, path=None):
+        self.path = path
+        self.categories = tuple(categories)
+        self.numbers = tuple(numbers)
+        self._buffer = buffer
+        (magic, version, n_words, n_readings, n_slots,
+         blob_size, *_) = HEADER.unpack_from(buffer, 0)
+        if magic != _MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path or 'buffer'}: not a lexicon index (version {FORMAT_VERSION}).")
+        view = memoryview(buffer)
+        start = HEADER.size
+        end = start + 4 * (n_words + 1)
+        self._key_offsets = view[start:end].cast("I")
+        start, end = end, end + 4 * (n_words + 1)
+        self._read_offsets = view[start:end].cast("I")
+        start, end = end, end + 4 * n_slots
+        self._slots = view[start:end].cast("I")
+        start, end = end, end + 2 * n_readings + (-2 * n_readings % 4)
+        self._readings = view[start:end]
+        self._blob_start = end
+        self._mask = n_slots - 1
+        self._n_words = n_words
+
+    # Acceso por id
+
+    def word(self, wid: int) -> str:
+        base = self._blob_start
+        ko = self._key_offsets
+        return str(self._buffer[base + ko[wid]:base + ko[wid + 1]], "utf-8")
+
+    def readings_of(self, wid: int) -> list[tuple[int, int]]:
+        """Lecturas (código de categoría, código de número) de la palabra wid."""
+        r = self._readings
+        ro = self._read_offsets
+        return [(r[2 * k], r[2 * k + 1]) for k in range(ro[wid], ro[wid + 1])]
+
+    # Búsqueda
+
+    def find(self, word: str) -> int:
+        """Id de la palabra o -1 si no está en el léxico."""
+        try:
+            key = word.encode("utf-8")
+        except UnicodeEncodeError:
+            return -1
+        slots = self._slots
+        ko = self._key_offsets
+        buf = self._buffer
+        base = self._blob_start
+        mask = self._mask
+        h = crc32(key) & mask
+        while True:
+            wid = slots[h] - 1
+            if wid < 0:
+                return -1
+            if buf[base + ko[wid]:base + ko[wid + 1]] == key:
+                return wid
+            h = (h + 1) & mask
+
+    def readings(self, word: str) -> list[tuple[str, str]]:
+        """Todas las lecturas de la palabra, en nombres y por orden de preferencia."""
+        wid = self.find(word)
+        if wid < 0:
+            return []
+        return [(self.categories[c], self.numbers[n]) for c, n in self.readings_of(wid)]
+
+    # Interfaz Mapping (lectura principal)
+
+    def __getitem__(self, word: str) -> tuple[str, str]:
+        wid = self.find(word)
+        if wid < 0:
+            raise KeyError(word)
+        cat, num = self.readings_of(wid)[0]
+        return self.categories[cat], self.numbers[num]
+
+    def __contains__(self, word) -> bool:
+        return isinstance(word, str) and self.find(word) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        """Palabras en orden alfabético."""
+        return (self.word(wid) for wid in range(self._n_words))
+
+    def __len__(self) -> int:
+        return self._n_words
+
+    def content_bytes(self) -> memoryview:
+        """Índice sin la cabecera: identifica el contenido del léxico."""
+        return memoryview(self._buffer)[HEADER.size:]
+
+def index_path(source: str) -> str:
+    return source + INDEX_SUFFIX
+
+def _source_stat(source: str) -> tuple:
+    st = os.stat(source)
+    return st.st_mtime_ns, st.st_size
+
+def _index_is_fresh(path: str, stat: tuple) -> bool:
+    try:
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+    except OSError:
+        return False
+    if len(header) != HEADER.size:
+        return False
+    magic, version, *_, mtime_ns, size = HEADER.unpack(header)
+    return magic == _MAGIC and version == FORMAT_VERSION and (mtime_ns, size) == stat
+
+def compile_lexicon(source: str, categories, numbers, dest: str = None) -> bytes:
+    """Compila el texto 'source' y escribe el índice en 'dest' (si se indica)."""
+    stat = _source_stat(source)
+    with open(source, "r", encoding="utf-8") as f:
+        entries = parse_lexicon_text(f, categories, numbers, source)
+    data = build_index(entries, stat)
+    if dest is not None:
+        tmp = f"{dest}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, dest)
+    return data
+
+def load_lexicon(source: str, categories, numbers) -> MappedLexicon:
+    """
+    Abre el léxico de texto 'source' a través de su índice. Si el índice no
+    existe o es anterior al texto, se recompila; si no se puede escribir junto
+    al texto, se usa una copia en memoria.
+    """
+    dest = index_path(source)
+    stat = _source_stat(source)
+    if not _index_is_fresh(dest, stat):
+        try:
+            compile_lexicon(source, categories, numbers, dest)
+        except OSError:
+            data = compile_lexicon(source, categories, numbers)
+            return MappedLexicon(data, categories, numbers, source)
+    with open(dest, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return MappedLexicon(buffer, categories, numbers, source)
+
+def main():
+    import argparse
+    from src.en_lexicon import CATEGORIES, NUMBERS
+
+    ap = argparse.ArgumentParser(prog="python -m src.en_lexfile")
+    sub = ap.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Compilar un léxico de texto a su índice")
+    build.add_argument("source")
+    build.add_argument("-o", "--output", help=f"Índice de salida (por defecto SOURCE{INDEX_SUFFIX})")
+    lookup = sub.add_parser("lookup", help="Mostrar las lecturas de palabras")
+    lookup.add_argument("source")
+    lookup.add_argument("words", nargs="+")
+    args = ap.parse_args()
+
+    if args.command == "build":
+        dest = args.output or index_path(args.source)
+        data = compile_lexicon(args.source, CATEGORIES, NUMBERS, dest)
+        n_words = HEADER.unpack_from(data, 0)[2]
+        print(f"{dest}: {n_words} palabras, {len(data)} bytes")
+    else:
+        lexicon = load_lexicon(args.source, CATEGORIES, NUMBERS)
+        for word in args.words:
+            readings = lexicon.readings(word.lower())
+            print(f"{word}: {', '.join(f'{c}/{n}' for c, n in readings) or '(desconocida)'}")
+
+if __name__ == "__main__":
+    main()
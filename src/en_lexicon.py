@@ -1,257 +1,296 @@
 # Vocabulario reducido para inglés + tokenización
-from dataclasses import dataclass
+import os
+import sys
+from array import array
+from enum import IntEnum
+from src.en_lexfile import MappedLexicon, load_lexicon
 
 class LexicalError(Exception):
-    pass
+    """
+    Palabra desconocida; conserva la primera palabra y su posición, y en
+    'unknown' todas las palabras desconocidas de la entrada como (palabra, posición).
+    """
+    def __init__(self, word: str, pos: int, unknown: list[tuple[str, int]] = None):
+        super().__init__(f"Unknown word '{word}' at position {pos}")
+        self.word = word
+        self.pos = pos
+        self.unknown = unknown or [(word, pos)]
+
+class _CodeEnum(IntEnum):
+    """Código entero pequeño que se imprime con su nombre en los mensajes."""
+    def __str__(self):
+        return self.name
+
+    def __format__(self, spec):
+        return format(self.name, spec)
+
+class Cat(_CodeEnum):
+    """Categoría gramatical."""
+    COMMA = 0
+    DET = 1
+    PRON = 2
+    N = 3
+    V = 4
+    AUX = 5
+    ADJ = 6
+    PREP = 7
+
+class Num(_CodeEnum):
+    """Rasgo de número."""
+    ANY = 0
+    SG = 1      # Singular
+    PL = 2      # Plural
+    SGC = 3     # Singular Contable
+    UNC = 4     # No Contable
+    COLL = 5    # Colectivo
 
-@dataclass
 class Token:
-    word: str   # Palabra original
-    cat: str    # Categoría gramatical: DET, N, PRON, V, ADJ, PREP, AUX
-    num: str    # Singular SG, Plural PL, ANY, Singular Contable SGC, No Contable UNC, Colectivo COLL
-    pos: int    # Posición en la oración (1,2,3,...)
-
-
-LEXICON = {
-    # Elemento de sincronizacion
-    ",":     ("COMMA", "ANY"),
-
-    # Determinantes
-    "the":   ("DET", "ANY"),
-    "a":     ("DET", "SG"),
-    "an":    ("DET", "SG"),
-    "this":  ("DET", "SG"),
-    "that":  ("DET", "SG"),
-    "these": ("DET", "PL"),
-    "those": ("DET", "PL"),
-
-    # Pronombres
-    "i":     ("PRON", "PL"),
-    "you":   ("PRON", "PL"),
-    "we":    ("PRON", "PL"),
-    "they":  ("PRON", "PL"),
-    "he":    ("PRON", "SG"),
-    "she":   ("PRON", "SG"),
-    "it":    ("PRON", "SG"),
-
-    # Nombres | Clasificados por singular, plural, contable, no contable, etc
-    "time":      ("N", "UNC"),
-    "year":      ("N", "SGC"),
-    "people":    ("N", "PL"),
-    "day":       ("N", "SGC"),
-    "man":       ("N", "SGC"),
-    "men":       ("N", "PL"),
-    "woman":     ("N", "SGC"),
-    "women":     ("N", "PL"),
-    "child":     ("N", "SGC"),
-    "children":  ("N", "PL"),
-    "world":     ("N", "SGC"),
-    "school":    ("N", "SGC"),
-    "state":     ("N", "SGC"),
-    "family":    ("N", "COLL"),
-    "student":   ("N", "SGC"),
-    "students":  ("N", "PL"),
-    "group":     ("N", "COLL"),
-    "country":   ("N", "SGC"),
-    "problem":   ("N", "SGC"),
-    "hand":      ("N", "SGC"),
-    "part":      ("N", "SGC"),
-    "place":     ("N", "SGC"),
-    "case":      ("N", "SGC"),
-    "company":   ("N", "SGC"),
-    "system":    ("N", "SGC"),
-    "program":   ("N", "SGC"),
-    "question":  ("N", "SGC"),
-    "work":      ("N", "UNC"),
-    "number":    ("N", "SGC"),
-    "night":     ("N", "SGC"),
-    "home":      ("N", "SGC"),
-    "room":      ("N", "SGC"),
-    "fact":      ("N", "SGC"),
-    "water":     ("N", "UNC"),
-    "car":       ("N", "SGC"),
-    "cars":      ("N", "PL"),
-    "house":     ("N", "SGC"),
-    "houses":    ("N", "PL"),
-    "friend":    ("N", "SGC"),
-    "friends":   ("N", "PL"),
-    "father":    ("N", "SGC"),
-    "mother":    ("N", "SGC"),
-    "boy":       ("N", "SGC"),
-    "boys":      ("N", "PL"),
-    "girl":      ("N", "SGC"),
-    "girls":     ("N", "PL"),
-    "apple":     ("N", "SGC"),
-    "apples":    ("N", "PL"),
-    "book":      ("N", "SGC"),
-    "books":     ("N", "PL"),
-    "city":      ("N", "SGC"),
-    "cities":    ("N", "PL"),
-    "job":       ("N", "SGC"),
-    "jobs":      ("N", "PL"),
-    "money":     ("N", "UNC"),
-    "story":     ("N", "SGC"),
-    "stories":   ("N", "PL"),
-    "childhood": ("N", "UNC"),
-    "food":      ("N", "UNC"),
-    "door":      ("N", "SGC"),
-    "table":     ("N", "SGC"),
-    "dog":      ("N", "SGC"),
-    "cat":      ("N", "SGC"),
-    "student":  ("N", "SGC"),
-    "teacher":  ("N", "SGC"),
-    "apple":    ("N", "SGC"),
-    "book":     ("N", "SGC"),
-    "ball":     ("N", "SGC"),   
-    "car":      ("N", "SGC"),
-    "boy":      ("N", "SGC"),
-    "girl":     ("N", "SGC"),
-    "dogs":     ("N", "PL"),
-    "cats":     ("N", "PL"),
-    "students": ("N", "PL"),
-    "teachers": ("N", "PL"),
-    "apples":   ("N", "PL"),
-    "books":    ("N", "PL"),
-    "cars":     ("N", "PL"),
-    "boys":     ("N", "PL"),
-    "girls":    ("N", "PL"),
-
-    # Verbos en presente simple
-
-    # be (irregular, presente)
-    "am":   ("V", "PL"),
-    "are":  ("V", "PL"),
-    "is":   ("V", "SG"),
-
-    # have
-    "have": ("V", "PL"),
-    "has":  ("V", "SG"),
-
-    # do
-    "do":   ("V", "PL"),
-    "does": ("V", "SG"),
-
-    "read":   ("V", "PL"), "reads":  ("V", "SG"),
-    "drink":  ("V", "PL"), "drinks": ("V", "SG"),
-    "go":   ("V", "PL"), "goes": ("V", "SG"),
-    "say":  ("V", "PL"), "says": ("V", "SG"),
-    "get":  ("V", "PL"), "gets": ("V", "SG"),
-    "make": ("V", "PL"), "makes":("V", "SG"),
-    "know": ("V", "PL"), "knows":("V", "SG"),
-    "think": ("V", "PL"), "thinks":("V", "SG"),
-    "take":  ("V", "PL"), "takes": ("V", "SG"),
-    "see":   ("V", "PL"), "sees":  ("V", "SG"),
-    "come":  ("V", "PL"), "comes": ("V", "SG"),
-    "want":  ("V", "PL"), "wants": ("V", "SG"),
-    "use":   ("V", "PL"), "uses":  ("V", "SG"),
-    "find":  ("V", "PL"), "finds": ("V", "SG"),
-    "give":  ("V", "PL"), "gives": ("V", "SG"),
-    "tell":  ("V", "PL"), "tells": ("V", "SG"),
-    "work":  ("V", "PL"), "works": ("V", "SG"),
-    "call":  ("V", "PL"), "calls": ("V", "SG"),
-    "try":   ("V", "PL"), "tries": ("V", "SG"),
-    "ask":   ("V", "PL"), "asks":  ("V", "SG"),
-    "need":  ("V", "PL"), "needs": ("V", "SG"),
-    "feel":  ("V", "PL"), "feels": ("V", "SG"),
-    "become":  ("V", "PL"), "becomes": ("V", "SG"),
-    "leave": ("V", "PL"), "leaves":("V", "SG"),
-    "put":  ("V", "PL"), "puts": ("V", "SG"),
-    "mean":  ("V", "PL"), "means": ("V", "SG"),
-    "keep":  ("V", "PL"), "keeps": ("V", "SG"),
-    "let":   ("V", "PL"), "lets":  ("V", "SG"),
-    "begin":  ("V", "PL"), "begins": ("V", "SG"),
-    "seem":  ("V", "PL"), "seems": ("V", "SG"),
-    "help":  ("V", "PL"), "helps": ("V", "SG"),
-    "talk":  ("V", "PL"), "talks": ("V", "SG"),
-    "turn":  ("V", "PL"), "turns": ("V", "SG"),
-    "start": ("V", "PL"), "starts":("V", "SG"),
-    "show":  ("V", "PL"), "shows": ("V", "SG"),
-    "hear":  ("V", "PL"), "hears": ("V", "SG"),
-    "play":  ("V", "PL"), "plays": ("V", "SG"),
-    "run":   ("V", "PL"), "runs":  ("V", "SG"),
-    "move":  ("V", "PL"), "moves": ("V", "SG"),
-    "like":  ("V", "PL"), "likes": ("V", "SG"),
-    "live":  ("V", "PL"), "lives": ("V", "SG"),
-    "believe": ("V", "PL"), "believes":("V", "SG"),
-    "hold":  ("V", "PL"), "holds": ("V", "SG"),
-    "bring": ("V", "PL"), "brings":("V", "SG"),
-    "happen": ("V", "PL"), "happens":("V", "SG"),
-    "write": ("V", "PL"), "writes":("V", "SG"),
-    "provide": ("V", "PL"), "provides":("V", "SG"),
-    "sit":   ("V", "PL"), "sits":  ("V", "SG"),
-    "stand": ("V", "PL"), "stands":("V", "SG"),
-    "lose":  ("V", "PL"), "loses": ("V", "SG"),
-    "pay":   ("V", "PL"), "pays":  ("V", "SG"),
-    "meet":  ("V", "PL"), "meets": ("V", "SG"),
-    "include": ("V", "PL"), "includes":("V", "SG"),
-    "continue": ("V", "PL"), "continues":("V", "SG"),
-    "learn": ("V", "PL"), "learns":("V", "SG"),
-    "change": ("V", "PL"), "changes":("V", "SG"),
-    "understand": ("V", "PL"), "understands":("V", "SG"),
-    "watch": ("V", "PL"), "watches":("V", "SG"),
-    "stop":  ("V", "PL"), "stops": ("V", "SG"),
-    "create": ("V", "PL"), "creates":("V", "SG"),
-    "eat":    ("V", "PL"), "eats":   ("V", "SG"),
-
-    # Auxiliares| modales, presente simple
-    "can":  ("AUX", "ANY"),
-    "may":  ("AUX", "ANY"),
-    "must": ("AUX", "ANY"),
-
-    # Adjetivos
-    "other":     ("ADJ", "ANY"), "new":       ("ADJ", "ANY"),
-    "good":      ("ADJ", "ANY"), "high":      ("ADJ", "ANY"),
-    "old":       ("ADJ", "ANY"), "great":     ("ADJ", "ANY"),
-    "big":       ("ADJ", "ANY"), "small":     ("ADJ", "ANY"),
-    "large":     ("ADJ", "ANY"), "young":     ("ADJ", "ANY"),
-    "different": ("ADJ", "ANY"), "long":      ("ADJ", "ANY"),
-    "little":    ("ADJ", "ANY"), "important": ("ADJ", "ANY"),
-    "bad":       ("ADJ", "ANY"), "right":     ("ADJ", "ANY"),
-    "early":     ("ADJ", "ANY"), "able":      ("ADJ", "ANY"),
-    "happy":     ("ADJ", "ANY"), "sad":       ("ADJ", "ANY"),
-    "black":     ("ADJ", "ANY"), "white":     ("ADJ", "ANY"),
-    "real":      ("ADJ", "ANY"), "best":      ("ADJ", "ANY"),
-    "public":    ("ADJ", "ANY"), "sure":      ("ADJ", "ANY"),
-    "low":       ("ADJ", "ANY"), "local":     ("ADJ", "ANY"),
-    "late":      ("ADJ", "ANY"), "human":     ("ADJ", "ANY"),
-    "strong":    ("ADJ", "ANY"), "weak":      ("ADJ", "ANY"),
-    "beautiful": ("ADJ", "ANY"), "ugly":      ("ADJ", "ANY"),
-    "easy":      ("ADJ", "ANY"), "difficult": ("ADJ", "ANY"),
-    "hot":       ("ADJ", "ANY"), "cold":      ("ADJ", "ANY"),
-    "fast":      ("ADJ", "ANY"), "slow":      ("ADJ", "ANY"),
-    "busy":      ("ADJ", "ANY"), "free":      ("ADJ", "ANY"),
-    "clean":     ("ADJ", "ANY"), "dirty":     ("ADJ", "ANY"),
-    "full":      ("ADJ", "ANY"), "empty":     ("ADJ", "ANY"),
-
-    # Preposiciones
-    "in":    ("PREP", "ANY"), "on":    ("PREP", "ANY"),
-    "under": ("PREP", "ANY"), "with":  ("PREP", "ANY"),
-    "near":  ("PREP", "ANY"), "from":  ("PREP", "ANY"),
-    "to":    ("PREP", "ANY"), "at":    ("PREP", "ANY"),
-    "for":   ("PREP", "ANY"),
-}
-
-def tokenize_sentence(sentence: str):
+    """
+    Token de la oración. Clase escrita a mano (en lugar de un dataclass) para
+    no importar dataclasses al arrancar; se compara por valor como antes.
+      word  Palabra original (cadena compartida con la entrada del léxico)
+      cat   Categoría gramatical: DET, N, PRON, V, ADJ, PREP, AUX
+            (None en los tokens de error de palabras desconocidas)
+      num   Singular SG, Plural PL, ANY, Singular Contable SGC, No Contable UNC, Colectivo COLL
+      pos   Posición en la oración (1,2,3,...)
+    """
+    __slots__ = ("word", "cat", "num", "pos")
+
+    def __init__(self, word: str, cat: Cat, num: Num, pos: int):
+        self.word = word
+        self.cat = cat
+        self.num = num
+        self.pos = pos
+
+    def __repr__(self):
+        return f"Token(word={self.word!r}, cat={self.cat!r}, num={self.num!r}, pos={self.pos!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return ((self.word, self.cat, self.num, self.pos)
+                == (other.word, other.cat, other.num, other.pos))
+
+    __hash__ = None
+
+# TOKENIZADOR COMPILADO
+# Nombres de categorías y rasgos de número, indexados por su código entero.
+CATEGORIES = tuple(c.name for c in Cat)
+NUMBERS = tuple(n.name for n in Num)
+
+# Código centinela que cierra la columna de categorías de un TokenColumns
+END_OF_INPUT = 0xFF
+# Código de categoría de los tokens de error (palabras desconocidas)
+UNKNOWN_WORD = 0xFE
+
+def _split_words(sentence: str) -> list[str]:
+    """
+    Separa la oración en palabras en una sola pasada a nivel C.
+    (Un escáner con expresiones regulares resultó más lento que str.split.)
+    """
+    return sentence.replace(",", " , ").lower().split()
+
+def normalize_sentence(sentence: str) -> str:
+    """
+    Forma canónica de una oración: palabras en minúscula separadas por un
+    espacio y comas aisladas. Dos oraciones con la misma forma canónica producen
+    exactamente los mismos tokens (incluidas las posiciones).
+    """
+    return " ".join(_split_words(sentence))
+
+# LÉXICO
+# El vocabulario vive en un archivo de texto (src/data/en.lex, o el indicado
+# en la variable de entorno EN_LEXICON) que se abre a través de su índice
+# binario con mmap (ver src/en_lexfile.py). LEXICON se comporta como el
+# antiguo diccionario {palabra: (categoría, número)} con la lectura principal
+# de cada palabra; LEXICON.readings(palabra) devuelve todas.
+DEFAULT_LEXICON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "en.lex")
+
+# Entradas ya resueltas (palabra, Cat, Num, id, lecturas) de las palabras
+# consultadas. La palabra se interna, así que todos los tokens de una misma
+# palabra referencian la misma cadena y los mismos miembros Cat/Num. El id es
+# el de la palabra en el índice (LEXICON.word(id) la recupera). 'lecturas' es
+# None si la palabra tiene una sola lectura y, si no, la tupla de todas sus
+# lecturas (Cat, Num) empezando por la principal.
+_TABLE = {}
+_CATS = tuple(Cat)
+_NUMS = tuple(Num)
+
+def use_lexicon(path: str) -> MappedLexicon:
+    """Activa el léxico de texto 'path' para el tokenizador y LEXICON."""
+    global LEXICON
+    LEXICON = load_lexicon(path, CATEGORIES, NUMBERS)
+    _TABLE.clear()
+    return LEXICON
+
+def _lookup(word: str):
+    """
+    Busca la palabra en el índice y memoriza su entrada en _TABLE.
+    Devuelve None si la palabra no existe.
+    """
+    wid = LEXICON.find(word)
+    if wid < 0:
+        return None
+    readings = tuple((_CATS[cat], _NUMS[num]) for cat, num in LEXICON.readings_of(wid))
+    word = sys.intern(word)
+    cat, num = readings[0]
+    entry = _TABLE[word] = (word, cat, num, wid, readings if len(readings) > 1 else None)
+    return entry
+
+LEXICON = use_lexicon(os.environ.get("EN_LEXICON") or DEFAULT_LEXICON_PATH)
+
+def tokenize_sentence(sentence: str, strict: bool = True):
     """
     Recibe una oración en inglés y devuelve lista de Tokens.
-    Llama a LexicalError si encuentra una palabra desconocida.
+    Recorre la oración completa reuniendo las palabras desconocidas: con
+    strict=True lanza después LexicalError (con todas en 'unknown'); con
+    strict=False cada una queda como token de error (cat None) para que el
+    parser descarte solo su oración.
     """
-    # Separar comas para que sean tokens independientes
-    processed_sentence = sentence.replace(",", " , ")
-    words = processed_sentence.strip().lower().split()
+    table = _TABLE
     tokens = []
+    unknown = []
 
-    for i, w in enumerate(words, start=1):
-        # Quitamos puntuación simple excepto la coma
-        clean = w.strip(".!?")
-        if not clean:
-            continue # Palabra vacía tras limpiar la puntuación
+    for i, w in enumerate(_split_words(sentence), start=1):
+        entry = table.get(w) or _lookup(w)
+        if entry is None:
+            # Quitamos puntuación simple excepto la coma
+            clean = w.strip(".!?")
+            if not clean:
+                continue # Palabra vacía tras limpiar la puntuación
+            entry = table.get(clean) or _lookup(clean)
+            if entry is None:
+                unknown.append((clean, i))
+                tokens.append(Token(clean, None, Num.ANY, i))
+                continue
+
+        tokens.append(Token(entry[0], entry[1], entry[2], i))
+
+    if unknown and strict:
+        raise LexicalError(*unknown[0], unknown)
+    return tokens
+
+class TokenColumns:
+    """
+    Flujo de tokens de un documento completo en columnas paralelas de arrays
+    tipados: categoría y número ('B'), id de palabra y posición ('I').
+    La columna de categorías lleva un centinela END_OF_INPUT al final, así el
+    parser puede leer cats[i] sin comprobar límites. 'commas' guarda los
+    índices de las comas para que la recuperación en modo pánico salte
+    directamente al siguiente punto de sincronización.
+    Las columnas llevan la lectura principal de cada token; 'alts' asocia el
+    índice de cada token ambiguo con todas sus lecturas (Cat, Num).
+    Las palabras desconocidas son tokens de error: categoría UNKNOWN_WORD, id
+    de palabra 0 y la palabra en 'unknown' ({índice: palabra}, en orden).
+    Los Token de from_tokens cuya palabra no está en el léxico activo (p. ej.
+    creados antes de use_lexicon) conservan su categoría, llevan id 0 y
+    guardan la palabra en 'words'.
+    """
+    __slots__ = ("cats", "nums", "word_ids", "positions", "commas", "alts", "unknown", "words")
+
+    def __init__(self):
+        self.cats = array("B")
+        self.nums = array("B")
+        self.word_ids = array("I")
+        self.positions = array("I")
+        self.commas = array("I")
+        self.alts = {}
+        self.unknown = {}
+        self.words = {}
+
+    @classmethod
+    def from_tokens(cls, tokens: list[Token]) -> "TokenColumns":
+        cols = cls()
+        cols.unknown = {k: t.word for k, t in enumerate(tokens) if t.cat is None}
+        cols.cats.extend(UNKNOWN_WORD if t.cat is None else t.cat for t in tokens)
+        cols.nums.extend(t.num for t in tokens)
+        for k, t in enumerate(tokens):
+            entry = None if t.cat is None else _TABLE.get(t.word) or _lookup(t.word)
+            if entry is None:
+                if t.cat is not None:
+                    cols.words[k] = t.word
+                cols.word_ids.append(0)
+            else:
+                cols.word_ids.append(entry[3])
+                # Lecturas alternativas, como tokenize_columns, si el token lleva la principal
+                if entry[4] is not None and t.cat is entry[1] and t.num is entry[2]:
+                    cols.alts[k] = entry[4]
+        cols.positions.extend(t.pos for t in tokens)
+        cols.commas.extend(k for k, t in enumerate(tokens) if t.cat is Cat.COMMA)
+        cols.cats.append(END_OF_INPUT)
+        return cols
+
+    def slice(self, start: int, end: int) -> "TokenColumns":
+        """
+        Columnas de los tokens [start, end), con su propio centinela. Las
+        posiciones e ids de palabra se conservan, así que los diagnósticos
+        de un trozo son los mismos que los del flujo completo.
+        """
+        cols = TokenColumns()
+        cols.cats = self.cats[start:end]
+        cols.cats.append(END_OF_INPUT)
+        cols.nums = self.nums[start:end]
+        cols.word_ids = self.word_ids[start:end]
+        cols.positions = self.positions[start:end]
+        cols.commas = array("I", (k - start for k in self.commas if start <= k < end))
+        cols.alts = {k - start: r for k, r in self.alts.items() if start <= k < end}
+        cols.unknown = {k - start: w for k, w in self.unknown.items() if start <= k < end}
+        cols.words = {k - start: w for k, w in self.words.items() if start <= k < end}
+        return cols
+
+    def __len__(self):
+        return len(self.positions)
+
+    def word(self, i: int) -> str:
+        if self.cats[i] == UNKNOWN_WORD:
+            return self.unknown[i]
+        if self.words and i in self.words:
+            return self.words[i]
+        return LEXICON.word(self.word_ids[i])
+
+    def token(self, i: int) -> Token:
+        """Materializa el token i (solo para mensajes o depuración)."""
+        cat = self.cats[i]
+        return Token(self.word(i), None if cat == UNKNOWN_WORD else Cat(cat), Num(self.nums[i]),
+                     self.positions[i])
+
+def tokenize_columns(text: str, strict: bool = True) -> TokenColumns:
+    """
+    Variante de tokenize_sentence que no construye objetos Token: tokeniza el
+    texto completo una sola vez y escribe directamente en un TokenColumns.
+    Las palabras desconocidas se tratan como en tokenize_sentence.
+    """
+    table = _TABLE
+    cols = TokenColumns()
+    cats, nums, word_ids, positions = cols.cats, cols.nums, cols.word_ids, cols.positions
+    comma = Cat.COMMA
 
-        entry = LEXICON.get(clean)
+    for i, w in enumerate(_split_words(text), start=1):
+        entry = table.get(w) or _lookup(w)
         if entry is None:
-            raise LexicalError(f"Unknown word '{clean}' at position {i}")
+            clean = w.strip(".!?")
+            if not clean:
+                continue
+            entry = table.get(clean) or _lookup(clean)
+            if entry is None:
+                cols.unknown[len(positions)] = clean
+                cats.append(UNKNOWN_WORD)
+                nums.append(Num.ANY)
+                word_ids.append(0)
+                positions.append(i)
+                continue
 
-        cat, num = entry
-        tokens.append(Token(word=clean, cat=cat, num=num, pos=i))
+        if entry[1] is comma:
+            cols.commas.append(len(positions))
+        elif entry[4] is not None:
+            cols.alts[len(positions)] = entry[4]
+        cats.append(entry[1])
+        nums.append(entry[2])
+        word_ids.append(entry[3])
+        positions.append(i)
 
-    return tokens
\ No newline at end of file
+    cats.append(END_OF_INPUT)
+    if cols.unknown and strict:
+        unknown = [(w, positions[k]) for k, w in cols.unknown.items()]
+        raise LexicalError(*unknown[0], unknown)
+    return cols
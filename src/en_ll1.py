@@ -0,0 +1,263 @@
+# ==============================================================================
+# MOTOR LL(1) DIRIGIDO POR TABLA
+#
+# Alternativa a las reglas recursivas de RDEnParser: la gramática se describe
+# de forma declarativa (GRAMMAR), se calculan los conjuntos FIRST/FOLLOW y la
+# tabla LL(1), y cada oración S se analiza con una pila explícita.
+#
+# Las validaciones semánticas se expresan como acciones (@...) dentro de las
+# producciones y trabajan sobre una pila de valores:
+#   @pron       apila el número del pronombre recién consumido.
+#   @det        apila el índice del determinante recién consumido.
+#   @det_noun   desapila el determinante, valida la concordancia DET-N y apila
+#               el número del NP.
+#   @bare_noun  valida la restricción 'Bare Noun' y apila el número del NP.
+#   @verb       desapila el número del sujeto y valida la concordancia S-V.
+#   @drop       descarta el número de un NP que no es sujeto.
+#
+# Resolución de conflictos:
+#   - PPList -> PP PPList | ε entra en conflicto con PREP (FOLLOW(PPList)
+#     contiene PREP). Se prefiere la producción no vacía, igual que el bucle
+#     'while PREP' del parser recursivo.
+#   - Un no terminal anulable (o con una sola producción) usa esa producción
+#     por defecto ante cualquier otro símbolo, de modo que el error se detecta
+#     en el mismo token y con el mismo registro de error que en RDEnParser.
+# ==============================================================================
+
+from typing import Dict, List, Set, Tuple
+from src.en_lexicon import CATEGORIES, END_OF_INPUT, Cat
+from src.en_parser import E_NP_END, E_NP_START, RDEnParser
+
+EPSILON = ()
+END = "$"
+
+GRAMMAR: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("Program", ("S", "SList")),
+    ("SList",   ("COMMA", "S", "SList")),
+    ("SList",   EPSILON),
+    ("S",       ("NP", "VP")),
+    ("NP",      ("PRON", "@pron")),
+    ("NP",      ("DET", "@det", "AdjList", "N", "@det_noun", "PPList")),
+    ("NP",      ("N", "@bare_noun", "PPList")),
+    ("AdjList", ("ADJ", "AdjList")),
+    ("AdjList", EPSILON),
+    ("PPList",  ("PP", "PPList")),
+    ("PPList",  EPSILON),
+    ("PP",      ("PREP", "NP", "@drop")),
+    ("VP",      ("AuxList", "V", "@verb", "VPBody")),
+    ("AuxList", ("AUX", "AuxList")),
+    ("AuxList", EPSILON),
+    ("VPBody",  ("NP", "@drop", "PPList")),
+    ("VPBody",  ("PPList",)),
+    ("VPBody",  EPSILON),
+)
+START = "Program"
+# El bucle de modo pánico (heredado de RDEnParser) implementa Program;
+# la pila explícita analiza cada oración a partir de S.
+SENTENCE = "S"
+
+# CONSTRUCCIÓN DE CONJUNTOS Y TABLA
+
+def nonterminals(grammar) -> List[str]:
+    seen = []
+    for lhs, _ in grammar:
+        if lhs not in seen:
+            seen.append(lhs)
+    return seen
+
+def _is_action(sym: str) -> bool:
+    return sym.startswith("@")
+
+def first_sets(grammar) -> Dict[str, Set[str]]:
+    """FIRST de cada no terminal; la cadena vacía '' marca que es anulable."""
+    nts = set(nonterminals(grammar))
+    first = {nt: set() for nt in nts}
+    changed = True
+    while changed:
+        changed = False
+        for lhs, rhs in grammar:
+            before = len(first[lhs])
+            first[lhs] |= first_of_sequence(rhs, first, nts)
+            changed |= len(first[lhs]) != before
+    return first
+
+def first_of_sequence(seq, first, nts) -> Set[str]:
+    out = set()
+    for sym in seq:
+        if _is_action(sym):
+            continue
+        if sym not in nts:
+            out.add(sym)
+            return out
+        out |= first[sym] - {""}
+        if "" not in first[sym]:
+            return out
+    out.add("")
+    return out
+
+def follow_sets(grammar, first) -> Dict[str, Set[str]]:
+    nts = set(first)
+    follow = {nt: set() for nt in nts}
+    follow[START].add(END)
+    changed = True
+    while changed:
+        changed = False
+        for lhs, rhs in grammar:
+            for k, sym in enumerate(rhs):
+                if sym not in nts:
+                    continue
+                before = len(follow[sym])
+                rest = first_of_sequence(rhs[k + 1:], first, nts)
+                follow[sym] |= rest - {""}
+                if "" in rest:
+                    follow[sym] |= follow[lhs]
+                changed |= len(follow[sym]) != before
+    return follow
+
+def build_table(grammar):
+    """
+    Construye la tabla LL(1) {no terminal: {terminal: producción}}.
+    Devuelve también la lista de conflictos resueltos (nt, terminal, elegida, descartada).
+    """
+    first = first_sets(grammar)
+    follow = follow_sets(grammar, first)
+    nts = set(first)
+    table = {nt: {} for nt in nts}
+    conflicts = []
+
+    for lhs, rhs in grammar:
+        f = first_of_sequence(rhs, first, nts)
+        lookaheads = f - {""}
+        if "" in f:
+            lookaheads |= follow[lhs]
+        for t in lookaheads:
+            chosen = table[lhs].get(t)
+            if chosen is None:
+                table[lhs][t] = rhs
+                continue
+            # Preferir la producción que consume tokens (no anulable)
+            keep, drop = chosen, rhs
+            if "" in first_of_sequence(chosen, first, nts) and "" not in f:
+                keep, drop = rhs, chosen
+            table[lhs][t] = keep
+            conflicts.append((lhs, t, keep, drop))
+
+    return table, first, follow, conflicts
+
+# COMPILACIÓN A CÓDIGOS ENTEROS
+# Terminales: código de Cat (0..7) y END_OF_INPUT.
+# No terminales: _NT_BASE + índice. Acciones: _ACTION_BASE + índice.
+
+_NT_BASE = 0x100
+_ACTION_BASE = 0x200
+ACTIONS = ("@pron", "@det", "@det_noun", "@bare_noun", "@verb", "@drop")
+(_A_PRON, _A_DET, _A_DET_NOUN, _A_BARE_NOUN, _A_VERB, _A_DROP) = (
+    _ACTION_BASE + k for k in range(len(ACTIONS))
+)
+
+TABLE, FIRST, FOLLOW, CONFLICTS = build_table(GRAMMAR)
+NONTERMINALS = nonterminals(GRAMMAR)
+
+def _encode(sym: str) -> int:
+    if sym in FIRST:
+        return _NT_BASE + NONTERMINALS.index(sym)
+    if _is_action(sym):
+        return _ACTION_BASE + ACTIONS.index(sym)
+    if sym == END:
+        return END_OF_INPUT
+    return Cat[sym]
+
+def _compile(table):
+    """
+    Tabla de filas de 256 entradas indexadas por código de categoría; cada
+    entrada es la parte derecha ya invertida (lista para extender la pila) o
+    None si es un error sintáctico.
+    """
+    rows = []
+    for nt in NONTERMINALS:
+        prods = [rhs for lhs, rhs in GRAMMAR if lhs == nt]
+        default = None
+        if EPSILON in prods:
+            default = EPSILON
+        elif len(prods) == 1:
+            default = prods[0]
+        row = [default] * 0x100
+        for t, rhs in table[nt].items():
+            row[_encode(t)] = rhs
+        rows.append([None if rhs is None else tuple(_encode(s) for s in reversed(rhs))
+                     for rhs in row])
+    return rows
+
+_ROWS = _compile(TABLE)
+_SENTENCE = _encode(SENTENCE)
+
+# Con las producciones por defecto, NP es el único no terminal que puede
+# quedarse sin producción aplicable; sus errores usan E_NP_END / E_NP_START.
+FALLIBLE = [nt for nt, row in zip(NONTERMINALS, _ROWS) if None in row]
+
+# PARSER
+
+class LL1EnParser(RDEnParser):
+    """
+    Parser LL(1) con pila explícita. Comparte con RDEnParser el bucle de modo
+    pánico (Program -> S (COMMA S)*), los registros de error y las validaciones
+    semánticas; solo reemplaza el análisis de cada oración S.
+    """
+
+    def S(self):
+        cats = self.cats
+        nums = self.nums
+        rows = _ROWS
+        stack = [_SENTENCE]
+        values = []
+        i = self.i
+
+        while stack:
+            sym = stack.pop()
+
+            if sym < _NT_BASE:
+                # Terminal: debe coincidir con el token actual
+                if cats[i] != sym:
+                    self.i = i
+                    return self.accept(sym)  # Registra el mismo error que RDEnParser
+                i += 1
+
+            elif sym < _ACTION_BASE:
+                rhs = rows[sym - _NT_BASE][cats[i]]
+                if rhs is None:
+                    self.i = i
+                    return self.expected_error(sym)
+                stack.extend(rhs)
+
+            # Acciones semánticas (i - 1 es el último token consumido)
+            elif sym == _A_DROP:
+                values.pop()
+            elif sym == _A_PRON:
+                values.append(nums[i - 1])
+            elif sym == _A_DET:
+                values.append(i - 1)
+            elif sym == _A_DET_NOUN or sym == _A_BARE_NOUN:
+                if sym == _A_DET_NOUN:
+                    num = self.check_det_noun(values.pop(), i - 1)
+                else:
+                    num = self.check_bare_noun(i - 1)
+                if num is None:
+                    self.i = i
+                    return None
+                values.append(num)
+            else:  # _A_VERB
+                subj_num = values.pop()
+                if not self.check_subject_verb(subj_num, i - 1):
+                    self.i = i
+                    return None
+
+        self.i = i
+        return True
+
+    def expected_error(self, nt: int):
+        """Error de un no terminal (NP, ver FALLIBLE) sin producción para el token actual."""
+        cat = self.cats[self.i]
+        if cat == END_OF_INPUT:
+            return self.fail(E_NP_END, expected="NP")
+        return self.fail(E_NP_START, self.tokens.positions[self.i], "NP", CATEGORIES[cat],
+                         self.tokens.word(self.i))
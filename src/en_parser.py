@@ -42,242 +42,704 @@
 #   - Token de Sincronización: COMMA (,).
 # ==============================================================================
 
-from dataclasses import dataclass, field
-from typing import List
-from src.en_lexicon import Token, tokenize_sentence, LexicalError
+# Importaciones de arranque mínimas: multiprocessing y la instrumentación
+# (src.en_profile) se cargan solo cuando se usan, y las anotaciones usan
+# tipos genéricos nativos en lugar de typing/dataclasses, que por sí solos
+# dominaban el tiempo de arranque de una invocación de run_en.
+from bisect import bisect_left
+from collections import deque, namedtuple
+from collections.abc import Iterable, Iterator
+from functools import cached_property
+from itertools import islice, tee
+from src.en_lexicon import (
+    CATEGORIES, END_OF_INPUT, NUMBERS, Cat, Num, Token, TokenColumns, tokenize_columns,
+)
+
+# Alias de módulo para el camino crítico: acceder a Cat.X en cada comparación
+# pasa por la metaclase de Enum y es varias veces más lento.
+_COMMA, _DET, _PRON, _N, _V, _AUX, _ADJ, _PREP = Cat
+_ANY, _SG, _PL, _SGC, _UNC, _COLL = Num
+_BARE_NUMS = (_PL, _UNC, _COLL)
+_NP_FIRST = (_DET, _PRON, _N)
+
+# DIAGNÓSTICOS
+# Un error se registra como un Diagnostic (tupla con nombre) con los datos ya
+# resueltos (nombres de categoría, palabras, posiciones) pero sin formatear:
+# el texto solo se construye si alguien lee .message o ParseResult.messages.
+
+# Tipos de diagnóstico (Diagnostic.kind)
+E_LEXICAL = "lexical"
+E_NO_INPUT = "no_input"
+E_UNEXPECTED_COMMA = "unexpected_comma"
+E_EXPECTED_DELIMITER = "expected_delimiter"
+E_UNEXPECTED_END = "unexpected_end"
+E_EXPECTED_CAT = "expected_category"
+E_NP_END = "np_end"
+E_NP_START = "np_start"
+E_DET_NOUN = "det_noun_agreement"
+E_BARE_NOUN = "bare_noun"
+E_SUBJ_VERB = "subject_verb_agreement"
+
+ERROR_TEMPLATES = {
+    E_LEXICAL:            "Lexical Error: Unknown word '{word}' at position {pos}",
+    E_NO_INPUT:           "No input provided.",
+    E_UNEXPECTED_COMMA:   "Unexpected comma found at start of sentence (position {pos}).",
+    E_EXPECTED_DELIMITER: "Expected ',' or End of Input, found '{word}'",
+    E_UNEXPECTED_END:     "Unexpected end of input. Expected category: {expected}.",
+    E_EXPECTED_CAT:       "Expected {expected}, found {found} ('{word}') at position {pos}.",
+    E_NP_END:             "Expected NP, found end of sentence.",
+    E_NP_START:           "Expected DET, PRON or N to start NP, found {found} ('{word}').",
+    E_DET_NOUN:           "Agreement Error: Determiner '{context}' ({expected}) mismatch with noun '{word}' ({found}).",
+    E_BARE_NOUN:          "Grammar Error: Countable singular noun '{word}' cannot appear without a determiner.",
+    E_SUBJ_VERB:          "Subject–Verb Agreement Error: Subject is {expected}, but verb '{word}' is {found}.",
+}
+
+class Diagnostic(namedtuple("Diagnostic", "kind pos expected found word context suggestion",
+                            defaults=(None, None, None, None, None, None))):
+    """
+    Error estructurado del análisis. Los campos que no aplican valen None.
+      kind        Tipo de error (E_*).
+      pos         Posición (1, 2, 3, ...) del token implicado.
+      expected    Categoría o número esperado (en DET-N, el del determinante;
+                  en Sujeto-Verbo, el del sujeto).
+      found       Categoría o número encontrado.
+      word        Palabra implicada.
+      context     Dato adicional (en DET-N, el determinante).
+      suggestion  Palabra sugerida en los errores léxicos (src.en_suggest).
+    """
+    __slots__ = ()
+
+    @property
+    def message(self) -> str:
+        message = ERROR_TEMPLATES[self.kind].format(**self._asdict())
+        if self.suggestion is not None:
+            message += f" (did you mean '{self.suggestion}'?)"
+        return message
 
-class ParseError(Exception):
-    """Excepción lanzada cuando ocurre un error de sintaxis o concordancia."""
-    pass
+    def to_dict(self) -> dict:
+        """Campos presentes, listo para serializar a JSON."""
+        return {k: v for k, v in zip(self._fields, self) if v is not None}
 
-@dataclass
 class ParseResult:
-    """Clase para encapsular el resultado del análisis sintáctico."""
-    ok: bool
-    messages: List[str] = field(default_factory=list)
+    """
+    Clase para encapsular el resultado del análisis sintáctico.
+    Es inmutable para que una misma instancia pueda compartirse desde una caché.
+    Los errores se guardan como Diagnostic; los mensajes de texto se formatean
+    la primera vez que se consultan. 'diagnostics' es siempre una tupla; se
+    puede construir con un iterable (p. ej. IncrementalDocument, que desplaza
+    los diagnósticos de sus bloques), que se materializa en la primera consulta.
+    """
+
+    def __init__(self, ok: bool, diagnostics: Iterable[Diagnostic] = ()):
+        object.__setattr__(self, "ok", ok)
+        object.__setattr__(self, "_diagnostics", diagnostics)
+
+    @property
+    def diagnostics(self) -> tuple[Diagnostic, ...]:
+        diagnostics = self._diagnostics
+        if diagnostics.__class__ is not tuple:
+            diagnostics = tuple(diagnostics)
+            object.__setattr__(self, "_diagnostics", diagnostics)
+        return diagnostics
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"cannot delete field '{name}'")
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.ok == other.ok and self.diagnostics == other.diagnostics
+
+    def __hash__(self):
+        return hash((self.ok, self.diagnostics))
+
+    def __repr__(self):
+        return f"ParseResult(ok={self.ok!r}, diagnostics={self.diagnostics!r})"
+
+    @cached_property
+    def messages(self) -> tuple[str, ...]:
+        if self.ok:
+            return ("Parsing successful.",)
+        return tuple(d.message for d in self.diagnostics)
+
+    def to_dict(self) -> dict:
+        return {"ok": self.ok, "diagnostics": [d.to_dict() for d in self.diagnostics]}
+
+def result_from_segments(errors: list, parsed_any: bool) -> ParseResult:
+    """Resultado final del modo pánico a partir de sus errores."""
+    if errors:
+        return ParseResult(False, tuple(errors))
+    elif not parsed_any:
+        return ParseResult(False, (Diagnostic(E_NO_INPUT),))
+
+    return ParseResult(True)
 
 class RDEnParser:
-    def __init__(self, tokens: List[Token]):
+    """
+    Parser descendente recursivo. Recorre un TokenColumns (o una lista de
+    Tokens, que se convierte a columnas) con un cursor entero; las reglas
+    comparan códigos enteros y solo consultan palabras y posiciones para
+    construir los registros de error.
+
+    Las reglas no lanzan excepciones: ante un error guardan el registro en
+    self.error y devuelven None (o False), y cada llamador propaga el fallo.
+    """
+    def __init__(self, tokens: TokenColumns | list[Token]):
+        if not isinstance(tokens, TokenColumns):
+            tokens = TokenColumns.from_tokens(tokens)
         self.tokens = tokens
+        self.cats = tokens.cats  # Termina en END_OF_INPUT
+        self.nums = tokens.nums
         self.i = 0  # Puntero al token actual
+        self.error = None  # Último error registrado
+        self.unknown = list(tokens.unknown)  # Índices de los tokens de error
 
     # MÉTODOS DE UTILIDAD
 
-    def current(self):
+    def current(self) -> Token | None:
         """Devuelve el token actual o None si se ha llegado al final."""
-        return self.tokens[self.i] if self.i < len(self.tokens) else None
+        if self.cats[self.i] == END_OF_INPUT:
+            return None
+        return self.tokens.token(self.i)
 
-    def accept(self, expected_cat: str) -> Token:
+    def fail(self, kind: str, pos=None, expected=None, found=None, word=None, context=None):
+        """Registra un Diagnostic en self.error y devuelve None."""
+        self.error = Diagnostic(kind, pos, expected, found, word, context)
+        return None
+
+    def accept(self, expected_cat: int) -> int | None:
         """
         Verifica si el token actual coincide con la categoría esperada.
-        Si coincide, avanza el puntero y devuelve el token.
-        Si no, lanza ParseError.
+        Si coincide, avanza el puntero y devuelve su índice.
+        Si no, registra el error y devuelve None.
         """
-        tok = self.current()
-        if tok is None:
-            raise ParseError(
-                f"Unexpected end of input. Expected category: {expected_cat}."
-            )
-
-        if tok.cat != expected_cat:
-            raise ParseError(
-                f"Expected {expected_cat}, found {tok.cat} ('{tok.word}') at position {tok.pos}."
-            )
+        i = self.i
+        cat = self.cats[i]
+        if cat != expected_cat:
+            if cat == END_OF_INPUT:
+                return self.fail(E_UNEXPECTED_END, expected=CATEGORIES[expected_cat])
+            return self.fail(E_EXPECTED_CAT, self.tokens.positions[i], CATEGORIES[expected_cat],
+                             CATEGORIES[cat], self.tokens.word(i))
 
-        self.i += 1
-        return tok
+        self.i = i + 1
+        return i
 
     # LÓGICA DE RECUPERACIÓN DE ERRORES (MODO PÁNICO)
     
-    def parse_panic_mode(self) -> ParseResult:
+    def parse_panic_mode(self, ok_only: bool = False) -> ParseResult:
         """
         Método principal que orquesta el análisis.
         Implementa un bucle para procesar múltiples oraciones separadas por comas.
-        Si ocurre un error, registra el mensaje y sincroniza hasta la siguiente coma.
+        Si ocurre un error, registra el error y sincroniza hasta la siguiente coma.
+        Una oración con palabras desconocidas (tokens de error) no se analiza:
+        se registra un error léxico por palabra y se salta hasta la coma.
+        Con ok_only=True se detiene en el primer error (el resultado solo lleva
+        ese diagnóstico), útil cuando solo interesa .ok.
         """
+        return result_from_segments(*self.parse_segments(ok_only))
+
+    def parse_segments(self, ok_only: bool = False) -> tuple[list, bool]:
+        """
+        Bucle del modo pánico sin construir el resultado: devuelve la lista de
+        Diagnostic y si se analizó al menos una oración (S). Como cada oración
+        termina en su coma, trozos consecutivos del flujo cortados justo
+        después de una coma se pueden analizar por separado y combinar (ver
+        parse_parallel).
+        """
+        cats = self.cats
         errors = []
         parsed_any = False
 
-        while self.current() is not None:
-            try:
-                # Verificación de sintaxis: Coma no esperada al inicio de una oración
-                if self.current().cat == "COMMA":
-                    raise ParseError(f"Unexpected comma found at start of sentence (position {self.current().pos}).")
-
-                # Intentar analizar una oración completa (S)
-                self.S() 
-                parsed_any = True
-                
-                # Verificación de delimitador: Esperamos una coma o el fin del archivo
-                curr = self.current()
-                if curr is not None:
-                    if curr.cat == "COMMA":
-                        self.accept("COMMA")  # Consumir el separador y continuar
-                    else:
-                        raise ParseError(f"Expected ',' or End of Input, found '{curr.word}'")
-            
-            except ParseError as e:
-                # REPORTE: Agregar el error a la lista
-                errors.append(str(e))
-                # RECUPERACIÓN: Invocar rutina de sincronización
+        while cats[self.i] != END_OF_INPUT:
+            # Verificación de sintaxis: Coma no esperada al inicio de una oración
+            if cats[self.i] == _COMMA:
+                errors.append(Diagnostic(E_UNEXPECTED_COMMA, self.tokens.positions[self.i],
+                                         found=CATEGORIES[_COMMA], word=","))
+                if ok_only:
+                    break
+                self.synchronize_panic()
+                continue
+
+            # Palabras desconocidas: se descarta solo esta oración
+            if self.unknown:
+                lexical = self.lexical_errors()
+                if lexical:
+                    errors += lexical[:1] if ok_only else lexical
+                    if ok_only:
+                        break
+                    self.synchronize_panic()
+                    continue
+
+            # Intentar analizar una oración completa (S)
+            if self.S() is None:
+                errors.append(self.error)
+                if ok_only:
+                    break
+                self.synchronize_panic()
+                continue
+            parsed_any = True
+
+            # Verificación de delimitador: Esperamos una coma o el fin del archivo
+            cat = cats[self.i]
+            if cat == _COMMA:
+                self.i += 1  # Consumir el separador y continuar
+            elif cat != END_OF_INPUT:
+                errors.append(Diagnostic(E_EXPECTED_DELIMITER, self.tokens.positions[self.i],
+                                         CATEGORIES[_COMMA], CATEGORIES[cat], self.tokens.word(self.i)))
+                if ok_only:
+                    break
                 self.synchronize_panic()
 
-        # Generación del resultado final
-        if errors:
-            return ParseResult(False, errors)
-        elif not parsed_any:
-            return ParseResult(False, ["No input provided."])
-        
-        return ParseResult(True, ["Parsing successful."])
+        return errors, parsed_any
 
     def synchronize_panic(self):
         """
         Rutina de Sincronización.
-        Descarta tokens consecutivamente hasta encontrar el token de sincronización (COMMA)
-        o alcanzar el final del flujo de entrada.
+        Salta directamente al token siguiente a la próxima coma (token de
+        sincronización) usando los índices precalculados en TokenColumns.commas,
+        o al final del flujo de entrada si no quedan comas.
         """
-        while self.current() is not None:
-            token = self.current()
-            if token.cat == "COMMA":
-                self.i += 1  # Consumir la coma para reiniciar el análisis en estado limpio
-                return
-            self.i += 1  # Descartar token actual
+        commas = self.tokens.commas
+        k = bisect_left(commas, self.i)
+        self.i = commas[k] + 1 if k < len(commas) else len(self.tokens)
+
+    def lexical_errors(self) -> list[Diagnostic]:
+        """
+        Errores léxicos de la oración que empieza en el token actual (hasta la
+        próxima coma), con la sugerencia de src.en_suggest si la hay.
+        """
+        from src.en_suggest import suggest
+
+        unknown, commas = self.unknown, self.tokens.commas
+        k = bisect_left(unknown, self.i)
+        c = bisect_left(commas, self.i)
+        end = commas[c] if c < len(commas) else len(self.tokens)
+        errors = []
+        while k < len(unknown) and unknown[k] < end:
+            word = self.tokens.unknown[unknown[k]]
+            errors.append(Diagnostic(E_LEXICAL, self.tokens.positions[unknown[k]], word=word,
+                                     suggestion=suggest(word)))
+            k += 1
+        return errors
 
     # REGLAS DE ANÁLISIS SINTÁCTICO (RECURSIVE DESCENT)
+    # Cada regla devuelve None (o False) si registró un error.
 
-    def S(self) -> str:
+    def S(self) -> int | None:
         """
         Producción: S -> NP VP
         Retorna el número del sujeto (SG/PL) para validaciones futuras.
         """
         subj_num = self.NP()
-        self.VP(expected_subj_num=subj_num)
+        if subj_num is None or not self.VP(expected_subj_num=subj_num):
+            return None
         return subj_num
 
-    def NP(self) -> str:
+    def NP(self) -> int | None:
         """
         Producciones NP:
           1. NP -> PRON
           2. NP -> DET AdjList N PPList
           3. NP -> N PPList (Bare Noun)
         """
-        tok = self.current()
-        if tok is None:
-            raise ParseError("Expected NP, found end of sentence.")
+        # 1. NP -> PRON no lleva PPList
+        if self.cats[self.i] == _PRON:
+            return self.NPHead()
+
+        num = self.NPHead()
+        if num is None or not self.PPList():
+            return None
+        return num
+
+    def NPHead(self) -> int | None:
+        """
+        Núcleo del NP (todo salvo el PPList final):
+          PRON | DET AdjList N | N (Bare Noun)
+        Devuelve el número del NP.
+        """
+        i = self.i
+        cat = self.cats[i]
 
         # 1. Caso Pronombre
-        if tok.cat == "PRON":
-            pron = self.accept("PRON")
-            return pron.num
+        if cat == _PRON:
+            self.i = i + 1
+            return self.nums[i]
 
         # 2. Caso Determinante + Sustantivo
-        if tok.cat == "DET":
-            det = self.accept("DET")
+        if cat == _DET:
+            self.i = i + 1
             self.AdjList()
-            noun = self.accept("N")
-            noun_num = self.noun_agreement(noun)
-
-            # Validación: Concordancia Determinante-Sustantivo
-            if det.num != "ANY" and det.num != noun_num:
-                raise ParseError(
-                    f"Agreement Error: Determiner '{det.word}' ({det.num}) mismatch with noun '{noun.word}' ({noun.num})."
-                )
-
-            self.PPList()
-            return noun_num
+            noun = self.accept(_N)
+            if noun is None:
+                return None
+            return self.check_det_noun(i, noun)
 
         # 3. Caso Sustantivo sin Determinante (Bare Noun)
-        if tok.cat == "N":
-            noun = self.accept("N")
-            # Validación: Solo ciertos tipos de sustantivos pueden ir sin determinante
-            if not self.noun_allows_bare(noun):
-                raise ParseError(
-                    f"Grammar Error: Countable singular noun '{noun.word}' cannot appear without a determiner."
-                )
-            self.PPList()
-            return self.noun_agreement(noun)
-
-        raise ParseError(f"Expected DET, PRON or N to start NP, found {tok.cat} ('{tok.word}').")
+        if cat == _N:
+            self.i = i + 1
+            return self.check_bare_noun(i)
+
+        if cat == END_OF_INPUT:
+            return self.fail(E_NP_END, expected="NP")
+        return self.fail(E_NP_START, self.tokens.positions[i], "NP", CATEGORIES[cat],
+                         self.tokens.word(i))
 
     def AdjList(self):
         """Producción: AdjList -> ADJ AdjList | ε"""
-        while self.current() is not None and self.current().cat == "ADJ":
-            self.accept("ADJ")
-
-    def PPList(self):
-        """Producción: PPList -> PP PPList | ε"""
-        while self.current() is not None and self.current().cat == "PREP":
-            self.PP()
+        cats = self.cats
+        while cats[self.i] == _ADJ:
+            self.i += 1
 
-    def PP(self):
-        """Producción: PP -> PREP NP"""
-        self.accept("PREP")
-        self.NP()
+    def PPList(self) -> bool:
+        """
+        Producciones: PPList -> PP PPList | ε  y  PP -> PREP NP
+        Se resuelve con un bucle en lugar de la recursión PP -> NP -> PPList:
+        el PPList de cada NP interno absorbe con avidez todos los PP que le
+        siguen (y si el NP es un pronombre, los toma el PPList exterior), así
+        que la cadena equivale a (PREP NPHead)* y se analiza en tiempo lineal
+        y con profundidad de pila constante.
+        """
+        cats = self.cats
+        while cats[self.i] == _PREP:
+            self.i += 1
+            if self.NPHead() is None:
+                return False
+        return True
 
     def AuxList(self):
         """Producción: AuxList -> AUX AuxList | ε"""
-        while self.current() is not None and self.current().cat == "AUX":
-            self.accept("AUX")
+        cats = self.cats
+        while cats[self.i] == _AUX:
+            self.i += 1
 
-    def VP(self, expected_subj_num: str):
+    def VP(self, expected_subj_num: int) -> bool:
         """
         Producción: VP -> AuxList V VPBody
         Realiza la validación de concordancia Sujeto-Verbo.
         """
         self.AuxList()
-        verb = self.accept("V")
+        verb = self.accept(_V)
+        if verb is None or not self.check_subject_verb(expected_subj_num, verb):
+            return False
+        return self.VPBody()
 
-        # Validación: Concordancia Sujeto-Verbo
-        if verb.num != expected_subj_num:
-            raise ParseError(
-                f"Subject–Verb Agreement Error: Subject is {expected_subj_num}, "
-                f"but verb '{verb.word}' is {verb.num}."
-            )
-
-        self.VPBody()
-
-    def VPBody(self):
+    def VPBody(self) -> bool:
         """
         Producción: VPBody -> NP PPList | PPList | ε
         Maneja objetos directos y complementos preposicionales.
         """
-        tok = self.current()
         # Verificamos si el siguiente token inicia un NP (Objeto Directo)
-        if tok is not None and tok.cat in ("DET", "PRON", "N"):
-            self.NP()      # Consumir Objeto Directo
-            self.PPList()  # Consumir complementos circunstanciales
-        else:
-            # Si no hay objeto directo, solo buscamos complementos
-            self.PPList()
+        if self.cats[self.i] in _NP_FIRST:
+            if self.NP() is None:  # Consumir Objeto Directo
+                return False
+        # Consumir complementos circunstanciales
+        return self.PPList()
 
     # HELPERS DE VALIDACIÓN SEMÁNTICA
 
-    def noun_agreement(self, noun: Token) -> str:
+    def check_det_noun(self, det: int, noun: int) -> int | None:
+        """
+        Validación: Concordancia Determinante-Sustantivo.
+        Recibe los índices de ambos tokens y devuelve el número del NP.
+        """
+        det_num = self.nums[det]
+        noun_num = self.noun_agreement(self.nums[noun])
+        if det_num != _ANY and det_num != noun_num:
+            words = self.tokens.word
+            return self.fail(E_DET_NOUN, self.tokens.positions[noun], NUMBERS[det_num],
+                             NUMBERS[self.nums[noun]], words(noun), words(det))
+        return noun_num
+
+    def check_bare_noun(self, noun: int) -> int | None:
+        """
+        Validación: Solo ciertos tipos de sustantivos pueden ir sin determinante.
+        Devuelve el número del NP.
+        """
+        noun_num = self.nums[noun]
+        if not self.noun_allows_bare(noun_num):
+            return self.fail(E_BARE_NOUN, self.tokens.positions[noun],
+                             found=NUMBERS[noun_num], word=self.tokens.word(noun))
+        return self.noun_agreement(noun_num)
+
+    def check_subject_verb(self, subj_num: int, verb: int) -> bool:
+        """Validación: Concordancia Sujeto-Verbo."""
+        verb_num = self.nums[verb]
+        if verb_num != subj_num:
+            self.fail(E_SUBJ_VERB, self.tokens.positions[verb], NUMBERS[subj_num],
+                      NUMBERS[verb_num], self.tokens.word(verb))
+            return False
+        return True
+
+    def noun_agreement(self, noun_num: int) -> Num:
         """Determina el número gramatical efectivo del sustantivo."""
-        if noun.num == "PL": return "PL"
-        return "SG"
+        if noun_num == _PL: return _PL
+        return _SG
 
-    def noun_allows_bare(self, noun: Token) -> bool:
+    def noun_allows_bare(self, noun_num: int) -> bool:
         """
         Verifica si el sustantivo puede aparecer sin determinante.
         Permitido para: Plurales (PL), Incontables (UNC) y Colectivos (COLL).
         """
-        return noun.num in ("PL", "UNC", "COLL")
+        return noun_num in _BARE_NUMS
 
 # PUNTO DE ENTRADA PÚBLICO
 
-def analyze_en_sentence(sentence: str) -> ParseResult:
+ENGINES = ("rd", "ll1", "ambig", "compiled")
+
+def get_parser_class(engine: str = "rd"):
+    """
+    Devuelve la clase de parser del motor indicado:
+      rd  -> RDEnParser (descenso recursivo)
+      ll1 -> LL1EnParser (tabla LL(1) con pila explícita)
+      ambig -> AmbiguousEnParser (resuelve palabras con varias lecturas)
+      compiled -> CompiledEnParser (RDEnParser inlinado, generado por src.en_codegen)
+    """
+    if engine == "rd":
+        return RDEnParser
+    if engine == "ll1":
+        # Importación diferida: src.en_ll1 depende de este módulo
+        from src.en_ll1 import LL1EnParser
+        return LL1EnParser
+    if engine == "ambig":
+        from src.en_ambig import AmbiguousEnParser
+        return AmbiguousEnParser
+    if engine == "compiled":
+        from src.en_codegen import compiled_parser_class
+        return compiled_parser_class()
+    raise ValueError(f"Unknown engine '{engine}'. Expected one of: {', '.join(ENGINES)}.")
+
+def analyze_en_sentence(sentence: str, engine: str = "rd", cache=None,
+                        ok_only: bool = False, profile=None) -> ParseResult:
     """
     Función principal para invocar el parser.
     1. Tokeniza la entrada.
-    2. Inicializa el parser.
+    2. Inicializa el parser del motor elegido ('rd' o 'll1').
     3. Ejecuta el análisis con recuperación de errores.
+    Con una caché (p. ej. src.en_cache.ResultCache) se reutilizan los
+    resultados de oraciones ya analizadas. Con ok_only=True el análisis se
+    detiene en el primer error; esos resultados parciales no se guardan en
+    la caché, aunque sí se aprovechan los resultados completos que ya tenga.
+    Con un ParserProfile se usa la variante instrumentada del parser y se
+    acumulan sus contadores en él.
+    """
+    if cache is not None:
+        compute = lambda s: analyze_en_sentence(s, engine, ok_only=ok_only, profile=profile)
+        if ok_only:
+            return cache.get(sentence, engine) or compute(sentence)
+        return cache.get_or_compute(sentence, compute, engine)
+
+    parser_class = get_parser_class(engine)
+    # Las palabras desconocidas quedan como tokens de error: el parser informa
+    # el error léxico y descarta solo la oración que las contiene.
+    tokens = tokenize_columns(sentence, strict=False)
+    if profile is None:
+        return parser_class(tokens).parse_panic_mode(ok_only)
+    from src.en_profile import profiled_class
+    result = profiled_class(parser_class)(tokens, profile).parse_panic_mode(ok_only)
+    profile.record_result(result)
+    return result
+
+def _analyze_chunk(sentences: list[str], engine: str = "rd", profiling: bool = False,
+                   precheck: bool = False):
+    """
+    Analiza un bloque de oraciones dentro de un proceso del pool.
+    Devuelve (resultados, perfil del bloque o None).
+    """
+    if precheck and not profiling:
+        from src.en_precheck import analyze_batch
+        return analyze_batch(sentences, engine), None
+    profile = None
+    if profiling:
+        from src.en_profile import ParserProfile
+        profile = ParserProfile()
+    return [analyze_en_sentence(s, engine, profile=profile) for s in sentences], profile
+
+def _merge_chunk(chunk: list[str], known: list, fresh: Iterable[ParseResult],
+                 cache, engine: str) -> Iterator[ParseResult]:
+    """Intercala los resultados de la caché ('known') con los recién calculados."""
+    fresh = iter(fresh)
+    for sent, result in zip(chunk, known):
+        if result is None:
+            result = next(fresh)
+            if cache is not None:
+                cache.put(sent, result, engine)
+        yield result
+
+def analyze_many(sentences: Iterable[str], workers: int = 1, chunksize: int = 256,
+                 engine: str = "rd", cache=None, profile=None,
+                 precheck: bool = True) -> Iterator[ParseResult]:
+    """
+    Analiza un flujo de oraciones y devuelve sus resultados en el mismo orden.
+    Con workers > 1 reparte bloques de 'chunksize' oraciones en un pool de
+    procesos, manteniendo a lo sumo 2 * workers bloques en vuelo para que la
+    memoria no dependa del tamaño del corpus.
+    La caché opcional se consulta en el proceso principal: solo los fallos se
+    envían al pool. Los perfiles de cada proceso se suman en 'profile'.
+    Con precheck (y sin perfil) cada bloque pasa por el autómata vectorizado
+    de src.en_precheck, que da los mismos resultados; sin NumPy o con un motor
+    que no admite, se analiza oración a oración.
+    """
+    get_parser_class(engine)  # Validar el motor antes de arrancar el pool
+    if chunksize < 1:
+        raise ValueError("chunksize must be a positive integer.")
+    profiling = profile is not None
+    precheck = precheck and not profiling
+    if workers <= 1:
+        if not precheck:
+            for sent in sentences:
+                yield analyze_en_sentence(sent, engine, cache, profile=profile)
+            return
+        from src.en_precheck import BATCH_SIZE, analyze_batch
+
+        # El autómata avanza todo el lote en cada paso: lotes grandes amortizan mejor
+        it = iter(sentences)
+        while chunk := list(islice(it, max(chunksize, BATCH_SIZE))):
+            known = [None] * len(chunk) if cache is None else [cache.get(s, engine) for s in chunk]
+            misses = [s for s, r in zip(chunk, known) if r is None]
+            yield from _merge_chunk(chunk, known, analyze_batch(misses, engine), cache, engine)
+        return
+
+    from multiprocessing import Pool
+
+    it = iter(sentences)
+    with Pool(workers) as pool:
+        pending = deque()
+        while True:
+            # Mantener el pool ocupado mientras se consumen los bloques ya listos
+            while len(pending) < 2 * workers:
+                chunk = list(islice(it, chunksize))
+                if not chunk:
+                    break
+                known = [None] * len(chunk) if cache is None else [cache.get(s, engine) for s in chunk]
+                misses = [s for s, r in zip(chunk, known) if r is None]
+                job = pool.apply_async(_analyze_chunk, (misses, engine, profiling, precheck))
+                pending.append((chunk, known, job))
+            if not pending:
+                return
+
+            chunk, known, job = pending.popleft()
+            fresh, chunk_profile = job.get()
+            if profiling:
+                profile.merge(chunk_profile)
+            yield from _merge_chunk(chunk, known, fresh, cache, engine)
+
+def analyze_stream(f: Iterable[str], workers: int = 1, chunksize: int = 256, engine: str = "rd",
+                   cache=None, profile=None, split_tokens: int = 0,
+                   precheck: bool = True) -> Iterator[tuple[int, str, ParseResult]]:
+    """
+    Generador perezoso sobre un archivo abierto (o sys.stdin).
+    Produce tuplas (número de línea, oración, ParseResult) saltando las líneas
+    vacías; la memoria usada no depende del tamaño de la entrada.
+    Con split_tokens > 0 los workers no se reparten líneas sino los trozos
+    (de unos split_tokens tokens, cortados en comas) de cada línea, lo que
+    conviene para líneas enormes (ver parse_parallel). Ese modo no admite
+    'profile' y no usa el prefiltro, pensado para lotes de líneas cortas
+    (el resultado es el mismo).
+    """
+    if split_tokens > 0 and profile is not None:
+        raise ValueError("Profiling is not supported together with split_tokens.")
+    numbered = ((n, line.strip()) for n, line in enumerate(f, start=1))
+    numbered, to_parse = tee((n, s) for n, s in numbered if s)
+    if split_tokens > 0:
+        results = _analyze_split((s for _, s in to_parse), workers, engine, cache, split_tokens)
+    else:
+        results = analyze_many((s for _, s in to_parse), workers=workers,
+                               chunksize=chunksize, engine=engine, cache=cache,
+                               profile=profile, precheck=precheck)
+    for (lineno, sent), result in zip(numbered, results):
+        yield lineno, sent, result
+
+# ANÁLISIS PARALELO DENTRO DE UN DOCUMENTO
+# Las oraciones separadas por comas son independientes en el modo pánico: un
+# error solo descarta tokens hasta la coma siguiente y ningún estado pasa de
+# una oración a otra. Un documento se puede cortar, por tanto, justo después
+# de cualquier coma: cada trozo se analiza con su coma final como lookahead
+# (o el fin de la entrada en el último) y la concatenación de sus errores es
+# exactamente la del análisis en serie.
+
+# Tokens por trozo por defecto en parse_parallel
+SPLIT_TOKENS = 8192
+
+def split_at_commas(tokens: TokenColumns, chunk_tokens: int = SPLIT_TOKENS) -> list[tuple[int, int]]:
+    """
+    Corta los índices [0, len(tokens)) en intervalos [inicio, fin) de al menos
+    chunk_tokens tokens que terminan justo después de una coma (o al final).
+    """
+    commas = tokens.commas
+    n = len(tokens)
+    bounds = []
+    start = 0
+    while start < n:
+        k = bisect_left(commas, start + max(chunk_tokens, 1) - 1)
+        end = commas[k] + 1 if k < len(commas) else n
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+def _parse_slice(tokens: TokenColumns, engine: str, ok_only: bool) -> tuple[list, bool]:
+    """Analiza un trozo dentro de un proceso del pool (ver parse_segments)."""
+    return get_parser_class(engine)(tokens).parse_segments(ok_only)
+
+def parse_parallel(tokens: TokenColumns, workers: int = 2, engine: str = "rd", ok_only: bool = False,
+                   chunk_tokens: int = SPLIT_TOKENS, pool=None) -> ParseResult:
+    """
+    Analiza un documento repartiendo sus trozos (split_at_commas) entre
+    'workers' procesos, o en el pool dado, y combina los errores en orden.
+    El resultado es idéntico al de parse_panic_mode. Con un solo trozo se
+    analiza en el proceso actual.
+    """
+    parser_class = get_parser_class(engine)
+    bounds = split_at_commas(tokens, chunk_tokens)
+    if len(bounds) <= 1 or (pool is None and workers <= 1):
+        return parser_class(tokens).parse_panic_mode(ok_only)
+
+    jobs = [(tokens.slice(start, end), engine, ok_only) for start, end in bounds]
+    if pool is None:
+        from multiprocessing import Pool
+        with Pool(workers) as pool:
+            parts = pool.starmap(_parse_slice, jobs)
+    else:
+        parts = pool.starmap(_parse_slice, jobs)
+
+    errors = []
+    parsed_any = False
+    for part_errors, part_parsed in parts:
+        errors += part_errors
+        parsed_any = parsed_any or part_parsed
+        if ok_only and errors:
+            break
+    return result_from_segments(errors, parsed_any)
+
+def analyze_document(text: str, workers: int = 2, engine: str = "rd", ok_only: bool = False,
+                     chunk_tokens: int = SPLIT_TOKENS, pool=None) -> ParseResult:
+    """Como analyze_en_sentence, pero analiza en paralelo las oraciones del texto."""
+    return parse_parallel(tokenize_columns(text, strict=False), workers, engine, ok_only,
+                          chunk_tokens, pool)
+
+def _analyze_split(sentences: Iterable[str], workers: int, engine: str, cache,
+                   chunk_tokens: int) -> Iterator[ParseResult]:
+    """
+    analyze_many para líneas enormes: un pool compartido reparte los trozos de
+    cada línea. Con un solo worker se analiza en serie, sin pool.
     """
-    try:
-        tokens = tokenize_sentence(sentence)
-    except LexicalError as e:
-        # Los errores léxicos detienen el proceso inmediatamente.
-        return ParseResult(False, [f"Lexical Error: {e}"])
-
-    parser = RDEnParser(tokens)
-    return parser.parse_panic_mode()
\ No newline at end of file
+    get_parser_class(engine)
+
+    def analyze(pool):
+        for sent in sentences:
+            result = None if cache is None else cache.get(sent, engine)
+            if result is None:
+                result = analyze_document(sent, workers, engine, chunk_tokens=chunk_tokens, pool=pool)
+                if cache is not None:
+                    cache.put(sent, result, engine)
+            yield result
+
+    if workers <= 1:
+        yield from analyze(None)
+        return
+    from multiprocessing import Pool
+
+    with Pool(workers) as pool:
+        yield from analyze(pool)
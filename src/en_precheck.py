@@ -0,0 +1,293 @@
+# src/en_precheck.py
+# Prefiltro vectorizado (NumPy) para analizar lotes de oraciones.
+#
+# Con las reglas de RDEnParser, una línea completa (oraciones separadas por
+# comas, con el modo pánico) es un lenguaje regular: los PP se encadenan en
+# bucles y la concordancia solo necesita recordar el número del determinante
+# o del sujeto. _step() describe ese autómata con las mismas decisiones que
+# el parser, y se compila a dos tablas (estado siguiente y error emitido)
+# indexadas por (estado, símbolo), con símbolo = categoría << 3 | número.
+#
+# analyze_batch() tokeniza el lote a un único array de códigos y avanza el
+# autómata de todas las líneas a la vez, una posición por paso. Cada línea
+# termina en uno de tres casos:
+#   - válida: ParseResult(True) sin pasar por el parser;
+#   - solo errores de concordancia (DET-N, Bare Noun, Sujeto-Verbo): el
+#     autómata conoce el token y el número del sujeto, así que el Diagnostic
+#     se construye directamente y, como el parser, salta hasta la coma;
+#   - cualquier otro patrón (categoría inesperada, comas, palabra con
+#     puntuación o desconocida...): la línea se analiza con el parser normal.
+# El resultado es idéntico al de analyze_en_sentence en los tres casos.
+#
+# NumPy es opcional: sin él (o con otro motor) analyze_batch analiza cada
+# oración con analyze_en_sentence.
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - dependencia opcional
+    np = None
+
+from src import en_lexicon
+from src.en_lexicon import Cat, Num, _lookup, _split_words
+from src.en_parser import (
+    E_BARE_NOUN, E_DET_NOUN, E_SUBJ_VERB, NUMBERS, Diagnostic, ParseResult,
+    analyze_en_sentence,
+)
+
+HAVE_NUMPY = np is not None
+
+# Oraciones por lote recomendadas: cada paso del autómata tiene un coste fijo
+# que se reparte entre las líneas del lote
+BATCH_SIZE = 2048
+
+# Motores cuyos resultados reproduce el autómata (ambig puede resolver con
+# lecturas alternativas lo que aquí sería un error).
+PRECHECK_ENGINES = ("rd", "ll1", "compiled")
+
+_COMMA, _DET, _PRON, _N, _V, _AUX, _ADJ, _PREP = Cat
+_ANY, _SG, _PL, _SGC, _UNC, _COLL = Num
+_BARE_NUMS = (_PL, _UNC, _COLL)
+
+# Símbolos: categoría << 3 | número, más el fin de la línea
+_NUM_BITS = 3
+END_SYMBOL = len(Cat) << _NUM_BITS
+N_SYMBOLS = END_SYMBOL + 1
+
+# Fases del autómata. Los estados son (fase, número de sujeto, número de DET).
+(START, AFTER_COMMA, SUBJ_DET, SUBJ_PRON, SUBJ_NP, SUBJ_PREP, SUBJ_PPDET, SUBJ_AUX,
+ BODY, TAIL, TAIL_PREP, TAIL_DET, SKIP, ACCEPT, STRUCT) = range(15)
+
+# Errores emitidos (código en la tabla: tipo | número de sujeto << 2)
+_ERR_DET_NOUN, _ERR_BARE, _ERR_SUBJ_VERB = 1, 2, 3
+
+def _agreement(noun_num: int) -> int:
+    return _PL if noun_num == _PL else _SG
+
+def _step(state: tuple, cat, num) -> tuple[tuple, int]:
+    """
+    Transición del autómata con el token (cat, num), o con el fin de la línea
+    si cat es None. Devuelve (estado siguiente, código de error o 0). Un error
+    de concordancia lleva a SKIP (sincronización hasta la coma); STRUCT marca
+    las líneas que debe analizar el parser.
+    """
+    phase, s, d = state
+    struct = (STRUCT, 0, 0)
+    if phase == ACCEPT or phase == STRUCT:
+        return state, 0
+    if cat is None:
+        if phase in (AFTER_COMMA, BODY, TAIL, SKIP):
+            return (ACCEPT, 0, 0), 0
+        return struct, 0
+    if phase == SKIP:
+        return ((AFTER_COMMA if cat == _COMMA else SKIP), 0, 0), 0
+
+    # Núcleos de NP: PRON | DET AdjList N | N (Bare Noun)
+    if phase in (START, AFTER_COMMA, SUBJ_PREP, TAIL_PREP, BODY):
+        if phase == BODY:
+            if cat == _COMMA:
+                return (AFTER_COMMA, 0, 0), 0
+            if cat == _PREP:
+                return (TAIL_PREP, 0, 0), 0
+        subject = phase in (START, AFTER_COMMA)
+        if cat == _PRON:
+            if subject:
+                return (SUBJ_PRON, num, 0), 0
+            return ((SUBJ_NP, s, 0) if phase == SUBJ_PREP else (TAIL, 0, 0)), 0
+        if cat == _DET:
+            if subject:
+                return (SUBJ_DET, 0, num), 0
+            return ((SUBJ_PPDET, s, num) if phase == SUBJ_PREP else (TAIL_DET, 0, num)), 0
+        if cat == _N:
+            if num not in _BARE_NUMS:
+                return (SKIP, 0, 0), _ERR_BARE
+            if subject:
+                return (SUBJ_NP, _agreement(num), 0), 0
+            return ((SUBJ_NP, s, 0) if phase == SUBJ_PREP else (TAIL, 0, 0)), 0
+        return struct, 0
+
+    if phase in (SUBJ_DET, SUBJ_PPDET, TAIL_DET):
+        if cat == _ADJ:
+            return state, 0
+        if cat != _N:
+            return struct, 0
+        agr = _agreement(num)
+        if d != _ANY and d != agr:
+            return (SKIP, 0, 0), _ERR_DET_NOUN
+        if phase == SUBJ_DET:
+            return (SUBJ_NP, agr, 0), 0
+        return ((SUBJ_NP, s, 0) if phase == SUBJ_PPDET else (TAIL, 0, 0)), 0
+
+    if phase in (SUBJ_PRON, SUBJ_NP, SUBJ_AUX):
+        if cat == _PREP and phase == SUBJ_NP:
+            return (SUBJ_PREP, s, 0), 0
+        if cat == _AUX:
+            return (SUBJ_AUX, s, 0), 0
+        if cat == _V:
+            if num != s:
+                return (SKIP, 0, 0), _ERR_SUBJ_VERB | s << 2
+            return (BODY, 0, 0), 0
+        return struct, 0
+
+    # TAIL: PPList hasta el delimitador
+    if cat == _COMMA:
+        return (AFTER_COMMA, 0, 0), 0
+    if cat == _PREP:
+        return (TAIL_PREP, 0, 0), 0
+    return struct, 0
+
+def build_tables() -> tuple[list[list[int]], list[list[int]], int, int]:
+    """
+    Compila los estados alcanzables desde START. Devuelve (siguiente, error,
+    id de ACCEPT, id de STRUCT); las tablas son listas [estado][símbolo].
+    """
+    symbols = [(None, None)] * N_SYMBOLS
+    for cat in Cat:
+        for num in Num:
+            symbols[cat << _NUM_BITS | num] = (cat, num)
+    symbols[END_SYMBOL] = (None, None)
+
+    ids = {(START, 0, 0): 0, (ACCEPT, 0, 0): 1, (STRUCT, 0, 0): 2}
+    states = list(ids)
+    nxt, err = [], []
+    k = 0
+    while k < len(states):
+        row_next, row_err = [], []
+        for sym, (cat, num) in enumerate(symbols):
+            if cat is None and sym != END_SYMBOL:
+                target, code = (STRUCT, 0, 0), 0  # Código sin categoría
+            else:
+                target, code = _step(states[k], cat, num)
+            if target not in ids:
+                ids[target] = len(states)
+                states.append(target)
+            row_next.append(ids[target])
+            row_err.append(code)
+        nxt.append(row_next)
+        err.append(row_err)
+        k += 1
+    return nxt, err, 1, 2
+
+_tables = None
+_symbols = None   # (léxico, {palabra: símbolo de su lectura principal})
+
+def _get_tables():
+    global _tables
+    if _tables is None:
+        nxt, err, accept, struct = build_tables()
+        _tables = (np.array(nxt, dtype=np.uint8).ravel(), np.array(err, dtype=np.uint8).ravel(),
+                   accept, struct)
+    return _tables
+
+def _symbol_table() -> dict:
+    """Símbolo de cada palabra ya vista del léxico activo."""
+    global _symbols
+    lexicon = en_lexicon.LEXICON
+    if _symbols is None or _symbols[0] is not lexicon:
+        _symbols = (lexicon, {})
+    return _symbols[1]
+
+def _line_symbols(words: list[str], table: dict):
+    """Símbolos de las palabras de una línea, o None si alguna no está en el léxico."""
+    symbols = list(map(table.get, words))
+    if None in symbols:
+        for k, word in enumerate(words):
+            if symbols[k] is None:
+                entry = _lookup(word)
+                if entry is None:
+                    return None
+                symbols[k] = table[word] = entry[1] << _NUM_BITS | entry[2]
+    return symbols
+
+def _run(symbols, starts, lengths):
+    """
+    Avanza el autómata de todas las líneas a la vez. Devuelve el estado final
+    de cada línea y, por token, el código de error emitido (0 si ninguno).
+    Las líneas se ordenan por longitud para que cada paso solo toque las que
+    aún tienen tokens.
+    """
+    nxt, err, _, _ = _get_tables()
+    order = np.argsort(-lengths, kind="stable")
+    starts = starts[order]
+    neg_lengths = -lengths[order]
+    state = np.zeros(len(order), dtype=np.intp)
+    errors = np.zeros(len(symbols), dtype=np.uint8)
+    for t in range(int(-neg_lengths[0]) if len(order) else 0):
+        active = int(np.searchsorted(neg_lengths, -t, side="left"))
+        idx = starts[:active] + t
+        k = state[:active] * N_SYMBOLS + symbols[idx]
+        errors[idx] = err[k]
+        state[:active] = nxt[k]
+    final = np.empty_like(state)
+    final[order] = nxt[state * N_SYMBOLS + END_SYMBOL]
+    return final, errors
+
+def _agreement_diagnostic(words: list[str], symbols, t: int, code: int) -> Diagnostic:
+    """Diagnostic del error de concordancia emitido en el token t (como en RDEnParser)."""
+    kind = code & 3
+    num = int(symbols[t]) & 7
+    pos = t + 1
+    if kind == _ERR_BARE:
+        return Diagnostic(E_BARE_NOUN, pos, found=NUMBERS[num], word=words[t])
+    if kind == _ERR_SUBJ_VERB:
+        return Diagnostic(E_SUBJ_VERB, pos, NUMBERS[code >> 2], NUMBERS[num], words[t])
+    det = t - 1
+    while int(symbols[det]) >> _NUM_BITS == _ADJ:
+        det -= 1
+    return Diagnostic(E_DET_NOUN, pos, NUMBERS[int(symbols[det]) & 7], NUMBERS[num],
+                      words[t], words[det])
+
+def analyze_batch(sentences: list[str], engine: str = "rd") -> list[ParseResult]:
+    """
+    Analiza una lista de oraciones; igual a [analyze_en_sentence(s, engine)
+    for s in sentences], pero las líneas válidas y las que solo tienen
+    errores de concordancia se resuelven con el autómata vectorizado.
+    """
+    if not HAVE_NUMPY or engine not in PRECHECK_ENGINES:
+        return [analyze_en_sentence(s, engine) for s in sentences]
+
+    table = _symbol_table()
+    results = [None] * len(sentences)
+    rows = []      # índice de la oración de cada línea del lote
+    flat = bytearray()
+    lengths = []
+    for k, sent in enumerate(sentences):
+        line = _line_symbols(_split_words(sent), table)
+        # Palabras con puntuación o desconocidas: las trata el tokenizador
+        if not line:
+            continue
+        rows.append(k)
+        flat += bytes(line)
+        lengths.append(len(line))
+
+    if rows:
+        accept = _get_tables()[2]
+        lengths = np.array(lengths, dtype=np.intp)
+        starts = np.zeros(len(lengths), dtype=np.intp)
+        np.cumsum(lengths[:-1], out=starts[1:])
+        symbols = np.frombuffer(bytes(flat), dtype=np.uint8)
+        final, errors = _run(symbols, starts, lengths)
+
+        # Errores de concordancia, agrupados por línea
+        by_line = {}
+        flagged = np.flatnonzero(errors)
+        for line, idx in zip(np.searchsorted(starts, flagged, side="right") - 1, flagged):
+            by_line.setdefault(int(line), []).append(int(idx))
+
+        ok = ParseResult(True)
+        for line, (k, state) in enumerate(zip(rows, final.tolist())):
+            if state != accept:
+                continue
+            flags = by_line.get(line)
+            if flags is None:
+                results[k] = ok
+                continue
+            start = int(starts[line])
+            words = _split_words(sentences[k])
+            line_symbols = symbols[start:start + int(lengths[line])]
+            results[k] = ParseResult(False, tuple(
+                _agreement_diagnostic(words, line_symbols, idx - start, int(errors[idx]))
+                for idx in flags))
+
+    for k, result in enumerate(results):
+        if result is None:
+            results[k] = analyze_en_sentence(sentences[k], engine)
+    return results
@@ -0,0 +1,105 @@
+# src/en_profile.py
+# Instrumentación opcional del parser: llamadas y tiempo acumulado por regla,
+# tokens descartados por synchronize_panic y frecuencia de cada tipo de error.
+#
+# La instrumentación vive en una subclase generada (profiled_class), así que
+# RDEnParser y LL1EnParser no pagan ningún coste cuando está desactivada.
+from collections import Counter
+from functools import lru_cache
+from time import perf_counter_ns
+from typing import Dict
+from src.en_lexicon import Cat
+
+# Reglas instrumentadas (las que existan en la clase base)
+RULES = ("S", "NP", "NPHead", "AdjList", "PPList", "AuxList", "VP", "VPBody")
+
+class ParserProfile:
+    """Contadores acumulados de una o más ejecuciones del parser."""
+
+    def __init__(self):
+        self.calls = Counter()
+        self.time_ns = Counter()
+        self.sync_calls = 0
+        self.sync_skipped = 0
+        self.errors = Counter()
+        self.sentences = 0
+
+    def record_result(self, result) -> None:
+        """Cuenta una entrada analizada y los tipos de sus diagnósticos."""
+        self.sentences += 1
+        self.errors.update(d.kind for d in result.diagnostics)
+
+    def merge(self, other: "ParserProfile") -> None:
+        """Suma los contadores de otro perfil (p. ej. de un proceso del pool)."""
+        self.calls.update(other.calls)
+        self.time_ns.update(other.time_ns)
+        self.sync_calls += other.sync_calls
+        self.sync_skipped += other.sync_skipped
+        self.errors.update(other.errors)
+        self.sentences += other.sentences
+
+    def to_dict(self) -> Dict:
+        return {
+            "sentences": self.sentences,
+            "rules": {
+                rule: {"calls": self.calls[rule], "time_ms": self.time_ns[rule] / 1e6}
+                for rule in self.calls
+            },
+            "sync": {"calls": self.sync_calls, "skipped_tokens": self.sync_skipped},
+            "errors": dict(self.errors),
+        }
+
+    def summary(self) -> str:
+        lines = [f"Profile: {self.sentences} inputs",
+                 f"  {'rule':<10} {'calls':>10} {'total ms':>10} {'avg us':>8}"]
+        for rule, calls in self.calls.most_common():
+            total = self.time_ns[rule]
+            lines.append(f"  {rule:<10} {calls:>10} {total / 1e6:>10.2f} {total / calls / 1e3:>8.2f}")
+        lines.append(f"  synchronize_panic: {self.sync_calls} calls, "
+                     f"{self.sync_skipped} tokens skipped")
+        for kind, count in self.errors.most_common():
+            lines.append(f"  error {kind}: {count}")
+        return "\n".join(lines)
+
+def _timed(name, method):
+    def wrapper(self, *args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.profile.calls[name] += 1
+            self.profile.time_ns[name] += perf_counter_ns() - start
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+@lru_cache(maxsize=None)
+def profiled_class(base):
+    """
+    Subclase de 'base' con las reglas de RULES instrumentadas. Se construye
+    con (tokens, profile) y acumula sus contadores en 'profile'. Los parsers
+    que no llaman a sus reglas (profilable = False) no se pueden perfilar:
+    el informe saldría vacío.
+    """
+    if not getattr(base, "profilable", True):
+        raise ValueError(f"{base.__name__} inlines its rules and cannot be profiled; "
+                         "use the 'rd' engine instead.")
+    def __init__(self, tokens, profile: ParserProfile):
+        base.__init__(self, tokens)
+        self.profile = profile
+
+    def synchronize_panic(self):
+        start = self.i
+        base.synchronize_panic(self)
+        # Tokens descartados, sin contar la coma consumida
+        skipped = self.i - start
+        if self.i > start and self.cats[self.i - 1] == Cat.COMMA:
+            skipped -= 1
+        self.profile.sync_calls += 1
+        self.profile.sync_skipped += skipped
+
+    namespace = {"__init__": __init__, "synchronize_panic": synchronize_panic}
+    for rule in RULES:
+        if hasattr(base, rule):
+            namespace[rule] = _timed(rule, getattr(base, rule))
+    return type(f"Profiled{base.__name__}", (base,), namespace)
@@ -0,0 +1,143 @@
+# src/en_server.py
+# Servidor residente de análisis: evita el arranque del intérprete y la
+# construcción del léxico en cada petición.
+#
+# Protocolo (JSON delimitado por saltos de línea, una petición por línea):
+#   -> {"id": 1, "sentence": "the boy eats", "engine": "rd", "ok_only": false}
+#   <- {"id": 1, "ok": true, "diagnostics": [], "messages": ["Parsing successful."]}
+# "engine" y "ok_only" son opcionales. Una petición inválida recibe
+#   <- {"id": 1, "error": "Invalid request: ..."}
+# con su id (null si la línea no es un objeto JSON). Un cliente puede enviar
+# muchas peticiones sin esperar respuesta (pipelining); las respuestas de
+# cada conexión se devuelven en el orden de las peticiones.
+#
+#   python -m src.en_server --port 8765 [--workers N] [--concurrency K]
+#   python -m src.en_server --unix /tmp/en_parser.sock
+import argparse
+import asyncio
+import json
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+from src.en_cache import ResultCache
+from src.en_parser import ENGINES, analyze_en_sentence
+
+# Respuestas pendientes por conexión antes de dejar de leer peticiones
+MAX_PIPELINE = 1024
+
+def _analyze(sentence: str, engine: str, ok_only: bool) -> dict:
+    """Analiza una oración y devuelve el cuerpo JSON de la respuesta."""
+    result = analyze_en_sentence(sentence, engine, ok_only=ok_only)
+    body = result.to_dict()
+    body["messages"] = list(result.messages)
+    return body
+
+class ParseServer:
+    """
+    Servidor asyncio. Con workers > 0 el análisis (CPU) se delega a un pool
+    de procesos; con workers = 0 se ejecuta en el propio bucle de eventos, lo
+    que para oraciones cortas suele tener menos latencia. 'concurrency' limita
+    los análisis en curso entre todas las conexiones.
+    """
+
+    def __init__(self, workers: int = 0, concurrency: int = 64, cache_size: int = 0):
+        self.pool = ProcessPoolExecutor(workers) if workers > 0 else None
+        self.limit = asyncio.Semaphore(concurrency)
+        self.cache = ResultCache(cache_size) if cache_size > 0 else None
+
+    async def handle_request(self, line: bytes) -> dict:
+        req = None
+        try:
+            req = json.loads(line)
+            sentence = req["sentence"]
+            engine = req.get("engine", "rd")
+            ok_only = req.get("ok_only", False)
+            if not isinstance(sentence, str) or engine not in ENGINES or not isinstance(ok_only, bool):
+                raise ValueError
+        except (ValueError, KeyError, TypeError, AttributeError):
+            # El cliente necesita el id para emparejar también las respuestas de error
+            rid = req.get("id") if isinstance(req, dict) else None
+            return {"id": rid, "error": "Invalid request: expected {\"sentence\": str, "
+                                        "\"engine\": str, \"ok_only\": bool}."}
+
+        rid = req.get("id")
+        async with self.limit:
+            # La clave es (motor, oración normalizada): ambig y rd pueden discrepar
+            if self.cache is not None and not ok_only:
+                cached = self.cache.get(sentence, engine)
+                if cached is not None:
+                    return {"id": rid, **cached}
+            if self.pool is None:
+                body = _analyze(sentence, engine, ok_only)
+            else:
+                loop = asyncio.get_running_loop()
+                body = await loop.run_in_executor(self.pool, _analyze, sentence, engine, ok_only)
+        if self.cache is not None and not ok_only:
+            self.cache.put(sentence, body, engine)
+        return {"id": rid, **body}
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        # Cola de respuestas en orden de llegada; None marca el fin de la conexión
+        pending: asyncio.Queue = asyncio.Queue(MAX_PIPELINE)
+
+        async def write_responses():
+            while True:
+                task = await pending.get()
+                if task is None:
+                    break
+                writer.write(json.dumps(await task).encode("utf-8") + b"\n")
+                if pending.empty():
+                    await writer.drain()
+
+        sender = asyncio.create_task(write_responses())
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if line.strip():
+                    await pending.put(asyncio.create_task(self.handle_request(line)))
+        finally:
+            await pending.put(None)
+            await sender
+            writer.close()
+            await writer.wait_closed()
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+
+async def serve(host: str = "127.0.0.1", port: int = 8765, unix: Optional[str] = None,
+                workers: int = 0, concurrency: int = 64, cache_size: int = 0):
+    app = ParseServer(workers, concurrency, cache_size)
+    if unix:
+        server = await asyncio.start_unix_server(app.handle_connection, path=unix, limit=1 << 20)
+    else:
+        server = await asyncio.start_server(app.handle_connection, host, port, limit=1 << 20)
+    addrs = ", ".join(str(s.getsockname()) for s in server.sockets)
+    print(f"Escuchando en {addrs}", flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        app.close()
+
+def main():
+    ap = argparse.ArgumentParser(prog="python -m src.en_server")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--unix", metavar="RUTA", help="Escuchar en un socket Unix en lugar de TCP")
+    ap.add_argument("--workers", type=int, default=0,
+                    help="Procesos para el análisis (0 = en el bucle de eventos)")
+    ap.add_argument("--concurrency", type=int, default=64,
+                    help="Análisis simultáneos como máximo")
+    ap.add_argument("--cache-size", type=int, default=0,
+                    help="Entradas de la caché LRU de respuestas (0 = sin caché)")
+    args = ap.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.workers,
+                          args.concurrency, args.cache_size))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
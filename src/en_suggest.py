@@ -0,0 +1,115 @@
+# src/en_suggest.py
+# Sugerencias "did you mean" para palabras desconocidas.
+#
+# Índice de vecindario por borrado (estilo SymSpell): cada palabra del léxico
+# se registra bajo todas las cadenas que se obtienen borrándole hasta
+# max_distance caracteres. Dos palabras a distancia de edición <= d comparten
+# alguna de esas cadenas, así que para sugerir basta con generar los borrados
+# de la palabra buscada, reunir las candidatas de sus cubetas y verificar su
+# distancia real: el coste depende de la longitud de la palabra, no del
+# tamaño del léxico.
+from functools import lru_cache
+from src import en_lexicon
+
+# Distancia máxima por defecto (borrados indexados por palabra)
+MAX_DISTANCE = 2
+# A partir de este número de palabras el índice solo guarda los borrados de
+# un carácter: con dos, el número de cubetas crece con el cuadrado de la
+# longitud de cada palabra.
+LARGE_LEXICON = 50000
+# Sugerencias memorizadas (LRU): el servidor y los corpus con muchas erratas
+# ven un número ilimitado de palabras desconocidas distintas.
+SUGGEST_CACHE_SIZE = 16384
+
+def deletions(word: str, depth: int) -> set[str]:
+    """La palabra y todas las cadenas que resultan de borrarle hasta 'depth' caracteres."""
+    out = {word}
+    frontier = {word}
+    for _ in range(depth):
+        frontier = {w[:k] + w[k + 1:] for w in frontier for k in range(len(w))}
+        out |= frontier
+    return out
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Distancia de Damerau-Levenshtein (alineamiento óptimo: inserción, borrado,
+    sustitución y transposición de adyacentes). Devuelve limit + 1 en cuanto
+    se sabe que la distancia supera 'limit'.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev2 = None
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            d = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if (prev2 is not None and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                d = min(d, prev2[j - 2] + 1)
+            cur[j] = d
+        if min(cur) > limit:
+            return limit + 1
+        prev2, prev = prev, cur
+    return prev[-1]
+
+def max_distance_for(word: str, max_distance: int = MAX_DISTANCE) -> int:
+    """
+    Distancia admitida para una palabra: con palabras cortas casi cualquier
+    cosa está a distancia 1 o 2, así que se limita a la mitad de su longitud.
+    """
+    return min(max_distance, (len(word) - 1) // 2)
+
+class SuggestionIndex:
+    """Índice de borrados sobre un conjunto de palabras (ver la cabecera del módulo)."""
+
+    def __init__(self, words, max_distance: int = MAX_DISTANCE):
+        self.max_distance = max_distance
+        self.buckets = {}
+        for word in words:
+            for key in deletions(word, max_distance):
+                self.buckets.setdefault(key, []).append(word)
+
+    def candidates(self, word: str, limit: int) -> list[tuple[int, str]]:
+        """(distancia, palabra) de las palabras a distancia <= limit, de mejor a peor."""
+        limit = min(limit, self.max_distance)
+        seen = set()
+        found = []
+        for key in deletions(word, limit):
+            for cand in self.buckets.get(key, ()):
+                if cand not in seen:
+                    seen.add(cand)
+                    d = edit_distance(word, cand, limit)
+                    if d <= limit:
+                        found.append((d, abs(len(cand) - len(word)), cand))
+        found.sort()
+        return [(d, cand) for d, _, cand in found]
+
+    def suggest(self, word: str) -> str | None:
+        """Palabra más cercana (o None) según max_distance_for."""
+        if not any(c.isalpha() for c in word):
+            return None
+        found = self.candidates(word, max_distance_for(word, self.max_distance))
+        return found[0][1] if found else None
+
+_index = None    # (léxico, SuggestionIndex)
+
+def suggestion_index() -> SuggestionIndex:
+    """Índice del léxico activo; se construye en la primera consulta."""
+    global _index
+    lexicon = en_lexicon.LEXICON
+    if _index is None or _index[0] is not lexicon:
+        max_distance = MAX_DISTANCE if len(lexicon) <= LARGE_LEXICON else 1
+        _index = (lexicon, SuggestionIndex((w for w in lexicon if w.isalpha()), max_distance))
+        _suggest.cache_clear()
+    return _index[1]
+
+@lru_cache(maxsize=SUGGEST_CACHE_SIZE)
+def _suggest(word: str) -> str | None:
+    return _index[1].suggest(word)
+
+def suggest(word: str) -> str | None:
+    """Sugerencia para una palabra desconocida del léxico activo, o None."""
+    suggestion_index()  # Vacía la caché si cambió el léxico
+    return _suggest(word)
@@ -1,37 +1,240 @@
 # src/run_en.py
+# Las importaciones que solo usan algunas opciones (argparse, json, las
+# cachés, la instrumentación) se hacen dentro de las funciones: el modo
+# oración simple es el que más se invoca desde scripts y su coste está
+# dominado por el arranque.
+import os
 import sys
-from src.en_parser import analyze_en_sentence
+from src.en_parser import ENGINES, SPLIT_TOKENS, analyze_en_sentence, analyze_stream
 
-def main():
-    if len(sys.argv) < 2:
-        print("Uso: python -m src.run_en \"frase\"")
-        print("     python -m src.run_en -f archivo.txt")
+USAGE = (
+    "Uso: python -m src.run_en \"frase\"\n"
+    "     python -m src.run_en -f archivo.txt [-j N] [--chunksize K] [--engine rd|ll1|ambig|compiled]\n"
+    "                                          [--cache-size N | --disk-cache ARCHIVO]\n"
+    "                                          [--profile [JSON]] [--lexicon ARCHIVO]\n"
+    "                                          [--split-commas [TOKENS]] [--no-precheck]\n"
+    "                                          [--format text|jsonl|csv] [--summary]\n"
+    "     python -m src.run_en -f - < archivo.txt\n"
+    "     python -m src.run_en --startup-bench [N]"
+)
+
+# Oración usada por --startup-bench
+STARTUP_SENTENCE = "the big dogs in the city eat food"
+
+
+# Número de líneas de salida acumuladas antes de escribirlas en bloque
+OUTPUT_BLOCK = 1024
+
+def format_result(sent, result) -> str:
+    """Formatea el resultado de una línea del modo archivo."""
+    status = "OK" if result.ok else "ERROR"
+    out = f"[{status}] {sent}\n"
+    if not result.ok:
+        out += "".join(f"   -> {msg}\n" for msg in result.messages)
+    return out
+
+# Formatos de salida del modo archivo (--format)
+FORMATS = ("text", "jsonl", "csv")
+# Columnas de --format csv: una fila por diagnóstico, o una sola si la línea es válida
+CSV_FIELDS = ("line", "ok", "kind", "pos", "word", "message")
+
+def result_record(lineno, sent, result) -> dict:
+    """Registro de una línea para --format jsonl (mismos campos que src.en_server)."""
+    record = {"line": lineno, "sentence": sent}
+    record.update(result.to_dict())
+    record["messages"] = list(result.messages)
+    return record
+
+def csv_rows(stream):
+    """Filas de --format csv (ver CSV_FIELDS) de un flujo de analyze_stream."""
+    for lineno, _, result in stream:
+        if result.ok:
+            yield (lineno, 1, "", "", "", "")
+            continue
+        for d in result.diagnostics:
+            yield (lineno, 0, d.kind, "" if d.pos is None else d.pos,
+                   "" if d.word is None else d.word, d.message)
+
+def write_results(stream, out=None, fmt="text"):
+    """Consume un flujo de analyze_stream y escribe la salida en bloques."""
+    out = out or sys.stdout
+    if fmt == "csv":
+        import csv
+        writer = csv.writer(out, lineterminator="\n")
+        writer.writerow(CSV_FIELDS)
+        writer.writerows(csv_rows(stream))
         return
+    if fmt == "jsonl":
+        import json
+        encode = json.JSONEncoder(ensure_ascii=False).encode
+        format_line = lambda lineno, sent, result: encode(result_record(lineno, sent, result)) + "\n"
+    else:
+        format_line = lambda lineno, sent, result: format_result(sent, result)
+    block = []
+    for lineno, sent, result in stream:
+        block.append(format_line(lineno, sent, result))
+        if len(block) >= OUTPUT_BLOCK:
+            out.write("".join(block))
+            block.clear()
+    out.write("".join(block))
 
-    # MODO ARCHIVO
-    if sys.argv[1] == "-f" and len(sys.argv) == 3:
-        path = sys.argv[2]
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                for line in f:
-                    sent = line.strip()
-                    if not sent: continue
-                    
-                    result = analyze_en_sentence(sent)
-                    status = "OK" if result.ok else "ERROR"
-                    print(f"[{status}] {sent}")
-                    
-                    if not result.ok:
-                        for msg in result.messages:
-                            print(f"   -> {msg}")
-        except FileNotFoundError:
-            print("Archivo no encontrado")
+def summarize(stream) -> dict:
+    """
+    Consume un flujo de analyze_stream sin escribir nada por línea y devuelve
+    los totales: líneas válidas y con errores, diagnósticos por tipo (de más
+    a menos frecuente), palabras, tiempo total y rendimiento.
+    """
+    import time
+    from collections import Counter
+
+    start = time.perf_counter()
+    lines = ok = words = 0
+    kinds = Counter()
+    for _, sent, result in stream:
+        lines += 1
+        words += len(sent.split())
+        if result.ok:
+            ok += 1
+        else:
+            kinds.update(d.kind for d in result.diagnostics)
+    elapsed = time.perf_counter() - start
+    return {
+        "lines": lines,
+        "ok": ok,
+        "errors": lines - ok,
+        "diagnostics": sum(kinds.values()),
+        "by_kind": dict(sorted(kinds.items(), key=lambda kv: (-kv[1], kv[0]))),
+        "words": words,
+        "seconds": round(elapsed, 6),
+        "lines_per_second": round(lines / elapsed, 1) if elapsed else 0.0,
+        "words_per_second": round(words / elapsed, 1) if elapsed else 0.0,
+    }
+
+def write_summary(summary: dict, out=None, fmt="text"):
+    """Escribe el resumen de summarize() en el formato pedido."""
+    out = out or sys.stdout
+    if fmt == "jsonl":
+        import json
+        out.write(json.dumps(summary) + "\n")
+        return
+    if fmt == "csv":
+        import csv
+        writer = csv.writer(out, lineterminator="\n")
+        writer.writerow(("metric", "value"))
+        writer.writerows((k, v) for k, v in summary.items() if k != "by_kind")
+        writer.writerows((f"kind:{k}", n) for k, n in summary["by_kind"].items())
         return
+    out.write(f"Líneas: {summary['lines']} (OK: {summary['ok']}, con errores: {summary['errors']})\n"
+              f"Diagnósticos: {summary['diagnostics']}\n")
+    for kind, n in summary["by_kind"].items():
+        out.write(f"  {kind:<26} {n:>10}\n")
+    out.write(f"Tiempo: {summary['seconds']:.3f} s ({summary['lines_per_second']:,.0f} líneas/s, "
+              f"{summary['words_per_second']:,.0f} palabras/s)\n")
 
-    # MODO ORACIÓN SIMPLE
-    sentence = sys.argv[1]
-    result = analyze_en_sentence(sentence)
+def run_file(path, workers=1, chunksize=256, engine="rd", cache=None, out=None, profile=None,
+             split_tokens=0, precheck=True, fmt="text", summary=False):
+    """
+    Valida un archivo ('-' para stdin) línea por línea. Con summary=True no
+    se escribe nada por línea, solo el resumen (ver summarize).
+    """
+    def consume(f):
+        stream = analyze_stream(f, workers, chunksize, engine, cache, profile, split_tokens,
+                                precheck)
+        if summary:
+            write_summary(summarize(stream), out, fmt)
+        else:
+            write_results(stream, out, fmt)
+
+    if path == "-":
+        consume(sys.stdin)
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        consume(f)
+
+def report_profile(profile, json_path=None):
+    """Escribe el resumen del perfil en stderr y, si se pide, el detalle en JSON."""
+    print(profile.summary(), file=sys.stderr)
+    if json_path:
+        import json
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(profile.to_dict(), f, indent=2)
+
+def startup_bench(runs: int = 20):
+    """
+    Mide el arranque en frío: lanza 'runs' veces el modo oración simple en un
+    proceso nuevo y compara con un intérprete vacío. Informa el mínimo y la
+    mediana en milisegundos.
+    """
+    import statistics
+    import subprocess
+    import time
 
+    def timings(cmd):
+        samples = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, check=True)
+            samples.append((time.perf_counter() - start) * 1000)
+        return min(samples), statistics.median(samples)
+
+    python = timings([sys.executable, "-c", "pass"])
+    run_en = timings([sys.executable, "-m", "src.run_en", STARTUP_SENTENCE])
+    print(f"Arranque en frío ({runs} ejecuciones)        mín ms  mediana ms")
+    print(f"  python -c pass                      {python[0]:>8.1f}  {python[1]:>10.1f}")
+    print(f"  python -m src.run_en \"...\"          {run_en[0]:>8.1f}  {run_en[1]:>10.1f}")
+    print(f"  coste propio de run_en              {run_en[0] - python[0]:>8.1f}  "
+          f"{run_en[1] - python[1]:>10.1f}")
+
+def positive_int(text: str) -> int:
+    """Tipo de argparse para enteros >= 1."""
+    import argparse
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value}")
+    return value
+
+def build_arg_parser():
+    import argparse
+    ap = argparse.ArgumentParser(prog="python -m src.run_en", usage=USAGE)
+    ap.add_argument("sentence", nargs="?", help="Oración a analizar")
+    ap.add_argument("-f", dest="path", help="Archivo con una oración por línea ('-' para stdin)")
+    ap.add_argument("-j", "--workers", type=int, default=1,
+                    help="Procesos para el modo archivo (por defecto 1)")
+    ap.add_argument("--chunksize", type=positive_int, default=256,
+                    help="Oraciones por bloque enviado a cada proceso")
+    ap.add_argument("--engine", choices=ENGINES, default="rd",
+                    help="Motor de análisis: descenso recursivo (rd), tabla LL(1) (ll1), "
+                         "descenso recursivo con palabras ambiguas (ambig) o descenso "
+                         "recursivo compilado a un módulo especializado (compiled)")
+    caching = ap.add_mutually_exclusive_group()
+    caching.add_argument("--cache-size", type=int, default=0,
+                         help="Entradas de la caché LRU de resultados (0 = sin caché)")
+    caching.add_argument("--disk-cache", metavar="ARCHIVO",
+                         help="Caché sqlite persistente para revalidación incremental")
+    ap.add_argument("--profile", nargs="?", const="", metavar="JSON",
+                    help="Instrumentar el parser: resumen por regla en stderr "
+                         "y, opcionalmente, el detalle en un archivo JSON")
+    ap.add_argument("--lexicon", metavar="ARCHIVO",
+                    help="Léxico de texto a usar en lugar de src/data/en.lex "
+                         "(también con la variable de entorno EN_LEXICON)")
+    ap.add_argument("--split-commas", nargs="?", type=int, const=SPLIT_TOKENS, default=0, metavar="TOKENS",
+                    help="Repartir entre los procesos de -j los trozos (de unos TOKENS "
+                         "tokens, cortados en comas) de cada línea en lugar de las líneas; "
+                         "útil para documentos de una sola línea muy larga (no admite --profile)")
+    ap.add_argument("--no-precheck", dest="precheck", action="store_false",
+                    help="No usar el prefiltro vectorizado con NumPy (src/en_precheck.py) "
+                         "en el modo archivo")
+    ap.add_argument("--format", choices=FORMATS, default="text",
+                    help="Salida del modo archivo: texto, un objeto JSON por línea (jsonl) "
+                         "o CSV con una fila por diagnóstico")
+    ap.add_argument("--summary", action="store_true",
+                    help="En el modo archivo, escribir solo los totales por tipo de error, "
+                         "el tiempo y el rendimiento (en el formato de --format)")
+    ap.add_argument("--startup-bench", nargs="?", type=int, const=20, metavar="N",
+                    help="Medir el arranque en frío de run_en con N ejecuciones")
+    return ap
+
+def print_result(result):
     if result.ok:
         print("✔ Parsing successful.")
     else:
@@ -39,5 +242,68 @@ def main():
         for i, msg in enumerate(result.messages, 1):
             print(f"  {i}. {msg}")
 
+def main():
+    if len(sys.argv) < 2:
+        print(USAGE)
+        return
+
+    # Camino rápido: una oración sin opciones no necesita argparse
+    if len(sys.argv) == 2 and not sys.argv[1].startswith("-"):
+        print_result(analyze_en_sentence(sys.argv[1]))
+        return
+
+    ap = build_arg_parser()
+    args = ap.parse_args()
+    if args.profile is not None and args.split_commas:
+        # Los trozos de --split-commas se analizan sin instrumentar
+        ap.error("--profile cannot be combined with --split-commas.")
+    if args.profile is not None and args.engine == "compiled":
+        # El motor compilado inlina las reglas: no hay llamadas que medir
+        ap.error("--profile is not supported with --engine compiled; use --engine rd.")
+    if args.startup_bench is not None:
+        startup_bench(args.startup_bench)
+        return
+    if args.lexicon:
+        from src.en_lexicon import use_lexicon
+        use_lexicon(args.lexicon)
+        os.environ["EN_LEXICON"] = args.lexicon  # Para los procesos del pool
+    profile = None
+    if args.profile is not None:
+        from src.en_profile import ParserProfile
+        profile = ParserProfile()
+
+    # MODO ARCHIVO
+    if args.path is not None:
+        from src.en_cache import DiskResultCache, ResultCache
+        cache = None
+        if args.disk_cache:
+            cache = DiskResultCache(args.disk_cache)
+        elif args.cache_size > 0:
+            cache = ResultCache(args.cache_size)
+        try:
+            run_file(args.path, workers=args.workers, chunksize=args.chunksize,
+                     engine=args.engine, cache=cache, profile=profile,
+                     split_tokens=args.split_commas, precheck=args.precheck,
+                     fmt=args.format, summary=args.summary)
+        except FileNotFoundError:
+            print("Archivo no encontrado")
+        finally:
+            if cache is not None:
+                print(f"Cache: {cache.stats()}", file=sys.stderr)
+                if isinstance(cache, DiskResultCache):
+                    cache.close()
+        if profile is not None:
+            report_profile(profile, args.profile)
+        return
+
+    if args.sentence is None:
+        print(USAGE)
+        return
+
+    # MODO ORACIÓN SIMPLE
+    print_result(analyze_en_sentence(args.sentence, args.engine, profile=profile))
+    if profile is not None:
+        report_profile(profile, args.profile)
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
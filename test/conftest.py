@@ -0,0 +1,6 @@
+# test/conftest.py
+# Las pruebas importan src y bench como paquetes desde la raíz del repositorio.
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
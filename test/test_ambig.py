@@ -0,0 +1,18 @@
+# test/test_ambig.py
+# AmbiguousEnParser con columnas construidas desde tokens o desde el texto.
+import pytest
+from bench.corpus import KINDS, generate
+from src.en_ambig import AmbiguousEnParser
+from src.en_lexicon import TokenColumns, tokenize_columns, tokenize_sentence
+
+@pytest.mark.parametrize("sentence", ["you bring work", "he brings work , they work"])
+def test_parser_accepts_token_lists(sentence):
+    # "work" tiene lectura de nombre (objeto) y de verbo (tras "they")
+    expected = AmbiguousEnParser(tokenize_columns(sentence)).parse_panic_mode()
+    assert expected.ok
+    assert AmbiguousEnParser(tokenize_sentence(sentence)).parse_panic_mode() == expected
+
+def test_from_tokens_keeps_alternative_readings():
+    for line in generate(200, list(KINDS), 1):
+        tokens = tokenize_sentence(line, strict=False)
+        assert TokenColumns.from_tokens(tokens).alts == tokenize_columns(line, strict=False).alts
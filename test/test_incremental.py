@@ -0,0 +1,55 @@
+# test/test_incremental.py
+# IncrementalDocument frente al análisis completo del texto tras cada edición.
+import random
+import pytest
+from bench.corpus import generate
+from src import en_incremental
+from src.en_cache import DiskResultCache
+from src.en_incremental import IncrementalDocument
+from src.en_parser import analyze_en_sentence
+
+FRAGMENTS = ["", ",", ",,", " ", "s", "the ", "runs", " dog", "xyz", ".", "!", ", he runs", "He", "work"]
+
+def random_edits(engine: str, seed: int, trials: int, max_lines: int, edits: int):
+    """Ediciones aleatorias; tras cada una, el resultado debe ser el del texto completo."""
+    rng = random.Random(seed)
+    lines = list(generate(200, ["mixed"], seed))
+    for _ in range(trials):
+        text = " , ".join(rng.sample(lines, rng.randint(0, max_lines)))
+        doc = IncrementalDocument(text, engine)
+        assert doc.result() == analyze_en_sentence(text, engine)
+        for _ in range(edits):
+            start = rng.randint(0, len(text))
+            end = min(len(text), start + rng.choice([0, 0, 1, 2, 5, 20]))
+            new = rng.choice(FRAGMENTS + [rng.choice(lines)])
+            text = text[:start] + new + text[end:]
+            result = doc.edit(start, end, new)
+            assert doc.text == text
+            assert len(doc) == len(text)
+            assert result == analyze_en_sentence(text, engine), text
+
+@pytest.mark.parametrize("engine", ["rd", "ll1", "ambig"])
+def test_random_edits(engine):
+    random_edits(engine, seed=3, trials=20, max_lines=6, edits=30)
+
+def test_random_edits_small_blocks(monkeypatch):
+    # Bloques de 2 segmentos: las ediciones parten y unen bloques continuamente
+    monkeypatch.setattr(en_incremental, "BLOCK_SIZE", 2)
+    random_edits("rd", seed=5, trials=20, max_lines=30, edits=30)
+
+def test_result_is_a_snapshot():
+    text = ", ".join(["book eats"] * 200)
+    doc = IncrementalDocument(text)
+    result = doc.result()
+    doc.insert(0, "a ")
+    doc.insert(5, ", x")
+    assert result == analyze_en_sentence(text)
+    assert hash(result) == hash(analyze_en_sentence(text))
+
+def test_diagnostics_is_a_tuple(tmp_path):
+    result = IncrementalDocument("book eats , boys run").result()
+    assert isinstance(result.diagnostics, tuple)
+    # Los consumidores que serializan resultados esperan una tupla
+    with DiskResultCache(str(tmp_path / "cache.db")) as cache:
+        cache.put("book eats , boys run", result)
+        assert cache.get("book eats , boys run") == result
@@ -0,0 +1,44 @@
+# test/test_parallel.py
+# parse_parallel y analyze_document frente al análisis en serie.
+import os
+from multiprocessing import Pool
+import pytest
+from bench.corpus import generate
+from src.en_lexicon import tokenize_columns
+from src.en_parser import analyze_document, analyze_en_sentence, get_parser_class, parse_parallel
+
+EDGE = ["", ",", ",,", ", he runs", "he runs ,", "he runs , ,", "he runs he , she run",
+        "he runs ,, she runs", "he", "he runs the", ", , he runs , the boys runs , , ,",
+        "work helps , students work ,", "book eats , xyz runs , boys run"]
+
+def read_lines(name: str) -> list[str]:
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+@pytest.fixture(scope="module")
+def pool():
+    with Pool(2) as pool:
+        yield pool
+
+@pytest.fixture(scope="module")
+def documents():
+    big = " , ".join(generate(500, ["mixed"], 9))
+    return (EDGE + read_lines("valid.txt") + read_lines("invalid.txt")
+            + list(generate(200, ["mixed"], 5)) + [big, big + " ,", ", " + big])
+
+@pytest.mark.parametrize("engine", ["rd", "ambig"])
+@pytest.mark.parametrize("ok_only", [False, True])
+def test_parse_parallel(pool, documents, engine, ok_only):
+    for text in documents:
+        cols = tokenize_columns(text, strict=False)
+        serial = get_parser_class(engine)(cols).parse_panic_mode(ok_only)
+        for chunk in (1, 3, 50):
+            result = parse_parallel(cols, engine=engine, ok_only=ok_only, chunk_tokens=chunk, pool=pool)
+            assert result == serial, (text[:80], chunk)
+
+def test_analyze_document(documents):
+    # Sin pool: analyze_document crea y cierra sus procesos
+    text = " , ".join([documents[-3]] + EDGE)
+    assert analyze_document(text, workers=2, chunk_tokens=7) == analyze_en_sentence(text)
+    assert analyze_document(text, workers=1) == analyze_en_sentence(text)
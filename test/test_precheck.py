@@ -0,0 +1,38 @@
+# test/test_precheck.py
+# analyze_batch (autómata vectorizado) frente a analyze_en_sentence.
+import random
+import pytest
+from bench.compiled import shapes
+from bench.corpus import KINDS, generate
+from src import en_lexicon
+from src.en_parser import analyze_en_sentence
+from src.en_precheck import HAVE_NUMPY, PRECHECK_ENGINES, analyze_batch
+
+def soups(n: int, seed: int) -> list[str]:
+    """Líneas de 1 a 30 palabras del léxico al azar, con comas y signos."""
+    rng = random.Random(seed)
+    words = sorted(en_lexicon.LEXICON) + [",", ",", "xyz", "runs.", "He"]
+    return [" ".join(rng.choice(words) for _ in range(rng.randint(1, 30))) for _ in range(n)]
+
+def differential(sentences: list[str], engine: str = "rd"):
+    for sentence, result in zip(sentences, analyze_batch(sentences, engine), strict=True):
+        assert result == analyze_en_sentence(sentence, engine), sentence
+
+@pytest.mark.skipif(not HAVE_NUMPY, reason="analyze_batch sin numpy es analyze_en_sentence")
+def test_short_sequences():
+    # Todas las secuencias de hasta 4 palabras con una palabra por (cat, num) y comas
+    differential([""] + shapes(4))
+
+@pytest.mark.skipif(not HAVE_NUMPY, reason="analyze_batch sin numpy es analyze_en_sentence")
+@pytest.mark.parametrize("kind", sorted(KINDS))
+def test_corpus(kind):
+    differential(list(generate(2000, [kind], 2)))
+
+@pytest.mark.skipif(not HAVE_NUMPY, reason="analyze_batch sin numpy es analyze_en_sentence")
+@pytest.mark.parametrize("engine", PRECHECK_ENGINES)
+def test_random_lines(engine):
+    differential(soups(5000, 1) + ["the dog . runs", "He Runs", "xyz runs", "  "], engine)
+
+def test_other_engines_fall_back():
+    sentences = ["you bring work", "book eats , boys run"]
+    assert analyze_batch(sentences, "ambig") == [analyze_en_sentence(s, "ambig") for s in sentences]
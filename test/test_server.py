@@ -0,0 +1,33 @@
+# test/test_server.py
+# Respuestas de ParseServer.handle_request, sin abrir sockets.
+import asyncio
+import json
+import pytest
+from src.en_parser import analyze_en_sentence
+from src.en_server import ParseServer
+
+def handle(request) -> dict:
+    async def run():
+        return await ParseServer(cache_size=16).handle_request(json.dumps(request).encode("utf-8"))
+    return asyncio.run(run())
+
+def test_valid_request():
+    resp = handle({"id": 7, "sentence": "book eats", "engine": "ll1", "ok_only": True})
+    assert resp["id"] == 7
+    assert resp["ok"] == analyze_en_sentence("book eats", "ll1").ok
+
+@pytest.mark.parametrize("request_", [
+    {"id": 3},
+    {"id": 3, "sentence": 5},
+    {"id": 3, "sentence": "boys run", "engine": "lr"},
+    {"id": 3, "sentence": "boys run", "ok_only": "false"},
+    {"id": 3, "sentence": "boys run", "ok_only": 1},
+])
+def test_invalid_request_keeps_id(request_):
+    resp = handle(request_)
+    assert resp["id"] == 3
+    assert "error" in resp
+
+@pytest.mark.parametrize("request_", [[1, 2], "boys run", None])
+def test_invalid_json_object(request_):
+    assert handle(request_)["id"] is None